@@ -7,7 +7,6 @@ installed components.
 """
 
 import os
-import platform
 import site
 import subprocess
 import sys
@@ -120,8 +119,12 @@ def _preload_cuda_libraries() -> None:
 
 
 def _patch_subprocess_for_windows() -> None:
-    """Patch subprocess.Popen to hide console windows on Windows."""
-    if platform.system() != "Windows":
+    """Patch subprocess.Popen to hide console windows on Windows.
+
+    The patch is process-wide on purpose: ffmpeg is spawned by pydub and
+    other libraries, not by call sites this app owns.
+    """
+    if sys.platform != "win32":
         return
 
     original_popen = subprocess.Popen
@@ -130,10 +133,9 @@ def _patch_subprocess_for_windows() -> None:
         """Popen wrapper that adds CREATE_NO_WINDOW on Windows."""
 
         def __init__(self, *args, **kwargs):
-            if "creationflags" not in kwargs:
-                kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
-            elif not (kwargs["creationflags"] & subprocess.CREATE_NO_WINDOW):
-                kwargs["creationflags"] |= subprocess.CREATE_NO_WINDOW
+            kwargs["creationflags"] = (
+                kwargs.get("creationflags", 0) | subprocess.CREATE_NO_WINDOW
+            )
             super().__init__(*args, **kwargs)
 
     subprocess.Popen = _NoConsolePopen
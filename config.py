@@ -4,8 +4,8 @@ Configuration constants for the OpenWhisper application.
 import os
 import sys
 from dataclasses import dataclass, field
-from types import SimpleNamespace
-from typing import Dict, List, Tuple
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, List, Mapping, Tuple
 
 from _version import __version__
 
@@ -164,7 +164,8 @@ class AppConfig:
         'API: GPT-4o Mini Transcribe'
     )
 
-    MODEL_VALUE_MAP: Dict[str, str] = None
+    # Read-only: display name -> internal model value, mirrors MODEL_CHOICES.
+    MODEL_VALUE_MAP: Mapping[str, str] = None
 
     # Whisper model choices for faster-whisper
     WHISPER_MODEL_CHOICES: List[str] = None
@@ -312,12 +313,12 @@ class AppConfig:
                 }
 
         if self.MODEL_VALUE_MAP is None:
-            self.MODEL_VALUE_MAP = {
+            self.MODEL_VALUE_MAP = MappingProxyType({
                 'Local Whisper': 'local_whisper',
                 'API: Whisper': 'api_whisper',
                 'API: GPT-4o Transcribe': 'api_gpt4o',
                 'API: GPT-4o Mini Transcribe': 'api_gpt4o_mini'
-            }
+            })
 
         if self.WHISPER_MODEL_CHOICES is None:
             self.WHISPER_MODEL_CHOICES = [
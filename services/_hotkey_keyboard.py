@@ -1,15 +1,19 @@
 """
 ``keyboard``-based hotkey backend (Windows).
 
-Uses the ``keyboard`` library, which supports per-key suppression so that
-configured hotkeys are swallowed before reaching the focused application. This
-backend is selected on Windows; macOS and Linux use the pynput backend.
+Hotkeys are registered with ``RegisterHotKey`` (see ``services._hotkey_win32``)
+so only the configured combos reach the process. If a combo cannot be
+registered — typically because another application already owns it — the
+backend falls back to a ``keyboard`` library hook, which supports per-key
+suppression so that configured hotkeys are swallowed before reaching the
+focused application. This backend is selected on Windows; macOS and Linux use
+the pynput backend.
 
 This module is imported only by ``services.hotkey_manager`` when the active
 platform selects the keyboard backend; nothing else should import it directly.
 """
-import keyboard
 import logging
+import threading
 from typing import Dict, Callable, Optional, Tuple
 from config import config
 from services._hotkey_common import (
@@ -22,6 +26,16 @@ from services._hotkey_common import (
 logger = logging.getLogger(__name__)
 
 
+def _keyboard():
+    """Import the ``keyboard`` library on first use.
+
+    RegisterHotKey and SendInput cover the normal path, so the library is only
+    loaded when the hook fallback or the ``ctrl+v`` paste fallback needs it.
+    """
+    import keyboard
+    return keyboard
+
+
 # --- Key naming / parsing helpers (shared with the hotkey capture dialog) ----
 
 _MODIFIER_ALIASES: Dict[str, str] = {
@@ -82,8 +96,19 @@ def format_hotkey_display(hotkey_string: str) -> str:
 
 
 def send_paste() -> None:
-    """Simulate a paste keystroke (Ctrl+V) via the keyboard library."""
-    keyboard.send("ctrl+v")
+    """Simulate a paste keystroke (Ctrl+V).
+
+    Prefers a single atomic ``SendInput`` batch and falls back to the
+    keyboard library if that is unavailable or was blocked.
+    """
+    try:
+        from services import _hotkey_win32
+
+        if _hotkey_win32.send_paste_input():
+            return
+    except Exception as exc:
+        logger.warning(f"SendInput paste failed, using keyboard library: {exc}")
+    _keyboard().send("ctrl+v")
 
 
 def is_accessibility_trusted() -> bool:
@@ -128,56 +153,100 @@ class HotkeyManager:
         self.on_status_update_auto_hide: Optional[Callable] = None
         self.is_transcribing_fn: Optional[Callable[[], bool]] = None
 
+        # RegisterHotKey first; the low-level hook only if that fails.
+        self._win32_registrar = None
+        self._hook_installed = False
+
         # Setup keyboard hook
         self._setup_keyboard_hook()
 
     def _setup_keyboard_hook(self):
-        """Setup the global keyboard hook."""
-        keyboard.hook(self._handle_keyboard_event, suppress=True)
+        """Start global hotkey detection (RegisterHotKey, else a keyboard hook)."""
+        if self._setup_win32_hotkeys():
+            return
+        _keyboard().hook(self._handle_keyboard_event, suppress=True)
+        self._hook_installed = True
+        logger.info("Keyboard hook started")
+
+    def _setup_win32_hotkeys(self) -> bool:
+        """Register hotkeys via RegisterHotKey. Returns False to fall back to the hook."""
+        try:
+            from services import _hotkey_win32
+        except Exception as exc:
+            logger.warning(f"Win32 hotkey backend unavailable, using keyboard hook: {exc}")
+            return False
+
+        if not _hotkey_win32.is_available():
+            logger.warning("Win32 hotkey backend not available, using keyboard hook")
+            return False
+
+        if self._win32_registrar is None:
+            self._win32_registrar = _hotkey_win32.Win32HotkeyRegistrar(
+                on_action=self.trigger_action
+            )
+        if not self._win32_registrar.register_hotkeys(self._registered_hotkeys()):
+            logger.warning("Could not register every hotkey, using keyboard hook")
+            return False
+        logger.info("Win32 global hotkeys registered (no keyboard hook)")
+        return True
+
+    def _registered_hotkeys(self) -> Dict[str, str]:
+        """Hotkeys to register with the OS for the current enabled state.
+
+        A registered combo never reaches other applications, so while STT is
+        disabled only the enable/disable hotkey is claimed.
+        """
+        if self.program_enabled:
+            return self.hotkeys
+        return {'enable_disable': self.hotkeys.get('enable_disable')}
 
     def _handle_keyboard_event(self, event):
         """Global keyboard event handler with suppression."""
-        if event.event_type == keyboard.KEY_DOWN:
+        if event.event_type == _keyboard().KEY_DOWN:
             # Check enable/disable hotkey
             if self._matches_hotkey(event, self.hotkeys['enable_disable']):
-                self._toggle_program_enabled()
+                self.trigger_action('enable_disable')
                 return False  # Suppress the key combination
 
             # If program is disabled, only allow enable/disable hotkey
             if not self.program_enabled:
-                if not self._matches_hotkey(event, self.hotkeys['enable_disable']):
-                    return True
-
-            # Check record toggle hotkey
-            elif self._matches_hotkey(event, self.hotkeys['record_toggle']):
-                # Always suppress record toggle key first
-                suppress = False
-                if self._should_trigger_record_toggle():
-                    if self.on_record_toggle:
-                        # Run callback in a separate thread to avoid blocking
-                        import threading
-                        threading.Thread(target=self.on_record_toggle, daemon=True).start()
-                return False  # Always suppress record toggle key
-
-            # Check cancel hotkey
-            elif self._matches_hotkey(event, self.hotkeys['cancel']):
-                if self.on_cancel:
-                    # Run callback in a separate thread to avoid blocking
-                    import threading
-                    threading.Thread(target=self.on_cancel, daemon=True).start()
-                return False  # Suppress cancel key when handling
-
-            # Check minimize-to-tray hotkey
-            elif self._matches_hotkey(event, self.hotkeys.get('minimize_tray')):
-                if self.on_minimize_tray:
-                    # Run callback in a separate thread to avoid blocking
-                    import threading
-                    threading.Thread(target=self.on_minimize_tray, daemon=True).start()
-                return False  # Suppress minimize key when handling
+                return True
+
+            for action in ('record_toggle', 'cancel', 'minimize_tray'):
+                if self._matches_hotkey(event, self.hotkeys.get(action)):
+                    self.trigger_action(action)
+                    return False  # Suppress the hotkey when handling
 
         # Let all other keys pass through
         return True
 
+    def trigger_action(self, action: str) -> None:
+        """Apply enable/debounce gating and invoke the callback for an action.
+
+        Shared dispatch for the RegisterHotKey registrar and the keyboard hook.
+        Callbacks run on a separate thread so neither the Qt main thread (where
+        ``WM_HOTKEY`` arrives) nor the hook thread blocks.
+        """
+        if action == 'enable_disable':
+            # Works even while the program is disabled.
+            self._toggle_program_enabled()
+            return
+
+        if not self.program_enabled:
+            return
+
+        if action == 'record_toggle':
+            callback = self.on_record_toggle if self._should_trigger_record_toggle() else None
+        elif action == 'cancel':
+            callback = self.on_cancel
+        elif action == 'minimize_tray':
+            callback = self.on_minimize_tray
+        else:
+            callback = None
+
+        if callback:
+            threading.Thread(target=callback, daemon=True).start()
+
     def _toggle_program_enabled(self):
         """Toggle the program enabled state."""
         self.program_enabled = not self.program_enabled
@@ -185,6 +254,12 @@ class HotkeyManager:
         # Reset debounce timing when toggling to avoid stale state.
         self._debouncer.reset()
 
+        if self._win32_registrar is not None and not self._hook_installed:
+            if not self._win32_registrar.register_hotkeys(self._registered_hotkeys()):
+                logger.warning("Could not re-register hotkeys, using keyboard hook")
+                _keyboard().hook(self._handle_keyboard_event, suppress=True)
+                self._hook_installed = True
+
         notify_stt_toggle(
             self.program_enabled, self.on_status_update_auto_hide, self.on_status_update
         )
@@ -224,6 +299,7 @@ class HotkeyManager:
             return False
 
         # Check modifiers
+        keyboard = _keyboard()
         for modifier in modifiers:
             if modifier == 'ctrl' and not keyboard.is_pressed('ctrl'):
                 return False
@@ -276,12 +352,15 @@ class HotkeyManager:
         logger.info("Hotkeys updated successfully")
 
     def cleanup(self):
-        """Clean up keyboard hooks."""
+        """Clean up registered hotkeys and keyboard hooks."""
         try:
             # Use a timeout to avoid blocking if cleanup is called from wrong thread
-            import threading
             if threading.current_thread() is threading.main_thread():
-                keyboard.unhook_all()
+                if self._win32_registrar is not None:
+                    self._win32_registrar.unregister_all()
+                if self._hook_installed:
+                    _keyboard().unhook_all()
+                    self._hook_installed = False
             else:
                 # If called from non-main thread, just log a warning
                 logger.warning("Hotkey cleanup called from non-main thread, skipping unhook")
@@ -0,0 +1,370 @@
+"""Win32 ``RegisterHotKey`` global-hotkey backend (Windows only).
+
+The ``keyboard`` library detects hotkeys with a low-level keyboard hook
+(``WH_KEYBOARD_LL``): Windows calls back into Python — and takes the GIL — for
+every keystroke in every application, just so we can look for three or four
+combos. Under load that callback sits in the user's typing path.
+
+``RegisterHotKey`` instead registers the *specific* combinations with the
+window manager. Windows swallows a registered combo (the focused app never sees
+it, matching the hook backend's suppression) and posts ``WM_HOTKEY`` to the
+registering thread; all other keystrokes never reach this process.
+
+The hotkeys are registered without a window, so ``WM_HOTKEY`` arrives as a
+thread message on the Qt main thread's queue. A ``QAbstractNativeEventFilter``
+on the application picks it up there; heavy work must therefore be handed off
+to a thread by the caller (``HotkeyManager.trigger_action`` already does this).
+
+Limitations inherent to ``RegisterHotKey``:
+  * A combo already claimed by another application fails to register. The
+    keyboard backend falls back to its hook in that case.
+  * Registration and unregistration must happen on the Qt main thread.
+
+The module also provides :func:`send_paste_input`, which posts the synthetic
+Ctrl+V as a single ``SendInput`` batch.
+
+This module is imported only by the keyboard ``HotkeyManager`` backend on
+Windows; nothing else should import it directly.
+"""
+import ctypes
+import logging
+import sys
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+from PyQt6.QtCore import QAbstractNativeEventFilter, QCoreApplication
+
+from services._hotkey_keyboard import parse_hotkey
+
+logger = logging.getLogger(__name__)
+
+
+# --- Win32 constants -----------------------------------------------------------
+
+_WM_HOTKEY = 0x0312
+
+# RegisterHotKey fsModifiers (from <WinUser.h>).
+_WIN32_MODIFIERS: Dict[str, int] = {
+    "alt": 0x0001,    # MOD_ALT
+    "ctrl": 0x0002,   # MOD_CONTROL
+    "shift": 0x0004,  # MOD_SHIFT
+    "win": 0x0008,    # MOD_WIN
+}
+# Holding the key down must not re-fire the action (the hook backend ignored
+# auto-repeat via its debounce; this stops it at the source).
+_MOD_NOREPEAT = 0x4000
+
+# VkKeyScanW high-byte shift state -> modifier name.
+_VK_SCAN_SHIFT_STATE: Tuple[Tuple[int, str], ...] = (
+    (0x01, "shift"),
+    (0x02, "ctrl"),
+    (0x04, "alt"),
+)
+
+
+# --- Virtual key codes ---------------------------------------------------------
+
+# Key names as the ``keyboard`` library spells them (and as stored in
+# settings). Letters, digits and F-keys are computed in ``vk_for``; printable
+# symbols go through VkKeyScanW so they follow the active keyboard layout.
+_NAMED_VKS: Dict[str, int] = {
+    "backspace": 0x08, "tab": 0x09, "enter": 0x0D, "return": 0x0D,
+    "pause": 0x13, "caps lock": 0x14, "esc": 0x1B, "escape": 0x1B,
+    "space": 0x20, "page up": 0x21, "page down": 0x22, "end": 0x23,
+    "home": 0x24, "left": 0x25, "up": 0x26, "right": 0x27, "down": 0x28,
+    "print screen": 0x2C, "insert": 0x2D, "delete": 0x2E,
+    "num lock": 0x90, "scroll lock": 0x91,
+}
+
+_NUMPAD_VKS: Dict[str, int] = {
+    "*": 0x6A,  # VK_MULTIPLY
+    "+": 0x6B,  # VK_ADD
+    "-": 0x6D,  # VK_SUBTRACT
+    ".": 0x6E,  # VK_DECIMAL
+    "/": 0x6F,  # VK_DIVIDE
+    **{str(digit): 0x60 + digit for digit in range(10)},  # VK_NUMPAD0..9
+}
+
+
+def vk_for(main_key: Optional[str]) -> Optional[Tuple[int, frozenset]]:
+    """Resolve a keyboard-library key name to a Win32 virtual key.
+
+    Args:
+        main_key: Main key name from :func:`parse_hotkey` (e.g. ``"r"``,
+            ``"f5"``, ``"kp *"``).
+
+    Returns:
+        ``(vk, implied_modifiers)`` — the virtual key and any modifiers the
+        active layout needs to produce the character (``"*"`` is Shift+8 on a
+        US layout) — or ``None`` if the key cannot be mapped.
+    """
+    if not main_key:
+        return None
+    if main_key.startswith("kp "):
+        vk = _NUMPAD_VKS.get(main_key[3:])
+        return (vk, frozenset()) if vk is not None else None
+    if main_key in _NAMED_VKS:
+        return _NAMED_VKS[main_key], frozenset()
+    if len(main_key) == 1 and ("a" <= main_key <= "z" or "0" <= main_key <= "9"):
+        return ord(main_key.upper()), frozenset()
+    if main_key[0] == "f" and main_key[1:].isdigit() and 1 <= int(main_key[1:]) <= 24:
+        return 0x70 + int(main_key[1:]) - 1, frozenset()
+    if len(main_key) == 1 and _user32 is not None:
+        scan = _user32.VkKeyScanW(main_key)
+        if scan == -1:
+            return None
+        shift_state = (scan >> 8) & 0xFF
+        implied = frozenset(
+            name for bit, name in _VK_SCAN_SHIFT_STATE if shift_state & bit
+        )
+        return scan & 0xFF, implied
+    return None
+
+
+# --- ctypes bindings -----------------------------------------------------------
+
+_INPUT_KEYBOARD = 1
+_KEYEVENTF_KEYUP = 0x0002
+_VK_CONTROL = 0x11
+_VK_V = 0x56
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_ushort),
+        ("wScan", ctypes.c_ushort),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    # Only here so the INPUT union has the size SendInput expects.
+    _fields_ = [
+        ("dx", ctypes.c_int32),
+        ("dy", ctypes.c_int32),
+        ("mouseData", ctypes.c_uint32),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_uint32), ("union", _INPUTUNION)]
+
+
+
+def _load_user32() -> Optional[ctypes.CDLL]:
+    """Load user32 and configure the hotkey function signatures."""
+    if sys.platform != "win32":
+        return None
+    try:
+        from ctypes import wintypes
+
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+    except Exception as exc:
+        logger.warning(f"Could not load user32: {exc}")
+        return None
+
+    user32.RegisterHotKey.restype = wintypes.BOOL
+    user32.RegisterHotKey.argtypes = [
+        wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT
+    ]
+    user32.UnregisterHotKey.restype = wintypes.BOOL
+    user32.UnregisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int]
+    user32.VkKeyScanW.restype = ctypes.c_short
+    user32.VkKeyScanW.argtypes = [wintypes.WCHAR]
+    user32.SendInput.restype = wintypes.UINT
+    user32.SendInput.argtypes = [
+        wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int
+    ]
+    return user32
+
+
+_user32 = _load_user32()
+
+
+def is_available() -> bool:
+    """Whether the Win32 hotkey backend can be used right now.
+
+    Requires user32 and a running Qt application to receive ``WM_HOTKEY``.
+    """
+    return _user32 is not None and QCoreApplication.instance() is not None
+
+
+class _HotkeyEventFilter(QAbstractNativeEventFilter):
+    """Routes ``WM_HOTKEY`` thread messages to the registrar."""
+
+    def __init__(self, on_hotkey_id: Callable[[int], bool]):
+        super().__init__()
+        self._on_hotkey_id = on_hotkey_id
+
+    def nativeEventFilter(self, event_type, message):
+        if event_type != b"windows_generic_MSG" or not message:
+            return False, 0
+        from ctypes import wintypes
+
+        msg = wintypes.MSG.from_address(int(message))
+        if msg.message != _WM_HOTKEY:
+            return False, 0
+        return self._on_hotkey_id(int(msg.wParam)), 0
+
+
+class Win32HotkeyRegistrar:
+    """Registers OpenWhisper's hotkeys as Win32 global hotkeys.
+
+    The native event filter is installed once on the Qt application; each
+    configured action is registered as its own hotkey and mapped back to the
+    action name by a small integer id, so the ``WM_HOTKEY`` handler can
+    dispatch without re-matching modifiers.
+    """
+
+    def __init__(self, on_action: Callable[[str], None]):
+        self._on_action = on_action
+        self._event_filter: Optional[_HotkeyEventFilter] = None
+        self._id_to_action: Dict[int, str] = {}
+        self._next_id = 1
+
+    def _install_filter(self) -> bool:
+        if self._event_filter is not None:
+            return True
+        app = QCoreApplication.instance()
+        if app is None:
+            return False
+        # Keep a Python reference: Qt does not own native event filters.
+        self._event_filter = _HotkeyEventFilter(self._handle_hotkey_id)
+        app.installNativeEventFilter(self._event_filter)
+        logger.info("Win32 hotkey event filter installed")
+        return True
+
+    def _handle_hotkey_id(self, hotkey_id: int) -> bool:
+        """WM_HOTKEY handler (Qt main thread). Returns True if it was ours."""
+        action = self._id_to_action.get(hotkey_id)
+        if action is None:
+            return False
+        try:
+            self._on_action(action)
+        except Exception as exc:
+            logger.error(f"Error handling Win32 hotkey {action}: {exc}")
+        return True
+
+    def register_hotkeys(self, hotkeys: Dict[str, str]) -> bool:
+        """Register the given ``{action: hotkey_string}`` map, replacing any prior.
+
+        Must be called on the Qt main thread: hotkeys registered without a
+        window are delivered to the registering thread's message queue.
+
+        Returns:
+            True if every configured hotkey was registered. On False nothing
+            is left registered, so the caller can fall back to another backend.
+        """
+        if _user32 is None:
+            return False
+        if threading.current_thread() is not threading.main_thread():
+            logger.warning("Win32 hotkeys must be registered on the main thread")
+            return False
+        if not self._install_filter():
+            return False
+
+        self.unregister_all()
+
+        for action, hotkey_string in hotkeys.items():
+            if not hotkey_string:
+                continue
+            modifiers, main_key = parse_hotkey(hotkey_string)
+            resolved = vk_for(main_key)
+            if resolved is None:
+                logger.warning(
+                    f"Cannot register hotkey '{hotkey_string}' for {action}: "
+                    f"unsupported key '{main_key}'"
+                )
+                self.unregister_all()
+                return False
+
+            vk, implied_modifiers = resolved
+            win32_mods = _MOD_NOREPEAT
+            for modifier in modifiers | implied_modifiers:
+                win32_mods |= _WIN32_MODIFIERS.get(modifier, 0)
+
+            hotkey_id = self._next_id
+            if not _user32.RegisterHotKey(None, hotkey_id, win32_mods, vk):
+                error = ctypes.get_last_error()
+                logger.warning(
+                    f"RegisterHotKey failed for {action} "
+                    f"('{hotkey_string}', error={error})"
+                )
+                self.unregister_all()
+                return False
+
+            self._id_to_action[hotkey_id] = action
+            self._next_id += 1
+            logger.info(f"Registered Win32 hotkey for {action}: {hotkey_string}")
+        return True
+
+    def unregister_all(self) -> None:
+        """Unregister every currently-registered hotkey (keeps the filter)."""
+        if _user32 is None:
+            return
+        for hotkey_id in self._id_to_action:
+            try:
+                _user32.UnregisterHotKey(None, hotkey_id)
+            except Exception as exc:
+                logger.debug(f"Error unregistering Win32 hotkey: {exc}")
+        self._id_to_action.clear()
+        # Application hotkey ids must stay within 0x0000-0xBFFF.
+        self._next_id = 1
+
+    def cleanup(self) -> None:
+        """Unregister all hotkeys and remove the native event filter."""
+        self.unregister_all()
+        app = QCoreApplication.instance()
+        if self._event_filter is not None and app is not None:
+            app.removeNativeEventFilter(self._event_filter)
+        self._event_filter = None
+
+
+# --- Synthetic paste -----------------------------------------------------------
+
+
+def _key_input(vk: int, key_up: bool = False) -> _INPUT:
+    event = _INPUT(type=_INPUT_KEYBOARD)
+    event.union.ki = _KEYBDINPUT(
+        wVk=vk, dwFlags=_KEYEVENTF_KEYUP if key_up else 0
+    )
+    return event
+
+
+def send_paste_input() -> bool:
+    """Post Ctrl+V as one ``SendInput`` batch.
+
+    Events in a single ``SendInput`` call reach the input queue back to back,
+    so a key-up from the user's still-releasing hotkey cannot land between
+    Ctrl-down and V-down and turn the paste into a different shortcut. This
+    also skips the per-key round trips of the ``keyboard`` library.
+
+    Returns:
+        True if all four events were injected; False if user32 is missing
+        or input was blocked (e.g. by UIPI for an elevated foreground window).
+    """
+    if _user32 is None:
+        return False
+    events = (_INPUT * 4)(
+        _key_input(_VK_CONTROL),
+        _key_input(_VK_V),
+        _key_input(_VK_V, key_up=True),
+        _key_input(_VK_CONTROL, key_up=True),
+    )
+    sent = _user32.SendInput(len(events), events, ctypes.sizeof(_INPUT))
+    if sent != len(events):
+        logger.warning(
+            f"SendInput injected {sent}/{len(events)} paste events "
+            f"(error={ctypes.get_last_error()})"
+        )
+        return False
+    return True
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
 
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+from PyQt6.QtCore import QObject, Qt, pyqtSignal, QTimer
 
 from config import config
 from services.component_runtime import activate_component
@@ -34,6 +35,7 @@ from services.recorder import AudioRecorder
 from services.runtime import (
     HotkeyRuntime,
     StreamingRuntime,
+    TranscriptionJobQueue,
     TranscriptionRuntime,
 )
 from services.settings import HuggingFaceAccessPolicy, SettingsKey, settings_manager
@@ -46,18 +48,25 @@ from transcriber import (
 
 logger = logging.getLogger(__name__)
 
+# How long cleanup() waits for running background jobs before giving up on them.
+EXECUTOR_DRAIN_TIMEOUT_S = 2.0
+
+# Model selections served by OpenAIBackend; built lazily on first selection.
+_API_BACKEND_MODELS = ("api_whisper", "api_gpt4o", "api_gpt4o_mini")
+
 
 class ApplicationController(QObject):
     """Main application controller integrating UI and logic."""
 
     # fixed text, optional raw_text, optional CleanupInfo
-    transcription_completed = pyqtSignal(str, object, object)
+    transcription_completed = pyqtSignal(str, object, object, object)
     transcription_failed = pyqtSignal(str)
     status_update = pyqtSignal(str)
     stt_state_changed = pyqtSignal(bool)
     recording_state_changed = pyqtSignal(bool)
-    partial_transcription = pyqtSignal(str, bool)
-    streaming_text_update = pyqtSignal(str, bool)
+    # (text, is_final, route_to_overlay): one queued event per streaming chunk
+    # feeds both the Quick Record tab and the streaming overlay.
+    partial_transcription = pyqtSignal(str, bool, bool)
     streaming_overlay_show = pyqtSignal()
     streaming_overlay_hide = pyqtSignal()
     caret_indicator_show = pyqtSignal()
@@ -91,20 +100,47 @@ class ApplicationController(QObject):
     # worker threads); the connected slot reverts the persisted device setting
     # and raises a cause-specific warning on the Qt main thread.
     gpu_fallback_detected = pyqtSignal()
+    # A history entry was written by the history worker thread.
+    history_saved = pyqtSignal()
+
+    def __init__(
+        self,
+        ui_controller,
+        local_backend: Optional[LocalWhisperBackend] = None,
+        streaming_backend: Optional[LocalWhisperBackend] = None,
+    ):
+        """Wire the recorder, backends, hotkeys and streaming to the UI.
 
-    def __init__(self, ui_controller, local_backend: Optional[LocalWhisperBackend] = None):
+        Args:
+            ui_controller: The UIController the app reports to.
+            local_backend: Optional preloaded LocalWhisperBackend.
+            streaming_backend: Optional preloaded, warmed-up streaming preview
+                backend (see ``create_streaming_preview_backend``).
+        """
         super().__init__()
         self.ui_controller = ui_controller
 
         saved_device_id = settings_manager.load_audio_input_device()
         self.recorder = AudioRecorder(device_id=saved_device_id)
+        # Model reloads, downloads and deletes. Transcription jobs have their
+        # own single-consumer queue so a long download never delays them.
         self.executor = ThreadPoolExecutor(max_workers=2)
+        self.transcription_queue = TranscriptionJobQueue()
         # Component installs get their own single worker. They can run for
         # tens of minutes, and letting one occupy the shared 2-worker pool
-        # would starve transcription and model loading.
+        # would starve model loading.
         self.component_executor = ThreadPoolExecutor(
             max_workers=1, thread_name_prefix="component"
         )
+        # History writes copy the recording and hit SQLite; they run off the
+        # UI thread, one at a time so entries land in completion order.
+        self.history_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="history"
+        )
+        # Set by cleanup() when a background job outlived the drain timeout.
+        # The pools' workers are non-daemon, so the interpreter would join
+        # them at exit; the entry point force-exits instead.
+        self.shutdown_incomplete = False
 
         self.hotkey_manager = None
         self.streaming_transcriber = None
@@ -116,11 +152,6 @@ class ApplicationController(QObject):
 
         self._streaming_enabled = False
 
-        self._pending_audio_path: Optional[str] = None
-        self._pending_audio_duration: Optional[float] = None
-        self._pending_file_size: Optional[int] = None
-        self._transcription_start_time: Optional[float] = None
-
         # Debounced, background whisper reload. The ~1s model swap (cleanup +
         # load) must not run on the UI thread, and rapid combo changes are
         # coalesced into a single reload via this single-shot timer.
@@ -137,7 +168,7 @@ class ApplicationController(QObject):
         self._setup_ui_callbacks()
         self.hotkey_runtime.setup_hotkeys()
         self.streaming_runtime.setup_audio_level_callback()
-        self.streaming_runtime.setup_streaming()
+        self.streaming_runtime.setup_streaming(preloaded_backend=streaming_backend)
         self._connect_signals()
         self.hotkey_runtime.setup_hook_watchdog()
 
@@ -152,18 +183,40 @@ class ApplicationController(QObject):
         """
         logger.info("Setting up transcription backends...")
 
+        # The local backend stays eager: the model manager, streaming and
+        # reload paths all reach for it regardless of the selected model, and
+        # bootstrap usually hands over one preloaded off the UI thread. The API
+        # backends are only built once something asks for them.
         self.transcription_backends["local_whisper"] = (
             local_backend if local_backend is not None else LocalWhisperBackend()
         )
-        self.transcription_backends["api_whisper"] = OpenAIBackend("api_whisper")
-        self.transcription_backends["api_gpt4o"] = OpenAIBackend("api_gpt4o")
-        self.transcription_backends["api_gpt4o_mini"] = OpenAIBackend("api_gpt4o_mini")
 
         saved_model = settings_manager.load_model_selection()
-        self.current_backend = self.transcription_backends.get(
-            saved_model, self.transcription_backends["local_whisper"]
-        )
-        logger.info(f"Using transcription backend: {saved_model}")
+        saved_backend = self.get_transcription_backend(saved_model)
+        if saved_backend is not None:
+            self.current_backend = saved_backend
+            self._current_model_name = saved_model
+        else:
+            self.current_backend = self.transcription_backends["local_whisper"]
+            self._current_model_name = "local_whisper"
+        logger.info(f"Using transcription backend: {self._current_model_name}")
+
+    def get_transcription_backend(
+        self, model_value: Optional[str]
+    ) -> Optional[TranscriptionBackend]:
+        """Return the backend for ``model_value``, constructing it on first use.
+
+        Args:
+            model_value: Model selection key (e.g. ``"api_gpt4o"``).
+
+        Returns:
+            The memoized backend, or None for an unknown model value.
+        """
+        backend = self.transcription_backends.get(model_value)
+        if backend is None and model_value in _API_BACKEND_MODELS:
+            backend = OpenAIBackend(model_value)
+            self.transcription_backends[model_value] = backend
+        return backend
 
     def _setup_ui_callbacks(self) -> None:
         """Setup UI event callbacks."""
@@ -195,7 +248,7 @@ class ApplicationController(QObject):
         transcription is in progress.
         """
         backend = self.current_backend
-        if self.recorder.is_recording or getattr(backend, "is_transcribing", False):
+        if self.recorder.is_recording or (backend is not None and backend.is_transcribing):
             logger.info("Ignoring whisper reload: recording/transcribing in progress")
             self.status_update.emit("Finish recording before changing the engine")
             self.engine_busy_changed.emit(False)
@@ -226,11 +279,10 @@ class ApplicationController(QObject):
             local_backend = self.transcription_backends.get("local_whisper")
             if local_backend:
                 local_backend.reload_model()
-                info = getattr(local_backend, "device_info", "")
-                self.device_info_update.emit(info)
+                self.device_info_update.emit(local_backend.device_info)
                 if (
                     not local_backend.is_available()
-                    and getattr(local_backend, "is_model_missing", False)
+                    and local_backend.is_model_missing
                 ):
                     # Cache-first load found no local copy; route through the
                     # consent flow instead of downloading silently.
@@ -240,9 +292,9 @@ class ApplicationController(QObject):
                     self.ensure_local_model_available()
                 else:
                     self.status_update.emit("Whisper engine ready")
-                    logger.info(f"Whisper reloaded: {info}")
+                    logger.info(f"Whisper reloaded: {local_backend.device_info}")
                 # After the ready status, so the warning is what remains visible.
-                if getattr(local_backend, "gpu_fallback_note", None):
+                if local_backend.gpu_fallback_note:
                     self.gpu_fallback_detected.emit()
             else:
                 logger.warning("Local whisper backend not found")
@@ -267,7 +319,7 @@ class ApplicationController(QObject):
         if isinstance(self.current_backend, LocalWhisperBackend):
             QTimer.singleShot(0, self.ensure_local_model_available)
             backend = self.transcription_backends.get("local_whisper")
-            if backend is not None and getattr(backend, "gpu_fallback_note", None):
+            if backend is not None and backend.gpu_fallback_note:
                 self.gpu_fallback_detected.emit()
 
     def on_hf_policy_changed(self, policy: str) -> None:
@@ -293,7 +345,7 @@ class ApplicationController(QObject):
         backend = self.transcription_backends.get("local_whisper")
         if backend is None or backend.is_available():
             return
-        if not getattr(backend, "is_model_missing", False):
+        if not backend.is_model_missing:
             # Load failed for another reason (hardware, corrupt install);
             # downloading would not help.
             return
@@ -327,7 +379,7 @@ class ApplicationController(QObject):
         """
         backend = self.transcription_backends.get("local_whisper")
         if backend is not None and backend.is_available():
-            return getattr(backend, "last_loaded_model", None)
+            return backend.last_loaded_model
         return None
 
     def request_model_download(self, model_name: str) -> None:
@@ -377,7 +429,7 @@ class ApplicationController(QObject):
         """
         backend = self.transcription_backends.get("local_whisper")
         if backend is not None and backend.is_available():
-            loaded = getattr(backend, "last_loaded_model", None)
+            loaded = backend.last_loaded_model
             if loaded and resolve_model_repo(loaded) == resolve_model_repo(model_name):
                 self.model_deleted.emit(
                     model_name, False, "Model is in use — switch models first"
@@ -467,7 +519,7 @@ class ApplicationController(QObject):
         if backend is None or backend.is_available():
             return
 
-        last_loaded = getattr(backend, "last_loaded_model", None)
+        last_loaded = backend.last_loaded_model
         if not last_loaded or last_loaded == declined_model:
             # Nothing ever loaded (e.g. fresh install) — leave the selection
             # alone; the status message already reports it as unavailable.
@@ -620,7 +672,7 @@ class ApplicationController(QObject):
         if (
             backend is not None
             and backend.is_available()
-            and getattr(backend, "device", None) == "cuda"
+            and backend.device == "cuda"
         ):
             return  # already on the GPU (e.g. a component update)
 
@@ -634,7 +686,7 @@ class ApplicationController(QObject):
         status message that names the fix instead of just the symptom.
         """
         backend = self.transcription_backends.get("local_whisper")
-        if backend is None or not getattr(backend, "gpu_fallback_note", None):
+        if backend is None or not backend.gpu_fallback_note:
             return
 
         device = settings_manager.get(
@@ -653,7 +705,7 @@ class ApplicationController(QObject):
     @staticmethod
     def _describe_gpu_fallback(backend) -> str:
         """Status message for a GPU fallback, naming the cause-specific fix."""
-        cause = getattr(backend, "gpu_fallback_cause", None)
+        cause = backend.gpu_fallback_cause
         if cause == GpuFallbackCause.OUT_OF_MEMORY:
             return (
                 "GPU out of memory — using CPU. Pick a smaller model or int8 "
@@ -725,14 +777,14 @@ class ApplicationController(QObject):
                 # revives the engine (now a pure cache hit, no consent re-entry).
                 if (
                     backend is not None
-                    and getattr(backend, "is_model_missing", False)
+                    and backend.is_model_missing
                     and backend.model_name == model_name
                 ):
                     backend.reload_model(model_name)
                     if backend.is_available():
                         self.device_info_update.emit(backend.device_info)
                         self.status_update.emit("Whisper engine ready")
-                    if getattr(backend, "gpu_fallback_note", None):
+                    if backend.gpu_fallback_note:
                         self.gpu_fallback_detected.emit()
                 return
 
@@ -758,7 +810,7 @@ class ApplicationController(QObject):
                 logger.info(f"Model '{model_name}' ready: {backend.device_info}")
             else:
                 self.status_update.emit(f"Model '{model_name}' failed to load")
-            if getattr(backend, "gpu_fallback_note", None):
+            if backend.gpu_fallback_note:
                 self.gpu_fallback_detected.emit()
         except Exception as exc:
             logger.error(f"Model download/load failed for '{model_name}': {exc}")
@@ -780,9 +832,10 @@ class ApplicationController(QObject):
             self.ui_controller.set_status("Stop recording before changing device")
             return
 
-        self.recorder.cleanup()
-        self.recorder = AudioRecorder(device_id=device_id)
-        self.streaming_runtime.setup_audio_level_callback()
+        # Reconfigure in place: the level and streaming callbacks stay wired.
+        if not self.recorder.set_device(device_id):
+            self.ui_controller.set_status("Stop recording before changing device")
+            return
 
         device_name = "System Default" if device_id is None else f"Device {device_id}"
         logger.info(f"Audio device changed to: {device_name}")
@@ -837,7 +890,7 @@ class ApplicationController(QObject):
         backend = self.current_backend
         if backend is None:
             raise RuntimeError("No transcription engine is available")
-        if getattr(backend, "is_transcribing", False):
+        if backend.is_transcribing:
             raise RuntimeError("Transcription engine is busy")
         return backend.transcribe(audio_path)
 
@@ -889,6 +942,7 @@ class ApplicationController(QObject):
         )
         self.component_install_finished.connect(self._on_component_install_finished)
         self.gpu_fallback_detected.connect(self._on_gpu_fallback)
+        self.history_saved.connect(self.ui_controller.refresh_history)
         self.component_state_changed.connect(
             self.ui_controller.on_component_state_changed
         )
@@ -899,10 +953,10 @@ class ApplicationController(QObject):
         self.minimize_to_tray_requested.connect(
             self.ui_controller.main_window.toggle_tray_visibility
         )
+        # Always emitted from the streaming worker, many times per second.
         self.partial_transcription.connect(
-            self.ui_controller.main_window.set_partial_transcription
+            self._on_partial_transcription, Qt.ConnectionType.QueuedConnection
         )
-        self.streaming_text_update.connect(self.ui_controller.update_streaming_text)
         self.streaming_overlay_show.connect(self.ui_controller.show_streaming_overlay)
         self.streaming_overlay_hide.connect(self.ui_controller.hide_streaming_overlay)
         self.caret_indicator_show.connect(
@@ -912,6 +966,14 @@ class ApplicationController(QObject):
             self.ui_controller.hide_caret_paste_indicator
         )
 
+    def _on_partial_transcription(
+        self, text: str, is_final: bool, route_to_overlay: bool
+    ) -> None:
+        """Apply a streaming partial result on the main thread."""
+        self.ui_controller.main_window.set_partial_transcription(text, is_final)
+        if route_to_overlay:
+            self.ui_controller.update_streaming_text(text, is_final)
+
     def _on_recording_state_changed(self, is_recording: bool) -> None:
         """Handle recording state change on main thread."""
         self.ui_controller.is_recording = is_recording
@@ -920,15 +982,75 @@ class ApplicationController(QObject):
             self.ui_controller.main_window._update_recording_state()
 
     def _on_transcription_complete(
-        self, transcript: str, raw_text=None, cleanup_info=None
+        self, transcript: str, raw_text=None, cleanup_info=None, job=None
     ) -> None:
         self.transcription_runtime.on_transcription_complete(
-            transcript, raw_text, cleanup_info
+            transcript, raw_text, cleanup_info, job
         )
 
     def _on_transcription_error(self, error_message: str) -> None:
         self.transcription_runtime.on_transcription_error(error_message)
 
+    def _cleanup_backends(self) -> None:
+        """Release every transcription backend.
+
+        Local whisper backends are torn down one at a time on this thread:
+        their cleanup deliberately paces CTranslate2/CUDA destructor work, and
+        two of those overlapping is what that pacing avoids. API backends only
+        close HTTP clients, so they do that on a helper pool meanwhile.
+        """
+        local, remote = [], []
+        for backend_name, backend in self.transcription_backends.items():
+            group = local if isinstance(backend, LocalWhisperBackend) else remote
+            group.append((backend_name, backend))
+
+        if remote:
+            with ThreadPoolExecutor(
+                max_workers=len(remote), thread_name_prefix="backend-cleanup"
+            ) as pool:
+                for backend_name, backend in remote:
+                    pool.submit(self._cleanup_backend, backend_name, backend)
+                for backend_name, backend in local:
+                    self._cleanup_backend(backend_name, backend)
+        else:
+            for backend_name, backend in local:
+                self._cleanup_backend(backend_name, backend)
+
+        self.transcription_backends.clear()
+        self.current_backend = None
+
+    @staticmethod
+    def _cleanup_backend(backend_name: str, backend: TranscriptionBackend) -> None:
+        try:
+            logger.info(f"Cleaning up transcription backend: {backend_name}")
+            backend.cleanup()
+        except Exception as exc:
+            logger.debug(f"Error cleaning up {backend_name} backend: {exc}")
+
+    @staticmethod
+    def _drain_executors(executors, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for already-shut-down executors.
+
+        ``shutdown(wait=True)`` has no timeout, and a model download cannot be
+        interrupted, so the joins run on a helper thread and app exit waits on
+        that thread only as long as ``timeout``.
+
+        Returns:
+            True if every executor finished its running job in time.
+        """
+        drained = threading.Event()
+
+        def drain() -> None:
+            for executor in executors:
+                try:
+                    executor.shutdown(wait=True)
+                except Exception as exc:
+                    logger.debug(f"Error waiting for executor shutdown: {exc}")
+            drained.set()
+
+        threading.Thread(target=drain, name="executor-drain", daemon=True).start()
+        return drained.wait(timeout)
+
     def cleanup(self) -> None:
         """Cleanup resources."""
         logger.info("Starting application cleanup...")
@@ -979,23 +1101,33 @@ class ApplicationController(QObject):
         except Exception as exc:
             logger.debug(f"Error cancelling component installs: {exc}")
 
-        for executor in (self.executor, self.component_executor):
+        # Queued work is dropped everywhere except history: a queued entry is
+        # a transcript the user already has, so it is flushed instead.
+        executors = (
+            self.transcription_queue,
+            self.executor,
+            self.component_executor,
+            self.history_executor,
+        )
+        for executor in executors:
             try:
-                executor.shutdown(wait=True, cancel_futures=True)
-            except TypeError:
-                executor.shutdown(wait=False)
+                executor.shutdown(
+                    wait=False, cancel_futures=executor is not self.history_executor
+                )
             except Exception as exc:
                 logger.debug(f"Error during executor shutdown: {exc}")
 
+        if not self._drain_executors(executors, EXECUTOR_DRAIN_TIMEOUT_S):
+            logger.warning(
+                f"Background jobs still running after {EXECUTOR_DRAIN_TIMEOUT_S:.0f}s; "
+                "not waiting for them, the process will be force-exited"
+            )
+            self.shutdown_incomplete = True
+
+        # Runs either way: a stalled job was already asked to cancel, and the
+        # forced exit that follows would end it mid-call regardless.
         try:
-            for backend_name, backend in self.transcription_backends.items():
-                try:
-                    logger.info(f"Cleaning up transcription backend: {backend_name}")
-                    backend.cleanup()
-                except Exception as exc:
-                    logger.debug(f"Error cleaning up {backend_name} backend: {exc}")
-            self.transcription_backends.clear()
-            self.current_backend = None
+            self._cleanup_backends()
         except Exception as exc:
             logger.debug(f"Error during transcription backends cleanup: {exc}")
 
@@ -3,13 +3,14 @@ Audio processing utilities for handling large audio files.
 Includes file size checking and smart audio splitting with silence detection.
 """
 import os
+import re
 import wave
 import numpy as np
 import tempfile
 import logging
 import shutil
 from dataclasses import dataclass, field
-from typing import Callable, List, Tuple, Optional, Dict, Any
+from typing import Callable, Iterator, List, Tuple, Optional, Dict, Any
 from pathlib import Path
 from config import config
 
@@ -18,6 +19,8 @@ logger = logging.getLogger(__name__)
 INT16_MIN = -32768
 INT16_MAX = 32767
 
+_SPACE_RUN_RE = re.compile(" {2,}")
+
 
 @dataclass
 class AudioFilePreview:
@@ -56,19 +59,27 @@ class AudioProcessor:
         """Initialize the audio processor."""
         self.temp_files: List[str] = []  # Track temporary files for cleanup
 
-    def check_file_size(self, audio_path: str) -> Tuple[bool, float]:
+    def check_file_size(
+        self, audio_path: str, file_size_bytes: Optional[int] = None
+    ) -> Tuple[bool, float]:
         """Check if audio file exceeds size limit.
 
         Args:
             audio_path: Path to the audio file to check.
+            file_size_bytes: Size already known to the caller; skips the stat.
 
         Returns:
             Tuple of (needs_splitting, file_size_mb)
+
+        Raises:
+            FileNotFoundError: If the size is not given and the file is missing.
         """
-        if not os.path.exists(audio_path):
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        if file_size_bytes is None:
+            try:
+                file_size_bytes = os.stat(audio_path).st_size
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Audio file not found: {audio_path}") from None
 
-        file_size_bytes = os.path.getsize(audio_path)
         file_size_mb = file_size_bytes / (1024 * 1024)  # Convert to MB
 
         needs_splitting = file_size_mb > config.MAX_FILE_SIZE_MB
@@ -162,6 +173,25 @@ class AudioProcessor:
         Returns:
             List of paths to the split audio files.
 
+        Raises:
+            Exception: If splitting fails.
+        """
+        return list(self.iter_split_audio_file(audio_path, progress_callback))
+
+    def iter_split_audio_file(self, audio_path: str, progress_callback: Optional[Callable[[str], None]] = None) -> Iterator[str]:
+        """Split audio file into chunks, yielding each chunk as it is written.
+
+        Split points need the whole decoded signal, but chunk files are
+        yielded one at a time so a consumer can start transcribing the first
+        chunk while later ones are still being written.
+
+        Args:
+            audio_path: Path to the input audio file.
+            progress_callback: Optional callback function for progress updates.
+
+        Yields:
+            Paths to the split audio files, in order.
+
         Raises:
             Exception: If splitting fails.
         """
@@ -186,13 +216,14 @@ class AudioProcessor:
                 split_points = self._generate_time_based_splits(len(audio_data), sample_rate)
 
             if progress_callback:
-                progress_callback(f"Creating {len(split_points)} audio chunks...")
+                progress_callback(f"Creating {len(split_points) + 1} audio chunks...")
 
-            # Create chunks
-            chunk_files = self._create_chunks(audio_data, sample_rate, split_points, audio_path)
+            chunk_count = 0
+            for chunk_file in self._iter_chunks(audio_data, sample_rate, split_points):
+                chunk_count += 1
+                yield chunk_file
 
-            logger.info(f"Successfully split audio into {len(chunk_files)} chunks")
-            return chunk_files
+            logger.info(f"Successfully split audio into {chunk_count} chunks")
 
         except Exception as e:
             logger.error(f"Failed to split audio file: {e}")
@@ -377,24 +408,24 @@ class AudioProcessor:
 
         return split_points
 
-    def _create_chunks(self, audio_data: np.ndarray, sample_rate: int,
-                      split_points: List[int], original_file: str) -> List[str]:
-        """Create individual audio chunk files.
+    def _iter_chunks(self, audio_data: np.ndarray, sample_rate: int,
+                     split_points: List[int]) -> Iterator[str]:
+        """Write individual audio chunk files, yielding each path once saved.
 
         Args:
             audio_data: Original audio data.
             sample_rate: Sample rate.
             split_points: List of split point indices.
-            original_file: Path to original file for metadata.
 
-        Returns:
-            List of paths to created chunk files.
+        Yields:
+            Paths to the created chunk files.
         """
-        chunk_files = []
         overlap_samples = int(config.OVERLAP_DURATION_SEC * sample_rate)
 
-        # Create temporary directory for chunks
+        # Create temporary directory for chunks; tracked up front so a consumer
+        # that stops early still has it removed by cleanup_temp_files().
         temp_dir = tempfile.mkdtemp(prefix="audio_chunks_")
+        self.temp_files.append(temp_dir)
 
         # Create chunks
         start_idx = 0
@@ -410,8 +441,6 @@ class AudioProcessor:
 
             # Save chunk
             self._save_audio_chunk(chunk_data, sample_rate, chunk_filename)
-
-            chunk_files.append(chunk_filename)
             self.temp_files.append(chunk_filename)
 
             start_idx = end_idx
@@ -420,8 +449,7 @@ class AudioProcessor:
                         f"({len(chunk_data)/sample_rate:.1f}s, "
                         f"{os.path.getsize(chunk_filename)/(1024*1024):.1f}MB)")
 
-        self.temp_files.append(temp_dir)  # Add directory for cleanup
-        return chunk_files
+            yield chunk_filename
 
     def _save_audio_chunk(self, audio_data: np.ndarray, sample_rate: int, filename: str):
         """Save audio chunk to WAV file.
@@ -439,16 +467,37 @@ class AudioProcessor:
 
     def cleanup_temp_files(self):
         """Clean up temporary files created during splitting."""
-        for temp_path in self.temp_files:
+        self.remove_temp_files(self.detach_temp_files())
+
+    def detach_temp_files(self) -> List[str]:
+        """Stop tracking the current temporary files and return their paths.
+
+        Lets a caller delete one split's files later (e.g. on another thread)
+        without racing a subsequent split that starts tracking new files.
+
+        Returns:
+            The tracked paths, chunk directories first.
+        """
+        temp_paths, self.temp_files = self.temp_files, []
+        return temp_paths
+
+    def remove_temp_files(self, temp_paths: List[str]) -> None:
+        """Delete the given temporary files and directories.
+
+        Args:
+            temp_paths: Paths from :meth:`detach_temp_files`. A directory is
+                removed with everything in it, so the files listed after it
+                are already gone by the time they are reached.
+        """
+        for temp_path in temp_paths:
             try:
-                if os.path.isfile(temp_path):
-                    os.remove(temp_path)
-                elif os.path.isdir(temp_path):
+                if os.path.isdir(temp_path):
                     shutil.rmtree(temp_path)
+                elif os.path.isfile(temp_path):
+                    os.remove(temp_path)
             except Exception as e:
                 logger.warning(f"Failed to cleanup temp file {temp_path}: {e}")
 
-        self.temp_files.clear()
         logger.info("Temporary files cleaned up")
 
     def combine_transcriptions(self, transcriptions: List[str]) -> str:
@@ -469,21 +518,12 @@ class AudioProcessor:
         if not valid_transcriptions:
             return ""
 
-        # Combine with space separation, handling sentence boundaries
-        combined = ""
-        for i, transcription in enumerate(valid_transcriptions):
-            if i > 0:
-                # Add space between chunks, but avoid double spaces
-                if not combined.endswith(" ") and not transcription.startswith(" "):
-                    combined += " "
-
-            combined += transcription
-
-        # Clean up any double spaces
-        while "  " in combined:
-            combined = combined.replace("  ", " ")
+        # Chunks are already stripped, so one space separates each pair; a
+        # single join avoids re-copying the growing text once per chunk.
+        combined = " ".join(valid_transcriptions)
 
-        return combined.strip()
+        # Collapse runs of spaces inside chunks in one pass
+        return _SPACE_RUN_RE.sub(" ", combined).strip()
 
 
 # Global instance for easy access
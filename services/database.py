@@ -6,9 +6,9 @@ import json
 import logging
 import os
 from contextlib import contextmanager
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
-from sqlalchemy import create_engine, event, func, inspect, text
+from sqlalchemy import create_engine, event, func, insert, inspect, text
 from sqlalchemy.orm import scoped_session, sessionmaker
 
 from config import config
@@ -19,7 +19,16 @@ from services.models import (
 logger = logging.getLogger(__name__)
 
 # Schema version for future migrations
-SCHEMA_VERSION = 9
+SCHEMA_VERSION = 10
+
+# Connection tuning; negative cache_size is in KiB.
+SQLITE_CACHE_SIZE_KB = -64000
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+SQLITE_BUSY_TIMEOUT_MS = 30000
+# sqlite3's per-connection prepared-statement cache (stdlib default: 128).
+# SQLAlchemy already caches the compiled SQL strings; this keeps the
+# sqlite3_stmt handles for them from being evicted and re-parsed.
+SQLITE_CACHED_STATEMENTS = 512
 
 
 class DatabaseManager:
@@ -30,15 +39,32 @@ class DatabaseManager:
 
         self.engine = create_engine(
             f"sqlite:///{self.db_path}",
-            connect_args={"check_same_thread": False, "timeout": 30},
-            pool_pre_ping=True,
+            connect_args={
+                "check_same_thread": False,
+                "timeout": 30,
+                "cached_statements": SQLITE_CACHED_STATEMENTS,
+            },
         )
 
-        # Enable foreign keys for every raw SQLite connection
+        # Per-connection PRAGMAs: foreign keys, plus WAL with NORMAL sync so
+        # each history commit is one append instead of a rollback-journal
+        # write and double fsync, and UI reads don't block on a writer.
+        # Durability: in WAL mode NORMAL can lose the last few commits on
+        # power loss or an OS crash (never on an app crash), but it cannot
+        # corrupt the file. That is acceptable for transcription history.
+        in_memory = self.db_path == ":memory:"
+
         @event.listens_for(self.engine, "connect")
         def _set_sqlite_pragma(dbapi_connection, connection_record):
             cursor = dbapi_connection.cursor()
             cursor.execute("PRAGMA foreign_keys=ON")
+            if not in_memory:
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute(f"PRAGMA cache_size={SQLITE_CACHE_SIZE_KB}")
+            cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+            cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
             cursor.close()
 
         self._session_factory = sessionmaker(
@@ -68,6 +94,15 @@ class DatabaseManager:
         finally:
             self.Session.remove()
 
+    @contextmanager
+    def read_session(self):
+        """Yield a thread-scoped session for queries; nothing is committed."""
+        session = self.Session()
+        try:
+            yield session
+        finally:
+            self.Session.remove()
+
     # ------------------------------------------------------------------
     # Schema initialisation & migrations
     # ------------------------------------------------------------------
@@ -89,6 +124,10 @@ class DatabaseManager:
                 session.query(SchemaVersion).delete()
                 session.add(SchemaVersion(version=SCHEMA_VERSION))
 
+        # 0x10002: also analyze tables that have never been analyzed, as
+        # SQLite recommends for long-lived connections.
+        self._optimize("PRAGMA optimize=0x10002")
+
         logger.info("Database schema initialized")
 
     def _drop_removed_meeting_tables(self) -> None:
@@ -209,6 +248,27 @@ class DatabaseManager:
                 logger.error(f"Migration v8->v9 failed: {e}")
                 raise
 
+        if from_version < 10:
+            try:
+                table_exists = conn.execute(
+                    text(
+                        "SELECT 1 FROM sqlite_master "
+                        "WHERE type='table' AND name='transcription_history'"
+                    )
+                ).fetchone()
+                if table_exists:
+                    conn.execute(
+                        text(
+                            "CREATE INDEX IF NOT EXISTS idx_history_audio_file "
+                            "ON transcription_history (audio_file) "
+                            "WHERE audio_file IS NOT NULL"
+                        )
+                    )
+                logger.info("Migration v9->v10: Indexed transcription_history.audio_file")
+            except Exception as e:
+                logger.error(f"Migration v9->v10 failed: {e}")
+                raise
+
         conn.execute(text("UPDATE schema_version SET version = :v"), {"v": SCHEMA_VERSION})
         logger.info(f"Database migrated to schema version {SCHEMA_VERSION}")
 
@@ -219,37 +279,53 @@ class DatabaseManager:
     def _migrate_from_json(self) -> None:
         """Migrate existing JSON data to SQLite on first run."""
         history_file = getattr(config, 'HISTORY_FILE', 'transcription_history.json')
-        with self.get_session() as session:
-            history_count = session.query(func.count(TranscriptionHistory.id)).scalar()
+        if not os.path.exists(history_file):
+            return
+
+        # EXISTS stops at the first row; COUNT(*) would scan the table.
+        with self.read_session() as session:
+            has_history = session.query(
+                session.query(TranscriptionHistory.id).exists()
+            ).scalar()
 
-        if os.path.exists(history_file) and history_count == 0:
+        if not has_history:
             self._migrate_history_from_json(history_file)
 
     def _migrate_history_from_json(self, json_path: str) -> None:
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
+            # Binary read: json detects UTF-8 (with or without BOM) itself
+            # and skips the text-mode decode layer.
+            with open(json_path, 'rb') as f:
                 data = json.load(f)
             entries = data.get('entries', [])
             if not entries:
                 logger.info("No history entries to migrate")
                 return
 
-            with self.get_session() as session:
-                for entry in entries:
-                    obj = TranscriptionHistory(
-                        id=entry.get('id'),
-                        text=entry.get('text', ''),
-                        timestamp=entry.get('timestamp', ''),
-                        model=entry.get('model', ''),
-                        audio_file=entry.get('audio_file'),
-                        transcription_time=entry.get('transcription_time'),
-                        audio_duration=entry.get('audio_duration'),
-                        file_size=entry.get('file_size'),
-                    )
-                    session.merge(obj)  # merge = INSERT OR UPDATE
+            rows = [
+                {
+                    'id': entry.get('id'),
+                    'text': entry.get('text', ''),
+                    'timestamp': entry.get('timestamp', ''),
+                    'model': entry.get('model', ''),
+                    'audio_file': entry.get('audio_file'),
+                    'transcription_time': entry.get('transcription_time'),
+                    'audio_duration': entry.get('audio_duration'),
+                    'file_size': entry.get('file_size'),
+                }
+                for entry in entries
+            ]
+            # One executemany in one transaction; OR REPLACE keeps the
+            # last-wins behaviour of the old per-row session.merge().
+            with self.engine.begin() as conn:
+                conn.execute(
+                    insert(TranscriptionHistory).prefix_with('OR REPLACE'),
+                    rows,
+                )
 
             backup_path = json_path + '.bak'
-            os.rename(json_path, backup_path)
+            # os.replace: os.rename fails on Windows if a backup already exists.
+            os.replace(json_path, backup_path)
             logger.info(f"Migrated {len(entries)} history entries from JSON. Backup: {backup_path}")
         except Exception as e:
             logger.error(f"Failed to migrate history from JSON: {e}")
@@ -272,17 +348,21 @@ class DatabaseManager:
         cleanup_provider: Optional[str] = None,
         cleanup_model: Optional[str] = None,
     ) -> None:
+        self.add_history_entries([TranscriptionHistory(
+            id=entry_id, text=text, raw_text=raw_text,
+            timestamp=timestamp, model=model,
+            audio_file=audio_file, transcription_time=transcription_time,
+            audio_duration=audio_duration, file_size=file_size,
+            cleanup_provider=cleanup_provider, cleanup_model=cleanup_model,
+        )])
+
+    def add_history_entries(self, entries: Iterable[TranscriptionHistory]) -> None:
+        """Insert several entries in one transaction (one batched INSERT)."""
         with self.get_session() as session:
-            session.add(TranscriptionHistory(
-                id=entry_id, text=text, raw_text=raw_text,
-                timestamp=timestamp, model=model,
-                audio_file=audio_file, transcription_time=transcription_time,
-                audio_duration=audio_duration, file_size=file_size,
-                cleanup_provider=cleanup_provider, cleanup_model=cleanup_model,
-            ))
+            session.add_all(entries)
 
     def get_history_entries(self, limit: Optional[int] = None) -> List[TranscriptionHistory]:
-        with self.get_session() as session:
+        with self.read_session() as session:
             q = session.query(TranscriptionHistory).order_by(
                 TranscriptionHistory.timestamp.desc()
             )
@@ -290,17 +370,20 @@ class DatabaseManager:
                 q = q.limit(limit)
             return q.all()
 
+    def count_history_entries(self) -> int:
+        with self.read_session() as session:
+            return session.query(func.count(TranscriptionHistory.id)).scalar()
+
     def get_history_entry_by_id(self, entry_id: str) -> Optional[TranscriptionHistory]:
-        with self.get_session() as session:
+        with self.read_session() as session:
             return session.get(TranscriptionHistory, entry_id)
 
     def delete_history_entry(self, entry_id: str) -> bool:
         with self.get_session() as session:
-            entry = session.get(TranscriptionHistory, entry_id)
-            if entry:
-                session.delete(entry)
-                return True
-            return False
+            deleted = session.query(TranscriptionHistory).filter(
+                TranscriptionHistory.id == entry_id
+            ).delete(synchronize_session=False)
+            return deleted > 0
 
     def clear_history(self) -> None:
         with self.get_session() as session:
@@ -308,18 +391,36 @@ class DatabaseManager:
 
     def clear_history_audio_file(self, audio_file: str) -> None:
         """Clear the audio_file reference on history entries matching a filename."""
+        self.clear_history_audio_files([audio_file])
+
+    def clear_history_audio_files(self, audio_files: List[str]) -> None:
+        """Clear audio_file references for several filenames in one UPDATE."""
+        if not audio_files:
+            return
         with self.get_session() as session:
             session.query(TranscriptionHistory).filter(
-                TranscriptionHistory.audio_file == audio_file
-            ).update({TranscriptionHistory.audio_file: None})
+                TranscriptionHistory.audio_file.in_(audio_files)
+            ).update(
+                {TranscriptionHistory.audio_file: None},
+                synchronize_session=False,
+            )
 
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
 
+    def _optimize(self, pragma: str = "PRAGMA optimize") -> None:
+        """Refresh planner statistics; failures are logged, never raised."""
+        try:
+            with self.engine.connect() as conn:
+                conn.exec_driver_sql(pragma)
+        except Exception as e:
+            logger.warning(f"SQLite optimize failed: {e}")
+
     def close(self) -> None:
-        """Release all connections."""
+        """Refresh planner statistics and release all connections."""
         self.Session.remove()
+        self._optimize()
         self.engine.dispose()
 
 
@@ -5,11 +5,16 @@ Single home for human-readable formatting used by both the data layer
 everywhere.
 """
 from datetime import datetime
+from functools import lru_cache
 
 
+@lru_cache(maxsize=4096)
 def format_timestamp(iso_timestamp: str) -> str:
     """Format an ISO-8601 timestamp for display.
 
+    Memoized: history search formats every entry's timestamp on each
+    refresh, and the entries are rebuilt from the database every time.
+
     Args:
         iso_timestamp: Timestamp string as stored (``datetime.isoformat()``).
 
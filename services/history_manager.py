@@ -4,6 +4,7 @@ Stores transcription history and manages the last N audio recordings.
 """
 import logging
 import os
+import re
 import shutil
 from datetime import datetime
 from typing import List, Optional
@@ -20,8 +21,25 @@ logger = logging.getLogger(__name__)
 # Sentinel so callers can pass ``max_recordings=None`` for keep-all.
 _UNSET = object()
 
+# recording_YYYYMMDD_HHMMSS[_N].wav, as written by _save_recording; a regex
+# match is much cheaper than strptime for every file in the folder.
+_RECORDING_NAME_RE = re.compile(
+    r'^recording_(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})(?:_\d+)?\.wav$'
+)
 
-@dataclass
+
+def _copy_new_file(source_path: str, dest_path: str) -> None:
+    """Copy a file with metadata, refusing to overwrite an existing one.
+
+    Raises:
+        FileExistsError: If ``dest_path`` already exists.
+    """
+    with open(source_path, 'rb') as src, open(dest_path, 'xb') as dst:
+        shutil.copyfileobj(src, dst)
+    shutil.copystat(source_path, dest_path)
+
+
+@dataclass(slots=True)
 class RecordingInfo:
     """Represents a saved audio recording."""
     filename: str
@@ -89,6 +107,7 @@ class HistoryManager:
         text: str,
         model: str,
         source_audio_path: Optional[str] = None,
+        audio_file: Optional[str] = None,
         transcription_time: Optional[float] = None,
         audio_duration: Optional[float] = None,
         file_size: Optional[int] = None,
@@ -102,6 +121,8 @@ class HistoryManager:
             text: The transcribed text (fixed/cleaned when cleanup ran).
             model: The model used for transcription (display name or internal value).
             source_audio_path: Optional path to source audio file to save.
+            audio_file: Recording already saved with ``save_recording``;
+                used when ``source_audio_path`` is not given.
             transcription_time: Time taken to transcribe in seconds.
             audio_duration: Duration of the audio in seconds.
             file_size: Size of the audio file in bytes.
@@ -112,11 +133,13 @@ class HistoryManager:
         Returns:
             The created HistoryEntry.
         """
-        saved_audio_path = None
+        saved_audio_path = audio_file
 
         # Save the audio recording if provided
-        if source_audio_path and os.path.exists(source_audio_path):
+        if source_audio_path:
             saved_audio_path = self._save_recording(source_audio_path)
+        elif audio_file:
+            self._rotate_recordings()
 
         # Create the entry
         entry = HistoryEntry.create(
@@ -132,19 +155,7 @@ class HistoryManager:
         )
 
         # Save to database
-        db.add_history_entry(
-            entry_id=entry.id,
-            text=entry.text,
-            timestamp=entry.timestamp,
-            model=entry.model,
-            audio_file=entry.audio_file,
-            transcription_time=entry.transcription_time,
-            audio_duration=entry.audio_duration,
-            file_size=entry.file_size,
-            raw_text=entry.raw_text,
-            cleanup_provider=entry.cleanup_provider,
-            cleanup_model=entry.cleanup_model,
-        )
+        db.add_history_entries([entry])
 
         logger.info(f"Added history entry: {entry.id[:8]}...")
         return entry
@@ -152,6 +163,24 @@ class HistoryManager:
     def _save_recording(self, source_path: str) -> Optional[str]:
         """Save a recording to the recordings folder with rotation.
 
+        Args:
+            source_path: Path to the source audio file.
+
+        Returns:
+            Relative path to saved recording, or None if failed.
+        """
+        filename = self.save_recording(source_path)
+        if filename:
+            self._rotate_recordings()
+        return filename
+
+    def save_recording(self, source_path: str) -> Optional[str]:
+        """Save a recording to the recordings folder, without rotation.
+
+        The recorder's own output is saved as a hard link, which is cheap
+        enough to take on the caller's thread before the next recording
+        replaces it; pass the result to ``add_entry`` as ``audio_file``.
+
         Args:
             source_path: Path to the source audio file.
 
@@ -161,18 +190,46 @@ class HistoryManager:
         try:
             # Generate filename with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"recording_{timestamp}.wav"
-            dest_path = os.path.join(self.recordings_folder, filename)
 
-            # Copy the file
-            shutil.copy2(source_path, dest_path)
+            # Only the recorder's own output may be hard-linked: it is replaced
+            # by rename (a new file), so a link never picks up a later
+            # recording. Uploads and re-transcribed files belong to the user
+            # and are always copied, so edits on either side stay separate.
+            link = os.path.abspath(source_path) == os.path.abspath(
+                config.RECORDED_AUDIO_FILE
+            )
+
+            # Names have one-second resolution; a save in the same second
+            # gets a numeric suffix rather than writing onto the earlier file.
+            attempt = 0
+            while True:
+                suffix = f"_{attempt}" if attempt else ""
+                filename = f"recording_{timestamp}{suffix}.wav"
+                dest_path = os.path.join(self.recordings_folder, filename)
+                try:
+                    if link:
+                        os.link(source_path, dest_path)
+                    else:
+                        _copy_new_file(source_path, dest_path)
+                    break
+                except FileExistsError:
+                    attempt += 1
+                except OSError:
+                    if not link:
+                        raise
+                    link = False  # Cross-device or unsupported; copy instead
             logger.info(f"Saved recording: {filename}")
-
-            # Rotate old recordings
-            self._rotate_recordings()
-
             return filename
 
+        except FileNotFoundError as e:
+            if e.filename == source_path:
+                # No source audio (e.g. an entry added without a recording).
+                # A failed link is ambiguous about which path is missing, but
+                # it falls back to the copy, whose error names the file.
+                logger.debug("Recording source missing, not saved: %s", source_path)
+                return None
+            logger.error(f"Failed to save recording: {e}")
+            return None
         except Exception as e:
             logger.error(f"Failed to save recording: {e}")
             return None
@@ -183,25 +240,31 @@ class HistoryManager:
             return
 
         try:
+            # Names alone decide whether anything is over the limit; only
+            # stat and parse timestamps when something must be removed.
+            if len(self._recording_entries()) <= self.max_recordings:
+                return
+
             recordings = self.get_recordings()
 
             if len(recordings) > self.max_recordings:
                 # Sort by timestamp (oldest first)
-                recordings.sort(key=lambda r: r.timestamp)
+                recordings.sort(key=lambda r: (r.timestamp, r.filename))
 
                 # Remove oldest recordings
                 to_remove = recordings[:-self.max_recordings]
+                removed = []
                 for rec in to_remove:
                     try:
                         os.remove(rec.file_path)
                         logger.info(f"Removed old recording: {rec.filename}")
-
-                        # Clear audio_file reference in database
-                        db.clear_history_audio_file(rec.filename)
-
+                        removed.append(rec.filename)
                     except Exception as e:
                         logger.error(f"Failed to remove recording {rec.filename}: {e}")
 
+                # Clear audio_file references in database with one UPDATE
+                db.clear_history_audio_files(removed)
+
         except Exception as e:
             logger.error(f"Failed to rotate recordings: {e}")
 
@@ -216,6 +279,10 @@ class HistoryManager:
         """
         return db.get_history_entries(limit)
 
+    def get_history_count(self) -> int:
+        """Get the total number of transcription history entries."""
+        return db.count_history_entries()
+
     def get_recordings(self) -> List[RecordingInfo]:
         """Get list of saved recordings.
 
@@ -225,31 +292,31 @@ class HistoryManager:
         recordings = []
 
         try:
-            if not os.path.exists(self.recordings_folder):
-                return recordings
-
-            for filename in os.listdir(self.recordings_folder):
-                if filename.endswith('.wav'):
-                    file_path = os.path.join(self.recordings_folder, filename)
+            for dir_entry in self._recording_entries():
+                filename = dir_entry.name
+                file_path = dir_entry.path
 
-                    # Get file info
-                    stat = os.stat(file_path)
+                # Get file info (cached from the directory scan on Windows)
+                stat = dir_entry.stat()
 
-                    # Extract timestamp from filename (recording_YYYYMMDD_HHMMSS.wav)
+                # Extract timestamp from filename (recording_YYYYMMDD_HHMMSS.wav)
+                timestamp = None
+                match = _RECORDING_NAME_RE.match(filename)
+                if match:
                     try:
-                        parts = filename.replace('recording_', '').replace('.wav', '')
-                        dt = datetime.strptime(parts, "%Y%m%d_%H%M%S")
-                        timestamp = dt.isoformat()
-                    except Exception:
-                        # Fallback to file modification time
-                        timestamp = datetime.fromtimestamp(stat.st_mtime).isoformat()
-
-                    recordings.append(RecordingInfo(
-                        filename=filename,
-                        timestamp=timestamp,
-                        file_path=file_path,
-                        size_bytes=stat.st_size
-                    ))
+                        timestamp = datetime(*map(int, match.groups())).isoformat()
+                    except ValueError:
+                        pass  # Out-of-range date/time digits
+                if timestamp is None:
+                    # Fallback to file modification time
+                    timestamp = datetime.fromtimestamp(stat.st_mtime).isoformat()
+
+                recordings.append(RecordingInfo(
+                    filename=filename,
+                    timestamp=timestamp,
+                    file_path=file_path,
+                    size_bytes=stat.st_size
+                ))
 
             # Sort by timestamp (newest first)
             recordings.sort(key=lambda r: r.timestamp, reverse=True)
@@ -259,6 +326,13 @@ class HistoryManager:
 
         return recordings
 
+    def _recording_entries(self) -> List[os.DirEntry]:
+        """Scan the recordings folder for ``.wav`` files."""
+        if not os.path.exists(self.recordings_folder):
+            return []
+        with os.scandir(self.recordings_folder) as it:
+            return [e for e in it if e.name.endswith('.wav') and e.is_file()]
+
     def get_entry_by_id(self, entry_id: str) -> Optional[HistoryEntry]:
         """Get a specific history entry by ID.
 
@@ -54,6 +54,12 @@ class TranscriptionHistory(Base):
 
     __table_args__ = (
         Index('idx_history_timestamp', 'timestamp'),
+        # Partial: most entries have no saved recording. The predicate is
+        # implied by the `audio_file IN (...)` lookups that clear references.
+        Index(
+            'idx_history_audio_file', 'audio_file',
+            sqlite_where=audio_file.isnot(None),
+        ),
     )
 
     # -- Factory ----------------------------------------------------------
@@ -97,6 +97,27 @@ class AudioRecorder:
         """
         self.streaming_callback = callback
 
+    def set_device(self, device_id: Optional[int]) -> bool:
+        """Switch the input device used by the next recording.
+
+        The input stream only exists while recording, so an idle recorder can
+        switch in place: callbacks, settings and the output path are kept.
+
+        Args:
+            device_id: Device ID for input. None uses system default.
+
+        Returns:
+            True if the device was changed, False while recording.
+        """
+        if self.is_recording:
+            logger.warning("Cannot change audio device while recording")
+            return False
+
+        self.device_id = device_id
+        self._current_audio_level = 0.0
+        logger.info(f"Audio input device set to: {device_id}")
+        return True
+
     def start_recording(self) -> bool:
         """Start audio recording.
 
@@ -210,7 +231,7 @@ class AudioRecorder:
                     try:
                         self.streaming_callback(indata.copy())
                     except Exception as stream_err:
-                        logger.debug(f"Streaming callback error: {stream_err}")
+                        logger.debug("Streaming callback error: %s", stream_err)
 
         except Exception as e:
             logger.error(f"Error in audio callback: {e}")
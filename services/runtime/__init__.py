@@ -1,11 +1,14 @@
 """Runtime helpers for the Qt application controller."""
 
 from services.runtime.hotkeys import HotkeyRuntime
+from services.runtime.job_queue import JobPriority, TranscriptionJobQueue
 from services.runtime.streaming import StreamingRuntime
 from services.runtime.transcription import TranscriptionRuntime
 
 __all__ = [
     "HotkeyRuntime",
+    "JobPriority",
     "StreamingRuntime",
+    "TranscriptionJobQueue",
     "TranscriptionRuntime",
 ]
@@ -0,0 +1,113 @@
+"""Single-consumer priority queue for transcription jobs."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import queue
+import threading
+from enum import IntEnum
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class JobPriority(IntEnum):
+    """Transcription job priorities; lower values run first."""
+
+    INTERACTIVE = 0  # stop-recording: the user is waiting on the paste
+    RETRANSCRIBE = 1
+    UPLOAD = 2
+
+
+# Sorts ahead of every job so shutdown never waits behind queued work.
+_STOP_PRIORITY = -1
+
+
+class TranscriptionJobQueue:
+    """Runs transcription jobs one at a time on a dedicated worker thread.
+
+    Whisper inference is serialized on one model instance, so a second worker
+    only adds GIL contention and lets two jobs collide on the GPU. Jobs are
+    ordered by ``(priority, size, submission order)``: a stop-recording job
+    overtakes queued uploads, and among equals smaller files go first.
+
+    ``submit``/``shutdown`` mirror :class:`concurrent.futures.ThreadPoolExecutor`
+    closely enough that callers (and test doubles) can treat it as one.
+    """
+
+    def __init__(self, maxsize: int = 8, name: str = "transcription"):
+        """Start the worker thread.
+
+        Args:
+            maxsize: Maximum number of queued (not yet running) jobs.
+            name: Worker thread name, for logs and debuggers.
+        """
+        self._queue: queue.PriorityQueue = queue.PriorityQueue(maxsize=maxsize)
+        self._sequence = itertools.count()
+        self._shutdown = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(
+        self,
+        fn: Callable,
+        *args,
+        priority: int = JobPriority.INTERACTIVE,
+        size: int = 0,
+    ) -> None:
+        """Queue ``fn(*args)`` to run on the worker thread.
+
+        Args:
+            fn: Job callable. Exceptions it raises are logged, not propagated.
+            *args: Positional arguments for ``fn``.
+            priority: A :class:`JobPriority`; lower runs first.
+            size: Tie-breaker within a priority (e.g. file size in bytes).
+
+        Raises:
+            RuntimeError: If the queue has been shut down.
+            queue.Full: If ``maxsize`` jobs are already waiting. Never blocks,
+                because callers run on the Qt main thread.
+        """
+        if self._shutdown:
+            raise RuntimeError("Transcription queue has been shut down")
+        self._queue.put_nowait(
+            (int(priority), size, next(self._sequence), fn, args)
+        )
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """Stop the worker after the running job.
+
+        Like ``ThreadPoolExecutor.shutdown``, calling it again with
+        ``wait=True`` after a non-waiting shutdown joins the worker.
+
+        Args:
+            wait: Block until the worker thread exits.
+            cancel_futures: Drop queued jobs instead of running them first.
+        """
+        if not self._shutdown:
+            self._shutdown = True
+
+            if cancel_futures:
+                while True:
+                    try:
+                        self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+
+            # put() rather than put_nowait(): a full queue drains while we wait.
+            stop_priority = _STOP_PRIORITY if cancel_futures else float("inf")
+            self._queue.put((stop_priority, 0, next(self._sequence), None, ()))
+
+        if wait and threading.current_thread() is not self._thread:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            _priority, _size, _seq, fn, args = self._queue.get()
+            if fn is None:
+                return
+            try:
+                fn(*args)
+            except Exception:
+                logger.exception("Transcription job failed")
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Callable
+import time
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
 
 from config import config
 try:
@@ -19,34 +20,115 @@ if TYPE_CHECKING:
     from services.recorder import AudioLevelCallback
 else:
     AudioLevelCallback = Callable[[float], None]
-from services.streaming_transcriber import StreamingTranscriber
-from transcriber import LocalWhisperBackend
 
 if TYPE_CHECKING:
     from services.application_controller import ApplicationController
 
 logger = logging.getLogger(__name__)
 
+STREAMING_PREVIEW_MODEL = "tiny.en"
+
+# The recorder reports a level for every audio buffer (50+ Hz); the waveform
+# only needs one update per display frame (~30 Hz).
+AUDIO_LEVEL_EMIT_INTERVAL_NS = 33_000_000
+AUDIO_LEVEL_BAR_COUNT = 20
+
+
+def create_streaming_preview_backend():
+    """Build and warm up the streaming preview backend if settings call for one.
+
+    Safe to call off the UI thread, so bootstrap can load the preview model
+    while the loading screen keeps painting instead of inside
+    ``ApplicationController.__init__`` on the UI thread.
+
+    Returns:
+        A warmed-up ``LocalWhisperBackend``, or None when streaming is disabled
+        or the selected backend is not Local Whisper.
+    """
+    settings = settings_manager.load_all_settings()
+    if not settings.get(SettingsKey.STREAMING_ENABLED, config.STREAMING_ENABLED):
+        return None
+    if settings_manager.load_model_selection() != "local_whisper":
+        return None
+
+    from transcriber import LocalWhisperBackend
+
+    logger.info("Creating dedicated tiny.en backend for streaming preview...")
+    backend = LocalWhisperBackend(model_name=STREAMING_PREVIEW_MODEL)
+    _warmup_streaming_backend(backend)
+    return backend
+
+
+def _warmup_streaming_backend(backend) -> None:
+    """Run a short silent inference so the first live preview is not a cold start.
+
+    Args:
+        backend: Dedicated streaming LocalWhisperBackend instance.
+    """
+    try:
+        import numpy as np
+
+        # 0.5s of silence at Whisper's expected sample rate
+        silence = np.zeros(
+            max(1, config.WHISPER_TARGET_SAMPLE_RATE // 2),
+            dtype=np.float32,
+        )
+        segments, _info = backend.model.transcribe(
+            silence,
+            beam_size=1,
+            vad_filter=False,
+        )
+        # Consume the generator so CTranslate2 finishes the first pass now.
+        list(segments)
+        logger.info("Streaming preview model warmed up")
+    except Exception as exc:
+        logger.warning(f"Streaming warmup failed (non-fatal): {exc}")
+
 
 class StreamingRuntime:
     """Owns streaming transcription setup and lifecycle."""
 
     def __init__(self, controller: "ApplicationController"):
         self.controller = controller
+        # Last (text, is_final) sent to the UI during the current session.
+        self._last_partial: Optional[Tuple[str, bool]] = None
 
     def setup_audio_level_callback(self) -> None:
-        """Setup audio level callback for waveform display."""
+        """Setup audio level callback for waveform display.
+
+        Runs on the audio thread. Levels are coalesced to one UI update per
+        ``AUDIO_LEVEL_EMIT_INTERVAL_NS``, reporting the peak seen since the
+        previous update so short transients still reach the waveform.
+        """
+        last_emit_ns = 0
+        peak = 0.0
 
         def audio_level_callback(level: float) -> None:
-            levels = [level] * 20
+            nonlocal last_emit_ns, peak
+            if level > peak:
+                peak = level
+            now_ns = time.perf_counter_ns()
+            if now_ns - last_emit_ns < AUDIO_LEVEL_EMIT_INTERVAL_NS:
+                return
+            last_emit_ns = now_ns
+            # A fresh list per update: it crosses to the GUI thread.
+            levels = [peak] * AUDIO_LEVEL_BAR_COUNT
+            peak = 0.0
             self.controller.ui_controller.update_audio_levels(levels)
 
         callback: AudioLevelCallback = audio_level_callback
         self.controller.recorder.set_audio_level_callback(callback)
 
-    def setup_streaming(self) -> None:
-        """Initialize streaming transcriber if enabled."""
-        self._configure_streaming(initial_setup=True)
+    def setup_streaming(self, preloaded_backend=None) -> None:
+        """Initialize streaming transcriber if enabled.
+
+        Args:
+            preloaded_backend: Optional warmed-up preview backend from
+                :func:`create_streaming_preview_backend`.
+        """
+        self._configure_streaming(
+            initial_setup=True, preloaded_backend=preloaded_backend
+        )
 
     def reconfigure_streaming(self) -> None:
         """Reconfigure streaming transcriber based on current settings."""
@@ -63,16 +145,24 @@ class StreamingRuntime:
         self._configure_streaming(initial_setup=False)
 
     def on_partial_transcription(self, text: str, is_final: bool) -> None:
-        """Handle partial transcription from the streaming worker."""
-        self.controller.partial_transcription.emit(text, is_final)
-        if self.controller._streaming_enabled and text:
-            self.controller.streaming_text_update.emit(text, is_final)
+        """Handle partial transcription from the streaming worker.
+
+        Silence re-emits the accumulated text unchanged; those repeats are
+        dropped here so they never cross to the GUI thread.
+        """
+        partial = (text, is_final)
+        if partial == self._last_partial:
+            return
+        self._last_partial = partial
+        route_to_overlay = bool(self.controller._streaming_enabled and text)
+        self.controller.partial_transcription.emit(text, is_final, route_to_overlay)
 
     def start_streaming_session(self) -> None:
         """Start real-time streaming transcription for an active recording."""
         if not self.controller.streaming_transcriber:
             return
 
+        self._last_partial = None
         self.controller.recorder.set_streaming_callback(
             self.controller.streaming_transcriber.feed_audio
         )
@@ -102,6 +192,7 @@ class StreamingRuntime:
 
     def cancel_streaming_session(self) -> None:
         """Cancel any active streaming session."""
+        self._last_partial = None
         if self.controller.streaming_transcriber:
             self.controller.streaming_transcriber.stop_streaming()
             self.controller.recorder.set_streaming_callback(None)
@@ -114,8 +205,12 @@ class StreamingRuntime:
         """Release streaming resources."""
         self._cleanup_streaming_resources()
 
-    def _configure_streaming(self, *, initial_setup: bool) -> None:
+    def _configure_streaming(
+        self, *, initial_setup: bool, preloaded_backend=None
+    ) -> None:
         try:
+            from transcriber import LocalWhisperBackend
+
             settings = settings_manager.load_all_settings()
             self.controller._streaming_enabled = settings.get(
                 SettingsKey.STREAMING_ENABLED, config.STREAMING_ENABLED
@@ -129,18 +224,26 @@ class StreamingRuntime:
                     SettingsKey.STREAMING_CHUNK_DURATION, config.STREAMING_CHUNK_DURATION_SEC
                 )
 
-                logger.info("Creating dedicated tiny.en backend for streaming preview...")
-                self.controller._streaming_backend = LocalWhisperBackend(
-                    model_name="tiny.en"
-                )
-                streaming_backend = self.controller._streaming_backend
+                from services.streaming_transcriber import StreamingTranscriber
+
+                if preloaded_backend is not None:
+                    streaming_backend = preloaded_backend
+                    preloaded_backend = None
+                else:
+                    logger.info(
+                        "Creating dedicated tiny.en backend for streaming preview..."
+                    )
+                    streaming_backend = LocalWhisperBackend(
+                        model_name=STREAMING_PREVIEW_MODEL
+                    )
+                    _warmup_streaming_backend(streaming_backend)
+                self.controller._streaming_backend = streaming_backend
 
                 self.controller.streaming_transcriber = StreamingTranscriber(
                     backend=streaming_backend,
                     chunk_duration_sec=chunk_duration,
                     overlap_sec=config.STREAMING_OVERLAP_SEC,
                 )
-                self._warmup_streaming_backend(streaming_backend)
                 logger.info(
                     f"Streaming transcription enabled (chunk_duration={chunk_duration}s)"
                 )
@@ -167,31 +270,11 @@ class StreamingRuntime:
             self.controller._streaming_enabled = False
             if not initial_setup:
                 self.controller.ui_controller.set_status("Failed to reconfigure streaming")
-
-    def _warmup_streaming_backend(self, backend) -> None:
-        """Run a short silent inference so the first live preview is not a cold start.
-
-        Args:
-            backend: Dedicated streaming LocalWhisperBackend instance.
-        """
-        try:
-            import numpy as np
-
-            # 0.5s of silence at Whisper's expected sample rate
-            silence = np.zeros(
-                max(1, config.WHISPER_TARGET_SAMPLE_RATE // 2),
-                dtype=np.float32,
-            )
-            segments, _info = backend.model.transcribe(
-                silence,
-                beam_size=1,
-                vad_filter=False,
-            )
-            # Consume the generator so CTranslate2 finishes the first pass now.
-            list(segments)
-            logger.info("Streaming preview model warmed up")
-        except Exception as exc:
-            logger.warning(f"Streaming warmup failed (non-fatal): {exc}")
+        finally:
+            if preloaded_backend is not None:
+                # Preloaded for settings that no longer apply (e.g. the saved
+                # backend was unknown); nothing else will release it.
+                preloaded_backend.cleanup()
 
     def _cleanup_streaming_resources(self) -> None:
         if self.controller.streaming_transcriber:
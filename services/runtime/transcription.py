@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
 import os
 import time
-from typing import TYPE_CHECKING, Optional
-
-import pyperclip
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from config import config
 from services.hotkey_manager import is_accessibility_trusted, send_paste
@@ -51,7 +51,9 @@ except ImportError:  # pragma: no cover - supports lightweight test stubs
     def compose_transcript_cleanup_prompt(base_prompt, rules):
         return base_prompt
 
+from services.runtime.job_queue import JobPriority
 from ui_qt.overlay_state import OverlayState
+from ui_qt.utils.clipboard import set_clipboard_text
 
 if TYPE_CHECKING:
     from services.application_controller import ApplicationController
@@ -59,6 +61,30 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class TranscriptionJob:
+    """Metadata for one queued transcription, carried from submit to history.
+
+    Jobs are reordered by the queue and can overlap a live recording, so
+    nothing about a job may live in controller-wide state.
+    """
+
+    audio_path: str
+    file_size: Optional[int] = None
+    audio_duration: Optional[float] = None
+    # Recording to keep in history; None for re-transcriptions and uploads.
+    source_audio_path: Optional[str] = None
+    start_time: Optional[float] = None
+
+
+def _file_size_or_none(path: str) -> Optional[int]:
+    """Return the size of ``path`` in bytes with one stat, or None if missing."""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return None
+
+
 class TranscriptionRuntime:
     """Owns recording flow and transcription job orchestration."""
 
@@ -114,26 +140,27 @@ class TranscriptionRuntime:
             self.on_transcription_error("Failed to save audio file")
             return
 
-        if not os.path.exists(config.RECORDED_AUDIO_FILE):
+        file_size = _file_size_or_none(config.RECORDED_AUDIO_FILE)
+        if file_size is None:
             logger.error(f"Audio file not found: {config.RECORDED_AUDIO_FILE}")
             self.on_transcription_error("Audio file not created")
             return
 
-        file_size = os.path.getsize(config.RECORDED_AUDIO_FILE)
         logger.info(f"Audio file size: {file_size} bytes")
         if file_size < 100:
             logger.error(f"Audio file too small: {file_size} bytes")
             self.on_transcription_error("Audio file is empty or corrupted")
             return
 
-        self.controller._pending_audio_path = config.RECORDED_AUDIO_FILE
-        self.controller._pending_audio_duration = (
-            self.controller.recorder.get_recording_duration()
+        job = TranscriptionJob(
+            audio_path=config.RECORDED_AUDIO_FILE,
+            file_size=file_size,
+            audio_duration=self.controller.recorder.get_recording_duration(),
+            source_audio_path=config.RECORDED_AUDIO_FILE,
         )
-        self.controller._pending_file_size = file_size
 
         try:
-            self._submit_transcription_job(config.RECORDED_AUDIO_FILE)
+            self._submit_transcription_job(job, JobPriority.INTERACTIVE)
             logger.info(
                 "Transcription started. Duration: "
                 f"{self.controller.recorder.get_recording_duration():.2f}s"
@@ -187,7 +214,8 @@ class TranscriptionRuntime:
         Args:
             audio_path: Path to the saved recording.
         """
-        if not os.path.exists(audio_path):
+        file_size = _file_size_or_none(audio_path)
+        if file_size is None:
             logger.error(
                 f"Audio file not found for re-transcription: {audio_path}"
             )
@@ -196,35 +224,34 @@ class TranscriptionRuntime:
             return
 
         logger.info("Re-transcribing audio file: %s", audio_path)
-        self.controller._pending_audio_path = None
         self.controller.overlay_state_update.emit(OverlayState.PROCESSING)
         self.controller.status_update.emit("Processing...")
 
         try:
-            self.controller._pending_file_size = os.path.getsize(audio_path)
-            self.controller._pending_audio_duration = None
-            self._submit_transcription_job(audio_path)
+            self._submit_transcription_job(
+                TranscriptionJob(audio_path, file_size), JobPriority.RETRANSCRIBE
+            )
         except Exception as exc:
             logger.error(f"Failed to start re-transcription: {exc}")
             self.on_transcription_error(f"Failed to process audio: {exc}")
 
     def upload_audio_file(self, audio_path: str) -> None:
         """Transcribe an uploaded audio file."""
-        if not os.path.exists(audio_path):
+        file_size = _file_size_or_none(audio_path)
+        if file_size is None:
             logger.error(f"Uploaded audio file not found: {audio_path}")
             self.controller.overlay_state_update.emit(OverlayState.NONE)
             self.controller.status_update.emit("Error: Audio file not found")
             return
 
         logger.info(f"Processing uploaded audio file: {audio_path}")
-        self.controller._pending_audio_path = None
         self.controller.overlay_state_update.emit(OverlayState.PROCESSING)
         self.controller.status_update.emit("Processing uploaded file...")
 
         try:
-            self.controller._pending_file_size = os.path.getsize(audio_path)
-            self.controller._pending_audio_duration = None
-            self._submit_transcription_job(audio_path)
+            self._submit_transcription_job(
+                TranscriptionJob(audio_path, file_size), JobPriority.UPLOAD
+            )
         except Exception as exc:
             logger.error(f"Failed to process uploaded audio: {exc}")
             self.on_transcription_error(f"Failed to process audio: {exc}")
@@ -247,7 +274,7 @@ class TranscriptionRuntime:
             SettingsKey.TRANSCRIPT_CLEANUP_ENABLED,
             config.TRANSCRIPT_CLEANUP_ENABLED,
         )
-        if not enabled or not raw or not raw.strip():
+        if not enabled or not raw or raw.isspace():
             return raw, None, None
 
         # Re-apply provider/model each run so Model Manager changes take effect
@@ -285,123 +312,152 @@ class TranscriptionRuntime:
             return fixed, raw, info
         return fixed, None, info
 
-    def transcribe_audio_file(self, audio_path: str) -> None:
-        """Transcribe a single audio file in a background thread."""
+    def transcribe_audio_file(
+        self, audio_path: str, job: Optional[TranscriptionJob] = None
+    ) -> None:
+        """Transcribe a single audio file in a background thread.
+
+        Args:
+            audio_path: File to transcribe.
+            job: Metadata handed back with the result; built from
+                ``audio_path`` when omitted.
+        """
+        job = job or TranscriptionJob(audio_path)
         try:
-            if self.controller._pending_file_size is None:
-                self.controller._pending_file_size = os.path.getsize(audio_path)
+            if job.file_size is None:
+                job.file_size = os.path.getsize(audio_path)
             self.controller.overlay_state_update.emit(OverlayState.TRANSCRIBING)
             self.controller.status_update.emit("Transcribing...")
-            self.controller._transcription_start_time = time.time()
+            job.start_time = time.time()
             raw = self.controller.current_backend.transcribe(audio_path)
             fixed, raw_text, cleanup_info = self._maybe_cleanup_transcript(raw)
-            self.controller.transcription_completed.emit(fixed, raw_text, cleanup_info)
+            self.controller.transcription_completed.emit(
+                fixed, raw_text, cleanup_info, job
+            )
         except Exception as exc:
             logger.error(f"Transcription failed: {exc}")
             self.controller.transcription_failed.emit(str(exc))
 
-    def transcribe_large_audio_file(self, audio_path: str) -> None:
-        """Transcribe a large audio file by splitting it into chunks."""
-        chunk_files = []
-        if self.controller._pending_file_size is None:
-            self.controller._pending_file_size = os.path.getsize(audio_path)
-        self.controller._transcription_start_time = time.time()
+    def transcribe_large_audio_file(
+        self, audio_path: str, job: Optional[TranscriptionJob] = None
+    ) -> None:
+        """Transcribe a large audio file by splitting it into chunks.
+
+        Args:
+            audio_path: File to split and transcribe.
+            job: Metadata handed back with the result; built from
+                ``audio_path`` when omitted.
+        """
+        job = job or TranscriptionJob(audio_path)
+        if job.file_size is None:
+            job.file_size = os.path.getsize(audio_path)
+        job.start_time = time.time()
         try:
             def progress_callback(message: str) -> None:
                 self.controller.status_update.emit(message)
 
-            chunk_files = audio_processor.split_audio_file(
+            # Chunks are handed over as the splitter writes them, so the first
+            # ones transcribe (or upload) while the rest are still being
+            # written. Every backend has transcribe_chunks (TranscriptionBackend
+            # provides a serial default); the OpenAI backend overlaps uploads.
+            chunk_files = iter(audio_processor.iter_split_audio_file(
                 audio_path, progress_callback
-            )
-            if not chunk_files:
+            ))
+            # Wait for the first chunk so an empty split fails here instead
+            # of "succeeding" with empty text that would be pasted and saved.
+            first_chunk = next(chunk_files, None)
+            if first_chunk is None:
                 raise Exception("Failed to split audio file")
 
-            if hasattr(self.controller.current_backend, "transcribe_chunks"):
-                self.controller.overlay_state_update.emit(OverlayState.TRANSCRIBING)
-                self.controller.status_update.emit(
-                    f"Transcribing {len(chunk_files)} chunks..."
-                )
-                raw = self.controller.current_backend.transcribe_chunks(
-                    chunk_files
-                )
-            else:
-                transcripts = []
-                for index, chunk_file in enumerate(chunk_files):
-                    self.controller.overlay_state_update.emit(OverlayState.TRANSCRIBING)
-                    self.controller.status_update.emit(
-                        f"Transcribing chunk {index + 1}/{len(chunk_files)}..."
-                    )
-                    transcripts.append(
-                        self.controller.current_backend.transcribe(chunk_file)
-                    )
-                raw = audio_processor.combine_transcriptions(transcripts)
+            self.controller.overlay_state_update.emit(OverlayState.TRANSCRIBING)
+            self.controller.status_update.emit("Transcribing chunks...")
+            raw = self.controller.current_backend.transcribe_chunks(
+                itertools.chain((first_chunk,), chunk_files)
+            )
 
             fixed, raw_text, cleanup_info = self._maybe_cleanup_transcript(raw)
-            self.controller.transcription_completed.emit(fixed, raw_text, cleanup_info)
+            self.controller.transcription_completed.emit(
+                fixed, raw_text, cleanup_info, job
+            )
         except Exception as exc:
             logger.error(f"Large audio transcription failed: {exc}")
             self.controller.transcription_failed.emit(str(exc))
         finally:
+            # Unlink the chunk WAVs on the executor so the next queued job
+            # starts immediately. The paths are detached here, on the job
+            # thread, so a later split never has its own files deleted.
+            temp_paths = audio_processor.detach_temp_files()
             try:
-                audio_processor.cleanup_temp_files()
-            except Exception as cleanup_error:
-                logger.warning(
-                    f"Failed to cleanup temp files: {cleanup_error}"
+                self.controller.executor.submit(
+                    audio_processor.remove_temp_files, temp_paths
                 )
+            except RuntimeError:
+                # Executor already shut down (app exiting): delete inline.
+                audio_processor.remove_temp_files(temp_paths)
 
     def on_transcription_complete(
         self,
         transcript: str,
         raw_text: Optional[str] = None,
         cleanup_info: Optional[CleanupInfo] = None,
+        job: Optional[TranscriptionJob] = None,
     ) -> None:
-        """Handle transcription completion."""
+        """Handle transcription completion.
+
+        Args:
+            transcript: Final (possibly cleaned) text.
+            raw_text: Unprocessed ASR text when it differs from ``transcript``.
+            cleanup_info: Provider/model of the cleanup run, if any.
+            job: The finished job's metadata, for stats and history.
+        """
         self.controller.ui_controller.set_transcript(transcript, raw=raw_text)
         self.controller.ui_controller.set_status("Transcription complete!")
         self.controller.overlay_state_update.emit(OverlayState.NONE)
 
         transcription_time = None
-        if self.controller._transcription_start_time is not None:
-            transcription_time = time.time() - self.controller._transcription_start_time
-            self.controller._transcription_start_time = None
-
-        if transcription_time is not None:
+        if job is not None and job.start_time is not None:
+            transcription_time = time.time() - job.start_time
             self.controller.ui_controller.set_transcription_stats(
                 transcription_time,
-                self.controller._pending_audio_duration or 0.0,
-                self.controller._pending_file_size or 0,
+                job.audio_duration or 0.0,
+                job.file_size or 0,
             )
 
         try:
             model_info = self.controller._current_model_name
             if self.controller._current_model_name == "local_whisper":
                 local_backend = self.controller.transcription_backends.get("local_whisper")
-                if local_backend and hasattr(local_backend, "device_info"):
+                if local_backend and local_backend.device_info:
                     model_info = f"local_whisper ({local_backend.device_info})"
 
-            history_manager.add_entry(
-                text=transcript,
-                model=model_info,
-                source_audio_path=self.controller._pending_audio_path,
-                transcription_time=transcription_time,
-                audio_duration=self.controller._pending_audio_duration,
-                file_size=self.controller._pending_file_size,
-                raw_text=raw_text,
-                cleanup_provider=cleanup_info.provider if cleanup_info else None,
-                cleanup_model=cleanup_info.model if cleanup_info else None,
+            # Snapshot the recording now: the next recording replaces
+            # RECORDED_AUDIO_FILE by rename, possibly before the history
+            # worker gets to this entry. For the recorder's output this is
+            # a hard link; rotation and SQLite stay on the history worker so
+            # the paste below is not held up behind disk I/O.
+            audio_file = None
+            if job is not None and job.source_audio_path:
+                audio_file = history_manager.save_recording(job.source_audio_path)
+
+            self.controller.history_executor.submit(
+                self._save_history_entry,
+                dict(
+                    text=transcript,
+                    model=model_info,
+                    audio_file=audio_file,
+                    transcription_time=transcription_time,
+                    audio_duration=job.audio_duration if job else None,
+                    file_size=job.file_size if job else None,
+                    raw_text=raw_text,
+                    cleanup_provider=cleanup_info.provider if cleanup_info else None,
+                    cleanup_model=cleanup_info.model if cleanup_info else None,
+                ),
             )
-            self.controller.ui_controller.refresh_history()
-            logger.info("Transcription saved to history")
         except Exception as exc:
             logger.error(f"Failed to save transcription to history: {exc}")
-        finally:
-            self.controller._pending_audio_path = None
-            self.controller._pending_audio_duration = None
-            self.controller._pending_file_size = None
 
-        settings = settings_manager.load_all_settings()
-        copy_clipboard = settings.get(SettingsKey.COPY_CLIPBOARD, True)
-        auto_paste = settings.get(SettingsKey.AUTO_PASTE, True)
+        copy_clipboard = settings_manager.get(SettingsKey.COPY_CLIPBOARD, True)
+        auto_paste = settings_manager.get(SettingsKey.AUTO_PASTE, True)
 
         # Synthetic paste posts a key event, which needs macOS Accessibility
         # permission. Without it, degrade to clipboard so the text isn't lost and
@@ -410,7 +466,7 @@ class TranscriptionRuntime:
 
         if copy_clipboard or paste_blocked:
             try:
-                pyperclip.copy(transcript)
+                set_clipboard_text(transcript)
                 logger.info("Transcription copied to clipboard")
             except Exception as exc:
                 logger.error(f"Failed to copy to clipboard: {exc}")
@@ -435,6 +491,16 @@ class TranscriptionRuntime:
         else:
             self.controller.ui_controller.set_status("Ready")
 
+    def _save_history_entry(self, entry: Dict[str, Any]) -> None:
+        """Write a history entry (history worker thread)."""
+        try:
+            history_manager.add_entry(**entry)
+        except Exception as exc:
+            logger.error(f"Failed to save transcription to history: {exc}")
+            return
+        logger.info("Transcription saved to history")
+        self.controller.history_saved.emit()
+
     def on_transcription_error(self, error_message: str) -> None:
         """Handle transcription error."""
         self.controller.ui_controller.set_status(f"Error: {error_message}")
@@ -444,17 +510,23 @@ class TranscriptionRuntime:
     def on_model_changed(self, model_name: str) -> None:
         """Handle model selection change."""
         model_value = config.MODEL_VALUE_MAP.get(model_name)
-        if model_value and model_value in self.controller.transcription_backends:
-            self.controller.current_backend = self.controller.transcription_backends[
-                model_value
-            ]
+        if (
+            model_value == self.controller._current_model_name
+            and self.controller.current_backend is not None
+        ):
+            # Combo refreshes re-emit the active selection; nothing to switch,
+            # save or rebuild.
+            return
+        backend = self.controller.get_transcription_backend(model_value)
+        if backend is not None:
+            self.controller.current_backend = backend
             self.controller._current_model_name = model_value
             settings_manager.save_model_selection(model_value)
             logger.info(f"Switched to model: {model_value}")
 
             if model_value == "local_whisper":
                 local_backend = self.controller.transcription_backends.get("local_whisper")
-                if local_backend and hasattr(local_backend, "device_info"):
+                if local_backend:
                     self.controller.ui_controller.set_device_info(
                         local_backend.device_info
                     )
@@ -477,7 +549,23 @@ class TranscriptionRuntime:
         else:
             overlay.show_at_cursor(overlay.STATE_LARGE_FILE_PROCESSING)
 
-    def _submit_transcription_job(self, audio_path: str) -> None:
+    def _submit_transcription_job(
+        self, job: TranscriptionJob, priority: JobPriority
+    ) -> None:
+        """Queue the right transcription job for an audio file.
+
+        The single dispatch point for recordings, re-transcriptions and
+        uploads: decides whether the file must be split for the active backend
+        and shows the matching large-file overlay.
+
+        Args:
+            job: The file to transcribe, with its size already stat'd by the
+                caller; travels with the job to completion.
+            priority: Queue priority for the job.
+
+        Raises:
+            Exception: If the local model still needs to be downloaded.
+        """
         backend = self.controller.current_backend
         if not backend.is_available() and getattr(backend, "is_model_missing", False):
             # Trigger the consent/download flow, but never transcribe with a
@@ -488,7 +576,9 @@ class TranscriptionRuntime:
                 "and try again"
             )
 
-        needs_splitting, file_size_mb = audio_processor.check_file_size(audio_path)
+        needs_splitting, file_size_mb = audio_processor.check_file_size(
+            job.audio_path, job.file_size
+        )
         should_split = (
             needs_splitting and self.controller.current_backend.requires_file_splitting
         )
@@ -501,21 +591,18 @@ class TranscriptionRuntime:
             self.controller.status_update.emit(
                 f"Splitting large file ({file_size_mb:.1f} MB)..."
             )
-            self.controller.executor.submit(
-                self.transcribe_large_audio_file, audio_path
-            )
-        elif needs_splitting:
-            logger.info(
-                f"Large file ({file_size_mb:.2f} MB), processing without splitting"
-            )
-            self.show_large_file_overlay(file_size_mb, is_splitting=False)
-            self.controller.status_update.emit(
-                f"Processing large file ({file_size_mb:.1f} MB)..."
-            )
-            self.controller.executor.submit(
-                self.transcribe_audio_file, audio_path
-            )
+            run = self.transcribe_large_audio_file
         else:
-            self.controller.executor.submit(
-                self.transcribe_audio_file, audio_path
-            )
+            if needs_splitting:
+                logger.info(
+                    f"Large file ({file_size_mb:.2f} MB), processing without splitting"
+                )
+                self.show_large_file_overlay(file_size_mb, is_splitting=False)
+                self.controller.status_update.emit(
+                    f"Processing large file ({file_size_mb:.1f} MB)..."
+                )
+            run = self.transcribe_audio_file
+
+        self.controller.transcription_queue.submit(
+            run, job.audio_path, job, priority=priority, size=job.file_size
+        )
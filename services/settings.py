@@ -1,6 +1,7 @@
 """
 Settings management for the OpenWhisper application.
 """
+import copy
 import json
 import os
 import logging
@@ -139,17 +140,54 @@ class SettingsManager:
         """
         self.settings_file = settings_file or config.SETTINGS_FILE
         self._lock = threading.Lock()
+        # Raw file contents and their parsed form, keyed by (mtime_ns, size).
+        # Settings are read on hot paths such as stop-recording; a stat is far
+        # cheaper than re-reading and re-parsing the file, and still notices
+        # edits made outside the app.
+        self._cached_text: Optional[str] = None
+        self._cached_settings: Optional[Dict[str, Any]] = None
+        self._cached_signature: Optional[Tuple[int, int]] = None
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        """Return ``(mtime_ns, size)`` of the settings file, or None if missing."""
+        try:
+            stat = os.stat(self.settings_file)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _current_settings(self) -> Optional[Dict[str, Any]]:
+        """Return the shared parsed settings, re-reading only if the file changed.
+
+        The returned dict is the cache itself and must not be mutated.
+
+        Returns:
+            Parsed settings, or None if the file does not exist.
+        """
+        signature = self._file_signature()
+        if signature is None:
+            return None
+        if signature != self._cached_signature:
+            with open(self.settings_file, 'r') as f:
+                text = f.read()
+            self._cached_settings = json.loads(text)
+            self._cached_text = text
+            self._cached_signature = signature
+        return self._cached_settings
 
     def load_all_settings(self) -> Dict[str, Any]:
         """Load all settings from file.
 
+        The file is only re-read when its modification time or size changed
+        since the last load or save; each call still returns a fresh dict that
+        callers may mutate.
+
         Returns:
             Dictionary containing all settings, or empty dict on error.
         """
         try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    return json.load(f)
+            if self._current_settings() is not None:
+                return json.loads(self._cached_text)
         except Exception as e:
             logger.warning(f"Failed to load all settings: {e}")
 
@@ -165,8 +203,12 @@ class SettingsManager:
             Exception: If saving fails.
         """
         try:
+            text = json.dumps(settings, indent=2)
             with open(self.settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+                f.write(text)
+            self._cached_text = text
+            self._cached_settings = json.loads(text)
+            self._cached_signature = self._file_signature()
             logger.info("All settings saved successfully")
         except Exception as e:
             logger.error(f"Failed to save all settings: {e}")
@@ -179,11 +221,21 @@ class SettingsManager:
             key: Setting key to read.
             default: Value to return when the key is missing.
 
+        Unlike :meth:`load_all_settings` this does not build a fresh dict, so
+        a lookup on an unchanged file is a stat plus a dict access.
+
         Returns:
-            The stored value, or ``default`` if the key is absent or the file
-            cannot be read.
+            The stored value (a copy, for mutable values), or ``default`` if
+            the key is absent or the file cannot be read.
         """
-        return self.load_all_settings().get(key, default)
+        try:
+            settings = self._current_settings()
+        except Exception as e:
+            logger.warning(f"Failed to load all settings: {e}")
+            return default
+        if settings is None or key not in settings:
+            return default
+        return copy.deepcopy(settings[key])
 
     def save_setting(self, key: str, value: Any) -> None:
         """Save a single setting value.
@@ -232,8 +284,7 @@ class SettingsManager:
         try:
             settings = self.load_all_settings()
             settings[SettingsKey.HOTKEYS] = hotkeys
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            self.save_all_settings(settings)
             logger.info("Hotkey settings saved successfully")
         except Exception as e:
             logger.error(f"Failed to save settings: {e}")
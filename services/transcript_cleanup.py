@@ -4,6 +4,7 @@ Post-ASR transcript cleanup via OpenAI or OpenRouter chat models.
 import logging
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 from openai import OpenAI
@@ -90,6 +91,23 @@ def _provider_headers(provider: str) -> Optional[dict]:
     return None
 
 
+@lru_cache(maxsize=8)
+def _shared_client(provider: str, api_key: str) -> OpenAI:
+    """Return the process-wide chat client for a provider/key pair.
+
+    Each client owns a keep-alive connection pool, so sharing one across
+    cleanup runs, rule polishes and model-list fetches skips a fresh TCP/TLS
+    handshake per request. Keyed on the API key so a rotated key gets a new
+    client.
+    """
+    return OpenAI(
+        api_key=api_key,
+        base_url=_provider_base_url(provider),
+        default_headers=_provider_headers(provider),
+        timeout=config.TRANSCRIPT_CLEANUP_TIMEOUT_S,
+    )
+
+
 def find_api_key(provider: str) -> Optional[str]:
     """Get the provider's API key from environment variables or the .env file.
 
@@ -158,12 +176,7 @@ def list_cleanup_models(
         raise RuntimeError(
             f"No API key found for {provider} (set {provider_env_key(provider)})"
         )
-    client = OpenAI(
-        api_key=key,
-        base_url=_provider_base_url(provider),
-        default_headers=_provider_headers(provider),
-        timeout=15.0,
-    )
+    client = _shared_client(provider, key).with_options(timeout=15.0)
     server_sort = (
         provider == TranscriptCleanupProvider.OPENROUTER
         and sort
@@ -252,12 +265,7 @@ class TranscriptCleanup:
         """Initialize the chat client when a key is available."""
         if self.api_key:
             try:
-                self.client = OpenAI(
-                    api_key=self.api_key,
-                    base_url=_provider_base_url(self.provider),
-                    default_headers=_provider_headers(self.provider),
-                    timeout=config.TRANSCRIPT_CLEANUP_TIMEOUT_S,
-                )
+                self.client = _shared_client(self.provider, self.api_key)
                 logger.info(
                     "Transcript cleanup client initialized (%s)", self.provider
                 )
@@ -311,6 +319,23 @@ class TranscriptCleanup:
             return {"extra_body": {"reasoning": {"effort": self.reasoning}}}
         return {"reasoning_effort": self.reasoning}
 
+    @staticmethod
+    def _log_cached_prompt_tokens(response) -> None:
+        """Log how much of the prompt the provider served from its prefix cache.
+
+        The system prompt (base prompt plus learned rules) is static and sent
+        first, with the transcript last, so repeat cleanups share a prefix.
+        Providers that don't report cache usage are skipped.
+        """
+        usage = response.usage
+        details = usage.prompt_tokens_details if usage else None
+        cached = details.cached_tokens if details else None
+        if cached:
+            logger.debug(
+                "Transcript cleanup prompt cache hit: %s of %s prompt tokens",
+                cached, usage.prompt_tokens,
+            )
+
     def cleanup(self, text: str, system_prompt: Optional[str] = None) -> str:
         """Clean up transcript text, falling back to the original on failure.
 
@@ -323,7 +348,7 @@ class TranscriptCleanup:
             Cleaned text, or the original text if cleanup is skipped or fails.
             ``last_error`` is None afterwards only when cleanup succeeded.
         """
-        if not text or not text.strip():
+        if not text or text.isspace():
             self.last_error = "empty input"
             return text
 
@@ -343,6 +368,7 @@ class TranscriptCleanup:
                 ],
                 **self._request_options(),
             )
+            self._log_cached_prompt_tokens(response)
             cleaned = (response.choices[0].message.content or "").strip()
             if not cleaned:
                 self.last_error = "empty response"
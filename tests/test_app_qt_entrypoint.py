@@ -27,6 +27,44 @@ assert 'services.application_controller' not in sys.modules
     assert result.returncode == 0, result.stderr
 
 
+def test_windows_popen_patch_merges_create_no_window(monkeypatch):
+    import app_qt
+
+    create_no_window = 0x08000000
+    spawned = []
+
+    class _RecordingPopen:
+        def __init__(self, *args, **kwargs):
+            spawned.append(kwargs)
+
+    monkeypatch.setattr(app_qt.sys, "platform", "win32")
+    monkeypatch.setattr(
+        app_qt.subprocess, "CREATE_NO_WINDOW", create_no_window, raising=False
+    )
+    monkeypatch.setattr(app_qt.subprocess, "Popen", _RecordingPopen)
+
+    app_qt._patch_subprocess_for_windows()
+    app_qt.subprocess.Popen(["ffmpeg"])
+    app_qt.subprocess.Popen(["ffmpeg"], creationflags=0x200)
+
+    assert issubclass(app_qt.subprocess.Popen, _RecordingPopen)
+    assert spawned == [
+        {"creationflags": create_no_window},
+        {"creationflags": create_no_window | 0x200},
+    ]
+
+
+def test_popen_patch_is_a_no_op_off_windows(monkeypatch):
+    import app_qt
+
+    original = app_qt.subprocess.Popen
+    monkeypatch.setattr(app_qt.sys, "platform", "linux")
+
+    app_qt._patch_subprocess_for_windows()
+
+    assert app_qt.subprocess.Popen is original
+
+
 def test_frozen_startup_reuses_cuda_dlls_from_an_older_bundle(
     tmp_path, monkeypatch
 ):
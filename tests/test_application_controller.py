@@ -3,6 +3,7 @@
 import importlib
 import sys
 import tempfile
+import threading
 import time
 import types
 import unittest
@@ -16,7 +17,7 @@ class _BoundSignal:
     def __init__(self):
         self._handlers = []
 
-    def connect(self, handler):
+    def connect(self, handler, _connection_type=None):
         self._handlers.append(handler)
 
     def emit(self, *args, **kwargs):
@@ -72,6 +73,9 @@ class _Qt:
         CoarseTimer = 1
         VeryCoarseTimer = 2
 
+    class ConnectionType:
+        QueuedConnection = 2
+
 
 class FakeSettingsManager:
     def __init__(self):
@@ -125,6 +129,12 @@ class FakeRecorder:
     def set_streaming_callback(self, callback):
         self.streaming_callback = callback
 
+    def set_device(self, device_id):
+        if self.is_recording:
+            return False
+        self.device_id = device_id
+        return True
+
     def start_recording(self):
         self.is_recording = True
         return True
@@ -263,19 +273,33 @@ class FakeStreamingTranscriber:
 class FakeExecutor:
     def __init__(self):
         self.submissions = []
+        self.submission_kwargs = []
         self.shutdown_called = False
 
-    def submit(self, fn, *args):
+    def submit(self, fn, *args, **kwargs):
         self.submissions.append((fn, args))
+        self.submission_kwargs.append(kwargs)
         return types.SimpleNamespace()
 
     def shutdown(self, wait=True, cancel_futures=False):
         self.shutdown_called = True
 
 
+class ImmediateExecutor(FakeExecutor):
+    def submit(self, fn, *args, **kwargs):
+        super().submit(fn, *args, **kwargs)
+        fn(*args)
+        return types.SimpleNamespace()
+
+
 class FakeHistoryManager:
     def __init__(self):
         self.entries = []
+        self.saved_sources = []
+
+    def save_recording(self, source_path):
+        self.saved_sources.append(source_path)
+        return f"saved_{Path(source_path).name}"
 
     def add_entry(self, **kwargs):
         self.entries.append(kwargs)
@@ -285,12 +309,14 @@ class FakeHistoryManager:
 class FakeAudioProcessor:
     def __init__(self):
         self.check_result = (False, 1.0)
+        self.split_suffixes = (".part1", ".part2")
 
-    def check_file_size(self, _audio_path):
+    def check_file_size(self, _audio_path, _file_size_bytes=None):
         return self.check_result
 
-    def split_audio_file(self, audio_path, _callback):
-        return [audio_path + ".part1", audio_path + ".part2"]
+    def iter_split_audio_file(self, audio_path, _callback):
+        for suffix in self.split_suffixes:
+            yield audio_path + suffix
 
     def combine_transcriptions(self, transcriptions):
         return " ".join(transcriptions)
@@ -298,6 +324,12 @@ class FakeAudioProcessor:
     def cleanup_temp_files(self):
         pass
 
+    def detach_temp_files(self):
+        return ["chunks-dir"]
+
+    def remove_temp_files(self, temp_paths):
+        pass
+
 
 class FakeKeyboard:
     def __init__(self):
@@ -311,11 +343,11 @@ class FakeKeyboard:
         self.written.append(text)
 
 
-class FakePyperclip:
+class FakeClipboard:
     def __init__(self):
         self.copied = []
 
-    def copy(self, text):
+    def set_clipboard_text(self, text):
         self.copied.append(text)
 
 
@@ -370,6 +402,7 @@ class DummyUIController:
         self.overlay = DummyOverlay()
         self.is_recording = False
         self.statuses = []
+        self.streaming_text_updates = []
         self.device_infos = []
         self.engine_busy_states = []
         self.hotkeys = None
@@ -441,8 +474,8 @@ class DummyUIController:
     def update_audio_levels(self, _levels):
         pass
 
-    def update_streaming_text(self, _text, _is_final):
-        pass
+    def update_streaming_text(self, text, is_final):
+        self.streaming_text_updates.append((text, is_final))
 
     def show_streaming_overlay(self):
         self.streaming_overlay_shown += 1
@@ -476,7 +509,7 @@ class DummyUIController:
         self.cleaned_up = True
 
 
-def _install_module_stubs(settings_manager, history_manager, audio_processor, keyboard, pyperclip, db_state):
+def _install_module_stubs(settings_manager, history_manager, audio_processor, keyboard, clipboard, db_state):
     qtcore_module = types.ModuleType("PyQt6.QtCore")
     qtcore_module.QObject = _QObject
     qtcore_module.QTimer = _QTimer
@@ -591,8 +624,8 @@ def _install_module_stubs(settings_manager, history_manager, audio_processor, ke
     keyboard_module.send = keyboard.send
     keyboard_module.write = keyboard.write
 
-    pyperclip_module = types.ModuleType("pyperclip")
-    pyperclip_module.copy = pyperclip.copy
+    clipboard_module = types.ModuleType("ui_qt.utils.clipboard")
+    clipboard_module.set_clipboard_text = clipboard.set_clipboard_text
 
     return {
         "PyQt6": pyqt_module,
@@ -607,7 +640,7 @@ def _install_module_stubs(settings_manager, history_manager, audio_processor, ke
         "services.streaming_transcriber": streaming_module,
         "services.database": database_module,
         "keyboard": keyboard_module,
-        "pyperclip": pyperclip_module,
+        "ui_qt.utils.clipboard": clipboard_module,
     }
 
 
@@ -617,7 +650,7 @@ class TestApplicationController(unittest.TestCase):
         self.history_manager = FakeHistoryManager()
         self.audio_processor = FakeAudioProcessor()
         self.keyboard = FakeKeyboard()
-        self.pyperclip = FakePyperclip()
+        self.clipboard = FakeClipboard()
         self.db_state = {"closed": False}
 
         self.temp_dir = tempfile.TemporaryDirectory()
@@ -629,7 +662,7 @@ class TestApplicationController(unittest.TestCase):
             self.history_manager,
             self.audio_processor,
             self.keyboard,
-            self.pyperclip,
+            self.clipboard,
             self.db_state,
         )
         self.module_patcher = patch.dict(sys.modules, module_stubs)
@@ -638,6 +671,7 @@ class TestApplicationController(unittest.TestCase):
         for module_name in [
             "services.runtime",
             "services.runtime.hotkeys",
+            "services.runtime.job_queue",
             "services.runtime.streaming",
             "services.runtime.transcription",
             "services.application_controller",
@@ -646,6 +680,10 @@ class TestApplicationController(unittest.TestCase):
 
         self.app_controller_module = importlib.import_module("services.application_controller")
         self.hotkeys_runtime_module = importlib.import_module("services.runtime.hotkeys")
+        self.job_queue_module = importlib.import_module("services.runtime.job_queue")
+        self.transcription_module = importlib.import_module(
+            "services.runtime.transcription"
+        )
         self.watchdog_patcher = patch.object(
             self.hotkeys_runtime_module.HotkeyRuntime,
             "setup_hook_watchdog",
@@ -663,6 +701,10 @@ class TestApplicationController(unittest.TestCase):
         controller = self.app_controller_module.ApplicationController(DummyUIController())
         controller.executor.shutdown(wait=False)
         controller.executor = FakeExecutor()
+        controller.transcription_queue.shutdown(wait=False)
+        controller.transcription_queue = FakeExecutor()
+        controller.history_executor.shutdown(wait=False)
+        controller.history_executor = ImmediateExecutor()
         return controller
 
     def test_model_switch_updates_backend_and_device_info(self):
@@ -677,6 +719,34 @@ class TestApplicationController(unittest.TestCase):
         self.assertEqual(controller._current_model_name, "local_whisper")
         self.assertEqual(controller.ui_controller.device_infos[-1], "cpu")
 
+    def test_reselecting_active_model_is_a_no_op(self):
+        controller = self._create_controller()
+        controller.on_model_changed("API: GPT-4o Transcribe")
+        self.settings.saved_model_selection = None
+
+        with patch.object(
+            controller.streaming_runtime, "reconfigure_streaming"
+        ) as reconfigure:
+            controller.on_model_changed("API: GPT-4o Transcribe")
+
+        self.assertIsNone(self.settings.saved_model_selection)
+        reconfigure.assert_not_called()
+        self.assertEqual(controller._current_model_name, "api_gpt4o")
+
+    def test_api_backends_are_built_on_first_selection(self):
+        controller = self._create_controller()
+        self.assertEqual(list(controller.transcription_backends), ["local_whisper"])
+
+        controller.on_model_changed("API: GPT-4o Transcribe")
+        backend = controller.transcription_backends["api_gpt4o"]
+        self.assertIs(controller.current_backend, backend)
+        self.assertEqual(backend.model_type, "api_gpt4o")
+        self.assertNotIn("api_whisper", controller.transcription_backends)
+
+        controller.on_model_changed("Local Whisper")
+        controller.on_model_changed("API: GPT-4o Transcribe")
+        self.assertIs(controller.current_backend, backend)
+
     def test_reload_whisper_model_runs_in_background_and_reports(self):
         controller = self._create_controller()
 
@@ -802,25 +872,121 @@ class TestApplicationController(unittest.TestCase):
         self.assertFalse(controller._streaming_enabled)
         self.assertIn("Streaming mode disabled", controller.ui_controller.statuses)
 
+    def test_preloaded_streaming_backend_is_adopted_not_rebuilt(self):
+        preloaded = FakeLocalBackend(model_name="tiny.en")
+        controller = self.app_controller_module.ApplicationController(
+            DummyUIController(), streaming_backend=preloaded
+        )
+
+        self.assertIs(controller._streaming_backend, preloaded)
+        self.assertIs(controller.streaming_transcriber.backend, preloaded)
+        self.assertFalse(preloaded.cleaned_up)
+
+    def test_unused_preloaded_streaming_backend_is_released(self):
+        self.settings.all_settings["streaming_enabled"] = False
+        preloaded = FakeLocalBackend(model_name="tiny.en")
+        controller = self.app_controller_module.ApplicationController(
+            DummyUIController(), streaming_backend=preloaded
+        )
+
+        self.assertIsNone(controller._streaming_backend)
+        self.assertTrue(preloaded.cleaned_up)
+
+    def test_change_audio_device_reconfigures_recorder_in_place(self):
+        controller = self._create_controller()
+        recorder = controller.recorder
+        level_callback = recorder.audio_level_callback
+
+        controller.change_audio_device(3)
+
+        self.assertIs(controller.recorder, recorder)
+        self.assertEqual(recorder.device_id, 3)
+        self.assertIs(recorder.audio_level_callback, level_callback)
+        self.assertFalse(recorder.cleaned_up)
+        self.assertEqual(controller.ui_controller.statuses[-1], "Audio device changed")
+
+    def test_partial_transcription_is_one_signal_for_tab_and_overlay(self):
+        controller = self._create_controller()
+        emitted = []
+        controller.partial_transcription.connect(
+            lambda *payload: emitted.append(payload)
+        )
+
+        controller._streaming_enabled = True
+        controller.streaming_runtime.on_partial_transcription("hello", False)
+        controller._streaming_enabled = False
+        controller.streaming_runtime.on_partial_transcription("world", True)
+        self.assertEqual(emitted, [("hello", False, True), ("world", True, False)])
+
+        main_window = controller.ui_controller.main_window
+        self.assertEqual(main_window.partial_updates, [("hello", False), ("world", True)])
+        self.assertEqual(
+            controller.ui_controller.streaming_text_updates, [("hello", False)]
+        )
+
+    def test_unchanged_partial_transcription_is_not_re_emitted(self):
+        controller = self._create_controller()
+        emitted = []
+        controller.partial_transcription.connect(
+            lambda *payload: emitted.append(payload)
+        )
+        runtime = controller.streaming_runtime
+
+        runtime.on_partial_transcription("hello", False)
+        runtime.on_partial_transcription("hello", False)  # silence re-emit
+        runtime.on_partial_transcription("hello", True)
+        self.assertEqual(len(emitted), 2)
+
+        runtime.start_streaming_session()  # a new session starts fresh
+        runtime.on_partial_transcription("hello", True)
+        self.assertEqual(len(emitted), 3)
+
+    def test_audio_levels_are_coalesced_to_frame_rate_peaks(self):
+        controller = self._create_controller()
+        streaming_module = importlib.import_module("services.runtime.streaming")
+        emitted = []
+        controller.ui_controller.update_audio_levels = emitted.append
+
+        callback = controller.recorder.audio_level_callback
+        ms = 1_000_000
+        with patch.object(
+            streaming_module.time,
+            "perf_counter_ns",
+            side_effect=[100 * ms, 110 * ms, 120 * ms, 140 * ms],
+        ):
+            callback(0.2)  # first buffer always reaches the UI
+            callback(0.9)  # coalesced
+            callback(0.1)  # coalesced
+            callback(0.3)  # next frame: reports the 0.9 peak
+
+        self.assertEqual(len(emitted), 2)
+        self.assertEqual(emitted[0], [0.2] * 20)
+        self.assertEqual(emitted[1], [0.9] * 20)
+
     def test_stop_recording_chooses_normal_or_split_transcription_path(self):
         controller = self._create_controller()
 
         controller.recorder.is_recording = True
         self.audio_processor.check_result = (False, 1.0)
         controller.stop_recording()
-        self.assertEqual(len(controller.executor.submissions), 1)
+        self.assertEqual(len(controller.transcription_queue.submissions), 1)
+        self.assertEqual(
+            controller.transcription_queue.submissions[0][0].__name__,
+            "transcribe_audio_file",
+        )
         self.assertEqual(
-            controller.executor.submissions[0][0].__name__, "transcribe_audio_file"
+            controller.transcription_queue.submission_kwargs[0]["priority"],
+            self.job_queue_module.JobPriority.INTERACTIVE,
         )
 
-        controller.executor = FakeExecutor()
-        controller.current_backend = controller.transcription_backends["api_gpt4o"]
+        controller.transcription_queue = FakeExecutor()
+        controller.current_backend = controller.get_transcription_backend("api_gpt4o")
         controller.recorder.is_recording = True
         self.audio_processor.check_result = (True, 30.0)
         controller.stop_recording()
-        self.assertEqual(len(controller.executor.submissions), 1)
+        self.assertEqual(len(controller.transcription_queue.submissions), 1)
         self.assertEqual(
-            controller.executor.submissions[0][0].__name__,
+            controller.transcription_queue.submissions[0][0].__name__,
             "transcribe_large_audio_file",
         )
         self.assertEqual(controller.ui_controller.overlay.large_file_info, 30.0)
@@ -829,40 +995,141 @@ class TestApplicationController(unittest.TestCase):
             controller.ui_controller.overlay.shown_states,
         )
 
-    def test_transcription_complete_saves_history_and_resets_pending_state(self):
+    def test_large_file_chunks_are_deleted_off_the_job_thread(self):
+        controller = self._create_controller()
+        controller.current_backend = controller.get_transcription_backend("api_gpt4o")
+        job = self.transcription_module.TranscriptionJob("big.wav", 4096)
+
+        controller.transcription_runtime.transcribe_large_audio_file("big.wav", job)
+
+        self.assertEqual(controller.ui_controller.transcription_text, "api chunks")
+        self.assertEqual(
+            controller.executor.submissions,
+            [(self.audio_processor.remove_temp_files, (["chunks-dir"],))],
+        )
+
+    def test_large_file_reports_status_once_chunks_arrive(self):
+        controller = self._create_controller()
+        job = self.transcription_module.TranscriptionJob("big.wav", 4096)
+
+        controller.transcription_runtime.transcribe_large_audio_file("big.wav", job)
+
+        self.assertIn("Transcribing chunks...", controller.ui_controller.statuses)
+        self.assertEqual(
+            controller.ui_controller.transcription_text,
+            "big.wav.part1 big.wav.part2",
+        )
+
+    def test_large_file_with_no_chunks_fails(self):
+        controller = self._create_controller()
+        job = self.transcription_module.TranscriptionJob("big.wav", 4096)
+        self.audio_processor.split_suffixes = ()
+
+        controller.transcription_runtime.transcribe_large_audio_file("big.wav", job)
+
+        self.assertEqual(
+            controller.ui_controller.transcription_text,
+            "Error: Failed to split audio file",
+        )
+        self.assertEqual(self.history_manager.entries, [])
+
+    def test_retranscribe_and_upload_queue_behind_interactive_jobs(self):
         controller = self._create_controller()
-        controller._pending_audio_path = "source.wav"
-        controller._pending_audio_duration = 9.5
-        controller._pending_file_size = 2048
-        controller._transcription_start_time = time.time() - 1.0
+        clip_path = str(Path(self.temp_dir.name) / "clip.wav")
+        Path(clip_path).write_bytes(b"x" * 512)
+        priority = self.job_queue_module.JobPriority
 
-        controller._on_transcription_complete("hello world", None)
+        controller.retranscribe_audio(clip_path)
+        controller.upload_audio_file(clip_path)
+
+        kwargs = controller.transcription_queue.submission_kwargs
+        self.assertEqual(
+            [k["priority"] for k in kwargs],
+            [priority.RETRANSCRIBE, priority.UPLOAD],
+        )
+        self.assertEqual([k["size"] for k in kwargs], [512, 512])
+        # Model-management work stays on the executor.
+        self.assertEqual(controller.executor.submissions, [])
+
+    def _job(self, **kwargs):
+        kwargs.setdefault("audio_path", "source.wav")
+        kwargs.setdefault("source_audio_path", kwargs["audio_path"])
+        return self.transcription_module.TranscriptionJob(**kwargs)
+
+    def test_transcription_complete_saves_history_from_job_metadata(self):
+        controller = self._create_controller()
+        job = self._job(
+            audio_duration=9.5, file_size=2048, start_time=time.time() - 1.0
+        )
+
+        controller._on_transcription_complete("hello world", None, None, job)
 
         self.assertEqual(len(self.history_manager.entries), 1)
         entry = self.history_manager.entries[0]
         self.assertEqual(entry["text"], "hello world")
         self.assertIsNone(entry.get("raw_text"))
-        self.assertEqual(entry["source_audio_path"], "source.wav")
+        self.assertEqual(entry["audio_file"], "saved_source.wav")
         self.assertEqual(entry["audio_duration"], 9.5)
         self.assertEqual(entry["file_size"], 2048)
         self.assertTrue(controller.ui_controller.refreshed_history)
-        self.assertEqual(self.pyperclip.copied[-1], "hello world")
-        self.assertIsNone(controller._pending_audio_path)
-        self.assertIsNone(controller._pending_audio_duration)
-        self.assertIsNone(controller._pending_file_size)
+        self.assertEqual(self.clipboard.copied[-1], "hello world")
+        self.assertIsNotNone(entry["transcription_time"])
 
-    def test_transcription_complete_stores_raw_and_fixed_text(self):
+    def test_overlapping_jobs_keep_their_own_history_metadata(self):
         controller = self._create_controller()
-        controller._pending_audio_path = "source.wav"
+        upload_path = str(Path(self.temp_dir.name) / "upload.wav")
+        Path(upload_path).write_bytes(b"x" * 512)
 
-        controller._on_transcription_complete("Fixed sentence.", "um fixed sentence")
+        controller.upload_audio_file(upload_path)
+        controller.recorder.is_recording = True
+        controller.stop_recording()
+
+        # The queue runs the recording first; the upload finishes last.
+        for fn, args in reversed(controller.transcription_queue.submissions):
+            fn(*args)
+
+        recorded, uploaded = self.history_manager.entries
+        self.assertEqual(
+            recorded["audio_file"],
+            f"saved_{Path(config.RECORDED_AUDIO_FILE).name}",
+        )
+        self.assertEqual(recorded["audio_duration"], 12.5)
+        self.assertEqual(recorded["file_size"], 256)
+        self.assertIsNone(uploaded["audio_file"])
+        self.assertEqual(self.history_manager.saved_sources, [config.RECORDED_AUDIO_FILE])
+        self.assertIsNone(uploaded["audio_duration"])
+        self.assertEqual(uploaded["file_size"], 512)
+
+    def test_transcription_complete_writes_history_off_the_ui_path(self):
+        controller = self._create_controller()
+        controller.history_executor = FakeExecutor()
+
+        controller._on_transcription_complete("hello world", None, None, self._job())
+
+        # Clipboard is handled immediately; the history write is only queued.
+        self.assertEqual(self.clipboard.copied[-1], "hello world")
+        self.assertEqual(self.history_manager.entries, [])
+        self.assertFalse(controller.ui_controller.refreshed_history)
+        # The recording is snapshotted before the next one can replace it.
+        self.assertEqual(self.history_manager.saved_sources, ["source.wav"])
+
+        fn, args = controller.history_executor.submissions[0]
+        fn(*args)
+        self.assertEqual(self.history_manager.entries[0]["audio_file"], "saved_source.wav")
+        self.assertTrue(controller.ui_controller.refreshed_history)
+
+    def test_transcription_complete_stores_raw_and_fixed_text(self):
+        controller = self._create_controller()
+        controller._on_transcription_complete(
+            "Fixed sentence.", "um fixed sentence", None, self._job()
+        )
 
         entry = self.history_manager.entries[0]
         self.assertEqual(entry["text"], "Fixed sentence.")
         self.assertEqual(entry["raw_text"], "um fixed sentence")
         self.assertEqual(controller.ui_controller.transcription_text, "Fixed sentence.")
         self.assertEqual(controller.ui_controller.transcription_raw, "um fixed sentence")
-        self.assertEqual(self.pyperclip.copied[-1], "Fixed sentence.")
+        self.assertEqual(self.clipboard.copied[-1], "Fixed sentence.")
 
     def test_transcribe_audio_file_applies_cleanup_when_enabled(self):
         controller = self._create_controller()
@@ -912,6 +1179,8 @@ class TestApplicationController(unittest.TestCase):
         controller = self._create_controller()
 
         class _Backend:
+            is_transcribing = False
+
             def transcribe(self, path):
                 return f"clip transcript for {path}"
 
@@ -952,6 +1221,43 @@ class TestApplicationController(unittest.TestCase):
         self.assertTrue(controller.executor.shutdown_called)
         self.assertTrue(controller.ui_controller.cleaned_up)
         self.assertTrue(self.db_state["closed"])
+        self.assertFalse(controller.shutdown_incomplete)
+
+    def test_cleanup_releases_local_and_api_backends(self):
+        controller = self._create_controller()
+        local_backend = controller.transcription_backends["local_whisper"]
+        api_backend = controller.get_transcription_backend("api_gpt4o")
+
+        controller.cleanup()
+
+        self.assertTrue(local_backend.cleaned_up)
+        self.assertTrue(api_backend.cleaned_up)
+        self.assertEqual(controller.transcription_backends, {})
+        self.assertIsNone(controller.current_backend)
+
+    def test_cleanup_does_not_wait_forever_on_a_running_job(self):
+        controller = self._create_controller()
+        release = threading.Event()
+
+        class _StuckExecutor(FakeExecutor):
+            def shutdown(self, wait=True, cancel_futures=False):
+                super().shutdown(wait, cancel_futures)
+                if wait:
+                    release.wait(5)
+
+        controller.executor = _StuckExecutor()
+        local_backend = controller.transcription_backends["local_whisper"]
+
+        with patch.object(self.app_controller_module, "EXECUTOR_DRAIN_TIMEOUT_S", 0.05):
+            started = time.monotonic()
+            controller.cleanup()
+            elapsed = time.monotonic() - started
+        release.set()
+
+        self.assertLess(elapsed, 2.0)
+        self.assertTrue(local_backend.cleaned_up)
+        self.assertTrue(controller.ui_controller.cleaned_up)
+        self.assertTrue(controller.shutdown_incomplete)
 
     # ── Model Manager download/delete orchestration ────────────────
 
@@ -0,0 +1,18 @@
+"""Tests for AudioProcessor.combine_transcriptions."""
+import pytest
+
+from services.audio_processor import AudioProcessor
+
+
+@pytest.mark.parametrize(
+    ("chunks", "expected"),
+    [
+        ([], ""),
+        (["", "   "], ""),
+        (["Hello there.", "General Kenobi."], "Hello there. General Kenobi."),
+        ([" padded ", "", "chunk  with   gaps "], "padded chunk with gaps"),
+        (["one"], "one"),
+    ],
+)
+def test_combine_transcriptions(chunks, expected):
+    assert AudioProcessor().combine_transcriptions(chunks) == expected
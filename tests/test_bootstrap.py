@@ -1,5 +1,8 @@
 """Unit tests for the extracted Qt bootstrap flow."""
 
+import os
+import signal
+import tempfile
 import unittest
 from unittest.mock import patch
 
@@ -68,14 +71,17 @@ class _FakeBackend:
 
 class _FakeApplicationController:
     should_raise = False
+    stall_shutdown = False
     instances = []
 
-    def __init__(self, ui_controller, local_backend=None):
+    def __init__(self, ui_controller, local_backend=None, streaming_backend=None):
         if self.should_raise:
             raise RuntimeError("controller init failed")
         self.ui_controller = ui_controller
         self.local_backend = local_backend
+        self.streaming_backend = streaming_backend
         self.cleaned_up = False
+        self.shutdown_incomplete = False
         self.main_ui_ready_notified = False
         self.transcription_backends = {"local_whisper": _FakeBackend("cuda")}
         self.__class__.instances.append(self)
@@ -85,14 +91,17 @@ class _FakeApplicationController:
 
     def cleanup(self):
         self.cleaned_up = True
+        self.shutdown_incomplete = self.stall_shutdown
 
 
 class TestBootstrap(unittest.TestCase):
     def setUp(self):
         _FakeApplicationController.instances = []
         _FakeApplicationController.should_raise = False
+        _FakeApplicationController.stall_shutdown = False
 
     @patch("services.settings.is_hf_hub_offline_env_set", return_value=False)
+    @patch.object(bootstrap, "load_streaming_preview_backend", return_value=None)
     @patch.object(bootstrap, "load_local_whisper_backend", return_value=None)
     @patch.object(bootstrap, "run_with_ui_pulse", side_effect=lambda fn: fn())
     @patch.object(bootstrap, "process_qt_events")
@@ -103,6 +112,7 @@ class TestBootstrap(unittest.TestCase):
         _mock_process_events,
         _mock_pulse,
         _mock_load_backend,
+        _mock_load_streaming_backend,
         _mock_hf_env,
     ):
         qt_app = _FakeQtApplication()
@@ -142,6 +152,7 @@ class TestBootstrap(unittest.TestCase):
         self.assertLess(order.index("process_events"), order.index("late_imports"))
 
     @patch("services.settings.is_hf_hub_offline_env_set", return_value=False)
+    @patch.object(bootstrap, "load_streaming_preview_backend", return_value=None)
     @patch.object(bootstrap, "load_local_whisper_backend", return_value=None)
     @patch.object(bootstrap, "run_with_ui_pulse", side_effect=lambda fn: fn())
     @patch.object(bootstrap, "process_qt_events")
@@ -152,6 +163,7 @@ class TestBootstrap(unittest.TestCase):
         _mock_process_events,
         _mock_pulse,
         _mock_load_backend,
+        _mock_load_streaming_backend,
         _mock_hf_env,
     ):
         qt_app = _FakeQtApplication()
@@ -175,6 +187,129 @@ class TestBootstrap(unittest.TestCase):
         self.assertEqual(len(_FakeApplicationController.instances), 1)
         self.assertTrue(_FakeApplicationController.instances[0].cleaned_up)
 
+    @patch("services.settings.is_hf_hub_offline_env_set", return_value=False)
+    @patch.object(bootstrap, "load_streaming_preview_backend", return_value=None)
+    @patch.object(bootstrap, "load_local_whisper_backend", return_value=None)
+    @patch.object(bootstrap, "run_with_ui_pulse", side_effect=lambda fn: fn())
+    @patch.object(bootstrap, "process_qt_events")
+    @patch.object(bootstrap, "setup_logging")
+    def test_main_force_exits_when_background_jobs_stall_shutdown(
+        self,
+        _mock_setup_logging,
+        _mock_process_events,
+        _mock_pulse,
+        _mock_load_backend,
+        _mock_load_streaming_backend,
+        _mock_hf_env,
+    ):
+        _FakeApplicationController.stall_shutdown = True
+        qt_app = _FakeQtApplication()
+        ui_controller = _FakeUIController()
+        loading_screen = _FakeLoadingScreen()
+
+        with patch.object(
+            bootstrap,
+            "get_early_runtime_components",
+            return_value=(lambda: qt_app, lambda: loading_screen),
+        ), patch.object(
+            bootstrap,
+            "get_late_runtime_components",
+            return_value=(lambda: ui_controller, _FakeApplicationController),
+        ), patch.object(bootstrap.logging, "shutdown"), patch.object(
+            bootstrap.os, "_exit"
+        ) as force_exit:
+            bootstrap.main()
+
+        self.assertTrue(_FakeApplicationController.instances[0].cleaned_up)
+        force_exit.assert_called_once_with(123)
+
+class CrashLoggingTests(unittest.TestCase):
+    def test_faulthandler_writes_to_raw_append_fd(self):
+        with tempfile.TemporaryDirectory() as temp_dir, patch.object(
+            bootstrap.config, "LOG_FILE", os.path.join(temp_dir, "openwhisper.log")
+        ), patch.object(bootstrap, "_CRASH_LOG_FILE", None), patch.object(
+            bootstrap.faulthandler, "enable"
+        ) as enable, patch.object(bootstrap.faulthandler, "register") as register:
+            bootstrap._enable_crash_logging()
+            fd = bootstrap._CRASH_LOG_FILE
+            try:
+                self.assertIsInstance(fd, int)
+                enable.assert_called_once_with(file=fd, all_threads=True)
+                # Fatal signals are covered by enable(); only the on-demand
+                # stack dump signal is registered.
+                registered = [call.args[0] for call in register.call_args_list]
+                expected = [signal.SIGUSR1] if hasattr(signal, "SIGUSR1") else []
+                self.assertEqual(registered, expected)
+                self.assertTrue(
+                    os.path.exists(os.path.join(temp_dir, "openwhisper.crash.log"))
+                )
+            finally:
+                os.close(fd)
+
+
+class QtMessageHandlerTests(unittest.TestCase):
+    def _install(self):
+        from PyQt6.QtCore import QtMsgType
+
+        installed = []
+        with patch.object(bootstrap, "_QT_MESSAGE_HANDLER_INSTALLED", False), patch(
+            "PyQt6.QtCore.qInstallMessageHandler", side_effect=installed.append
+        ):
+            bootstrap._install_qt_message_handler()
+        return installed[0], QtMsgType
+
+    def test_maps_qt_levels_and_appends_context(self):
+        handler, QtMsgType = self._install()
+
+        class _Context:
+            file = "qwidget.cpp"
+            line = 42
+            function = "show"
+
+        with self.assertLogs("qt", level="DEBUG") as captured:
+            handler(QtMsgType.QtCriticalMsg, _Context(), "bad thing")
+
+        self.assertEqual(captured.records[0].levelname, "ERROR")
+        self.assertEqual(
+            captured.records[0].getMessage(), "bad thing (qwidget.cpp:42 show)"
+        )
+
+    def test_suppressed_levels_skip_context_formatting(self):
+        handler, QtMsgType = self._install()
+
+        class _ExplodingContext:
+            @property
+            def file(self):
+                raise AssertionError("context read for a suppressed message")
+
+        qt_logger = bootstrap.logging.getLogger("qt")
+        with patch.object(qt_logger, "isEnabledFor", return_value=False), patch.object(
+            qt_logger, "log"
+        ) as log:
+            handler(QtMsgType.QtDebugMsg, _ExplodingContext(), "chatty")
+
+        log.assert_not_called()
+
+
+class RunWithUiPulseTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from PyQt6.QtWidgets import QApplication
+
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_returns_as_soon_as_worker_finishes(self):
+        # The worker's quit is queued before loop.exec() starts; it must still
+        # end the loop rather than hang.
+        self.assertEqual(bootstrap.run_with_ui_pulse(lambda: 42), 42)
+
+    def test_reraises_worker_error_on_main_thread(self):
+        def fail():
+            raise ValueError("load failed")
+
+        with self.assertRaisesRegex(ValueError, "load failed"):
+            bootstrap.run_with_ui_pulse(fail)
+
 
 class CudaPreloadSummaryTests(unittest.TestCase):
     """The Linux CUDA preload log must survive being run as ``__main__``.
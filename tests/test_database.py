@@ -39,6 +39,19 @@ class TestDatabaseManager:
         assert "meeting_chunks" not in table_names
         assert "meeting_insights" not in table_names
 
+    def test_connection_uses_wal_journal(self, temp_db):
+        """File-backed databases run in WAL mode with NORMAL sync."""
+        from sqlalchemy import text
+
+        with temp_db.engine.connect() as conn:
+            journal_mode = conn.execute(text("PRAGMA journal_mode")).scalar()
+            synchronous = conn.execute(text("PRAGMA synchronous")).scalar()
+            foreign_keys = conn.execute(text("PRAGMA foreign_keys")).scalar()
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+        assert foreign_keys == 1
+
     def test_history_crud(self, temp_db):
         """Test history entry create, read, update, delete."""
         entry_id = str(uuid.uuid4())
@@ -57,6 +70,7 @@ class TestDatabaseManager:
 
         entries = temp_db.get_history_entries()
         assert len(entries) == 1
+        assert temp_db.count_history_entries() == 1
         assert entries[0].id == entry_id
         assert entries[0].text == "Test transcription"
 
@@ -70,6 +84,40 @@ class TestDatabaseManager:
         entry = temp_db.get_history_entry_by_id(entry_id)
         assert entry is None
 
+        assert temp_db.delete_history_entry(entry_id) is False
+
+    def test_add_history_entries_inserts_batch(self, temp_db):
+        """Several entries are written in one call."""
+        from services.models import TranscriptionHistory
+
+        entries = [
+            TranscriptionHistory.create(text=f"entry {i}", model="local_whisper")
+            for i in range(3)
+        ]
+
+        temp_db.add_history_entries(entries)
+
+        assert temp_db.count_history_entries() == 3
+        assert {e.text for e in temp_db.get_history_entries()} == {
+            "entry 0", "entry 1", "entry 2",
+        }
+
+    def test_clear_history_audio_files(self, temp_db):
+        """Audio references for every listed filename are cleared at once."""
+        for audio_file in ("a.wav", "b.wav", "c.wav"):
+            temp_db.add_history_entry(
+                entry_id=str(uuid.uuid4()),
+                text=audio_file,
+                timestamp=datetime.now().isoformat(),
+                model="local_whisper",
+                audio_file=audio_file,
+            )
+
+        temp_db.clear_history_audio_files(["a.wav", "c.wav"])
+
+        remaining = {entry.text: entry.audio_file for entry in temp_db.get_history_entries()}
+        assert remaining == {"a.wav": None, "b.wav": "b.wav", "c.wav": None}
+
     def test_migration_removes_meeting_tables(self, tmp_path):
         """Verify schema v7 drops all meeting-mode tables."""
         db_path = str(tmp_path / "legacy.db")
@@ -143,7 +191,7 @@ class TestDatabaseManager:
             assert "meeting_insights" not in tables
             assert "meeting_chunks" not in tables
             assert "meetings" not in tables
-            assert version == 9
+            assert version == 10
         finally:
             manager.close()
 
@@ -211,7 +259,7 @@ class TestDatabaseManager:
             assert "raw_text" in columns
             assert "cleanup_provider" in columns
             assert "cleanup_model" in columns
-            assert version == SCHEMA_VERSION == 9
+            assert version == SCHEMA_VERSION == 10
         finally:
             manager.close()
 
@@ -281,7 +329,52 @@ class TestDatabaseManager:
 
             assert "cleanup_provider" in columns
             assert "cleanup_model" in columns
-            assert version == SCHEMA_VERSION == 9
+            assert version == SCHEMA_VERSION == 10
+        finally:
+            manager.close()
+
+    def test_migration_indexes_audio_file(self, tmp_path):
+        """Verify schema v10 adds the partial audio_file index to a v9 DB."""
+        db_path = str(tmp_path / "legacy_v9.db")
+
+        import sqlite3
+
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("CREATE TABLE schema_version (version INTEGER PRIMARY KEY)")
+            conn.execute("INSERT INTO schema_version(version) VALUES (9)")
+            conn.execute(
+                """
+                CREATE TABLE transcription_history (
+                    id TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    raw_text TEXT,
+                    timestamp TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    audio_file TEXT,
+                    transcription_time REAL,
+                    audio_duration REAL,
+                    file_size INTEGER,
+                    cleanup_provider TEXT,
+                    cleanup_model TEXT
+                )
+                """
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        from services.database import DatabaseManager
+
+        manager = DatabaseManager(db_path=db_path)
+        try:
+            with manager.engine.connect() as connection:
+                plan = connection.exec_driver_sql(
+                    "EXPLAIN QUERY PLAN UPDATE transcription_history "
+                    "SET audio_file = NULL WHERE audio_file IN ('a.wav', 'b.wav')"
+                ).fetchall()
+
+            assert any("idx_history_audio_file" in row[-1] for row in plan)
         finally:
             manager.close()
 
@@ -338,5 +431,62 @@ class TestJsonMigration:
         finally:
             config.config.HISTORY_FILE = original_history
 
+    def test_history_migration_overwrites_existing_backup(self, tmp_path):
+        """A leftover .bak from an earlier run does not block the backup."""
+        history_data = {
+            "entries": [
+                {"id": str(uuid.uuid4()), "text": "Café", "timestamp": "t", "model": "m"},
+            ]
+        }
+        json_path = tmp_path / "transcription_history.json"
+        json_path.write_text(json.dumps(history_data, ensure_ascii=False), encoding="utf-8-sig")
+        backup_path = tmp_path / "transcription_history.json.bak"
+        backup_path.write_text("stale")
+
+        import config
+
+        original_history = config.config.HISTORY_FILE
+        config.config.HISTORY_FILE = str(json_path)
+
+        try:
+            from services.database import DatabaseManager
+
+            manager = DatabaseManager(db_path=str(tmp_path / "test.db"))
+            entries = manager.get_history_entries()
+            assert [entry.text for entry in entries] == ["Café"]
+            assert not json_path.exists()
+            assert backup_path.read_text(encoding="utf-8-sig") != "stale"
+            manager.close()
+        finally:
+            config.config.HISTORY_FILE = original_history
+
+    def test_history_migration_keeps_last_duplicate(self, tmp_path):
+        """Duplicate ids in the JSON file resolve to the last entry."""
+        entry_id = str(uuid.uuid4())
+        history_data = {
+            "entries": [
+                {"id": entry_id, "text": "first", "timestamp": "t1", "model": "m"},
+                {"id": entry_id, "text": "second", "timestamp": "t2", "model": "m"},
+            ]
+        }
+        json_path = tmp_path / "transcription_history.json"
+        with open(json_path, "w") as f:
+            json.dump(history_data, f)
+
+        import config
+
+        original_history = config.config.HISTORY_FILE
+        config.config.HISTORY_FILE = str(json_path)
+
+        try:
+            from services.database import DatabaseManager
+
+            manager = DatabaseManager(db_path=str(tmp_path / "test.db"))
+            entries = manager.get_history_entries()
+            assert [entry.text for entry in entries] == ["second"]
+            manager.close()
+        finally:
+            config.config.HISTORY_FILE = original_history
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -88,5 +88,85 @@ class TestHotkeyManager(unittest.TestCase):
         self.assertIs(manager.on_record_toggle, callback)
 
 
+with patch.dict(sys.modules, {"keyboard": keyboard_stub, "config": config_stub}):
+    from services import _hotkey_keyboard, _hotkey_win32
+
+
+class TestWin32HotkeyBackend(unittest.TestCase):
+    """Test cases for the Windows RegisterHotKey path."""
+
+    def test_vk_for_resolves_keyboard_library_names(self):
+        self.assertEqual(_hotkey_win32.vk_for("kp *"), (0x6A, frozenset()))
+        self.assertEqual(_hotkey_win32.vk_for("r"), (ord("R"), frozenset()))
+        self.assertEqual(_hotkey_win32.vk_for("f5"), (0x74, frozenset()))
+        self.assertEqual(_hotkey_win32.vk_for("escape"), (0x1B, frozenset()))
+        self.assertIsNone(_hotkey_win32.vk_for("kp ?"))
+        self.assertIsNone(_hotkey_win32.vk_for(None))
+
+    @patch.object(_hotkey_keyboard.HotkeyManager, "_setup_keyboard_hook")
+    def test_disabled_state_registers_only_enable_toggle(self, _mock_setup):
+        """While STT is off, the other combos must reach other applications."""
+        manager = _hotkey_keyboard.HotkeyManager()
+        registrar = types.SimpleNamespace(calls=[])
+        registrar.register_hotkeys = lambda hotkeys: registrar.calls.append(dict(hotkeys)) or True
+        manager._win32_registrar = registrar
+
+        manager.trigger_action("enable_disable")
+        self.assertFalse(manager.program_enabled)
+        self.assertEqual(registrar.calls[-1], {"enable_disable": "ctrl+alt+kp *"})
+
+        manager.trigger_action("enable_disable")
+        self.assertEqual(registrar.calls[-1], manager.hotkeys)
+
+    @patch.object(_hotkey_keyboard.HotkeyManager, "_setup_keyboard_hook")
+    def test_trigger_action_ignores_actions_while_disabled(self, _mock_setup):
+        manager = _hotkey_keyboard.HotkeyManager()
+        calls = []
+        manager.on_cancel = lambda: calls.append("cancel")
+        manager.program_enabled = False
+
+        with patch.object(_hotkey_keyboard.threading, "Thread") as thread:
+            manager.trigger_action("cancel")
+        thread.assert_not_called()
+
+    def test_send_paste_input_posts_ctrl_v_in_one_batch(self):
+        calls = []
+
+        def send_input(count, events, size):
+            calls.append([
+                (events[i].union.ki.wVk, events[i].union.ki.dwFlags)
+                for i in range(count)
+            ])
+            return count
+
+        user32 = types.SimpleNamespace(SendInput=send_input)
+        with patch.object(_hotkey_win32, "_user32", user32):
+            self.assertTrue(_hotkey_win32.send_paste_input())
+
+        self.assertEqual(
+            calls, [[(0x11, 0), (0x56, 0), (0x56, 0x0002), (0x11, 0x0002)]]
+        )
+
+    @patch.dict(
+        sys.modules,
+        {"services._hotkey_win32": _hotkey_win32, "keyboard": keyboard_stub},
+    )
+    def test_send_paste_falls_back_when_send_input_is_blocked(self):
+        sent = []
+        with patch.object(_hotkey_win32, "send_paste_input", return_value=False), \
+                patch.object(keyboard_stub, "send", sent.append, create=True):
+            _hotkey_keyboard.send_paste()
+        self.assertEqual(sent, ["ctrl+v"])
+
+        sent.clear()
+        with patch.object(_hotkey_win32, "send_paste_input", return_value=True), \
+                patch.object(keyboard_stub, "send", sent.append, create=True):
+            _hotkey_keyboard.send_paste()
+        self.assertEqual(sent, [])
+
+    def test_importing_backend_does_not_load_keyboard_library(self):
+        self.assertFalse(hasattr(_hotkey_keyboard, "keyboard"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,92 @@
+"""Tests for the OpenAI backend's chunked transcription.
+
+Chunk uploads run concurrently, so these pin that results still recombine in
+chunk order, that a cancel stops the remaining uploads, and that a lazy chunk
+iterator is consumed while earlier chunks upload.
+"""
+
+import threading
+import time
+
+import pytest
+
+from transcriber import openai_backend as module
+
+
+@pytest.fixture
+def backend(monkeypatch, tmp_path):
+    """An OpenAIBackend whose client echoes the uploaded chunk's contents."""
+    calls = []
+
+    class _Transcriptions:
+        def create(self, model, file, response_format):
+            name = file.read().decode()
+            calls.append(name)
+            # Later chunks finish first, so completion order != chunk order.
+            time.sleep(0.02 * (4 - int(name[-1])))
+            return f" text {name} "
+
+    class _Client:
+        def __init__(self, api_key):
+            self.audio = type("Audio", (), {"transcriptions": _Transcriptions()})()
+
+    monkeypatch.setattr(module, "OpenAI", _Client)
+    instance = module.OpenAIBackend("api_whisper", api_key="sk-test")
+
+    chunks = []
+    for index in range(4):
+        path = tmp_path / f"chunk{index}.wav"
+        path.write_bytes(f"chunk{index}".encode())
+        chunks.append(str(path))
+    return instance, chunks, calls
+
+
+def test_chunks_recombine_in_order(backend):
+    instance, chunks, calls = backend
+
+    text = instance.transcribe_chunks(chunks)
+
+    assert text == "text chunk0 text chunk1 text chunk2 text chunk3"
+    assert sorted(calls) == ["chunk0", "chunk1", "chunk2", "chunk3"]
+    assert instance.is_transcribing is False
+
+
+def test_cancel_stops_remaining_uploads(backend, monkeypatch):
+    instance, chunks, calls = backend
+    monkeypatch.setattr(module, "MAX_CONCURRENT_CHUNK_UPLOADS", 1)
+    first_started = threading.Event()
+
+    original_create = instance.client.audio.transcriptions.create
+
+    def create_then_cancel(**kwargs):
+        result = original_create(**kwargs)
+        instance.cancel_transcription()
+        first_started.set()
+        return result
+
+    instance.client.audio.transcriptions.create = create_then_cancel
+
+    with pytest.raises(Exception, match="canceled"):
+        instance.transcribe_chunks(chunks)
+
+    assert first_started.is_set()
+    assert calls == ["chunk0"]
+
+
+def test_uploads_start_while_chunks_are_still_produced(backend):
+    instance, chunks, calls = backend
+    upload_started_before_more_chunks = []
+
+    def lazy_chunks():
+        yield chunks[0]
+        # The splitter is still "writing" chunk1; chunk0 should be uploading.
+        deadline = time.monotonic() + 2
+        while not calls and time.monotonic() < deadline:
+            time.sleep(0.005)
+        upload_started_before_more_chunks.append(bool(calls))
+        yield from chunks[1:]
+
+    text = instance.transcribe_chunks(lazy_chunks())
+
+    assert upload_started_before_more_chunks == [True]
+    assert text == "text chunk0 text chunk1 text chunk2 text chunk3"
@@ -143,6 +143,26 @@ class TestAudioRecorder(unittest.TestCase):
         if os.path.exists(config.RECORDED_AUDIO_FILE):
             os.remove(config.RECORDED_AUDIO_FILE)
 
+    def test_set_device_keeps_callbacks(self):
+        """Switching devices while idle should keep the recorder's wiring."""
+        def callback(level):
+            pass
+
+        self.recorder.set_audio_level_callback(callback)
+
+        self.assertTrue(self.recorder.set_device(2))
+
+        self.assertEqual(self.recorder.device_id, 2)
+        self.assertIs(self.recorder.audio_level_callback, callback)
+
+    def test_set_device_refused_while_recording(self):
+        """The device cannot change under an open input stream."""
+        self.recorder.is_recording = True
+
+        self.assertFalse(self.recorder.set_device(2))
+        self.assertIsNone(self.recorder.device_id)
+        self.recorder.is_recording = False
+
     def test_audio_level_callback(self):
         """Test setting and using audio level callback."""
         callback_values = []
@@ -4,6 +4,7 @@ Unit tests for saved-recording retention settings and rotation.
 import os
 import tempfile
 import unittest
+from datetime import datetime
 from types import SimpleNamespace
 from unittest.mock import patch
 
@@ -78,7 +79,7 @@ class TestRecordingRotation(unittest.TestCase):
         return path
 
     @patch("services.history_manager.db")
-    def test_rotate_keeps_newest_n(self, _mock_db):
+    def test_rotate_keeps_newest_n(self, mock_db):
         """Custom limit should delete oldest files beyond the max."""
         manager = HistoryManager(
             recordings_folder=self.recordings_dir,
@@ -95,6 +96,234 @@ class TestRecordingRotation(unittest.TestCase):
             remaining,
             ["recording_20260102_120000.wav", "recording_20260103_120000.wav"],
         )
+        mock_db.clear_history_audio_files.assert_called_once_with(
+            ["recording_20260101_120000.wav"]
+        )
+
+    @patch("services.history_manager.db")
+    def test_rotate_under_limit_skips_stat_scan(self, mock_db):
+        """Within the limit, rotation only lists names and touches nothing."""
+        manager = HistoryManager(
+            recordings_folder=self.recordings_dir,
+            max_recordings=2,
+        )
+        self._touch_recording("20260101_120000")
+        self._touch_recording("20260102_120000")
+
+        with patch.object(manager, "get_recordings") as get_recordings:
+            manager._rotate_recordings()
+
+        get_recordings.assert_not_called()
+        mock_db.clear_history_audio_files.assert_not_called()
+        self.assertEqual(len(os.listdir(self.recordings_dir)), 2)
+
+    @patch("services.history_manager.db")
+    def test_get_recordings_ignores_wav_named_directories(self, _mock_db):
+        """Only regular files count as recordings."""
+        manager = HistoryManager(
+            recordings_folder=self.recordings_dir,
+            max_recordings=None,
+        )
+        self._touch_recording("20260101_120000")
+        stray_dir = os.path.join(self.recordings_dir, "not_a_recording.wav")
+        os.mkdir(stray_dir)
+        try:
+            recordings = manager.get_recordings()
+        finally:
+            os.rmdir(stray_dir)
+
+        self.assertEqual(
+            [r.filename for r in recordings], ["recording_20260101_120000.wav"]
+        )
+
+    @patch("services.history_manager.db")
+    def test_save_recording_links_or_copies_source(self, _mock_db):
+        """Saved recordings match the source whether linked or copied."""
+        manager = HistoryManager(
+            recordings_folder=self.recordings_dir,
+            max_recordings=None,
+        )
+        source = os.path.join(self.temp_dir, "recording.wav")
+        with open(source, "wb") as handle:
+            handle.write(b"RIFF-audio")
+
+        try:
+            for link_fails in (False, True):
+                with self.subTest(link_fails=link_fails):
+                    side_effect = OSError("cross-device") if link_fails else None
+                    with patch.object(config, "RECORDED_AUDIO_FILE", source), \
+                            patch("services.history_manager.os.link",
+                                  side_effect=side_effect, wraps=os.link):
+                        filename = manager._save_recording(source)
+
+                    self.assertIsNotNone(filename)
+                    saved = os.path.join(self.recordings_dir, filename)
+                    with open(saved, "rb") as handle:
+                        self.assertEqual(handle.read(), b"RIFF-audio")
+                    os.remove(saved)
+        finally:
+            os.remove(source)
+
+    @patch("services.history_manager.db")
+    def test_save_recording_copies_user_files(self, _mock_db):
+        """Uploads are copied, never linked, so the user's file stays separate."""
+        manager = HistoryManager(
+            recordings_folder=self.recordings_dir,
+            max_recordings=None,
+        )
+        upload = os.path.join(self.temp_dir, "my_interview.wav")
+        with open(upload, "wb") as handle:
+            handle.write(b"RIFF-interview")
+
+        try:
+            with patch("services.history_manager.os.link") as link:
+                filename = manager._save_recording(upload)
+            link.assert_not_called()
+
+            saved = os.path.join(self.recordings_dir, filename)
+            self.assertFalse(os.path.samefile(saved, upload))
+            os.remove(saved)
+        finally:
+            os.remove(upload)
+
+    @patch("services.history_manager.datetime")
+    @patch("services.history_manager.db")
+    def test_same_second_saves_never_overwrite(self, _mock_db, mock_datetime):
+        """A second save in the same second gets its own file."""
+        mock_datetime.now.return_value = datetime(2026, 1, 2, 3, 4, 5)
+        manager = HistoryManager(
+            recordings_folder=self.recordings_dir,
+            max_recordings=None,
+        )
+        recorded = os.path.join(self.temp_dir, "recording.wav")
+        upload = os.path.join(self.temp_dir, "my_interview.wav")
+        contents = {recorded: b"RIFF-dictation", upload: b"RIFF-interview"}
+
+        try:
+            for order in ((recorded, upload), (upload, recorded)):
+                with self.subTest(first=os.path.basename(order[0])):
+                    for path in order:
+                        with open(path, "wb") as handle:
+                            handle.write(contents[path])
+
+                    with patch.object(config, "RECORDED_AUDIO_FILE", recorded):
+                        names = [manager._save_recording(path) for path in order]
+
+                    self.assertEqual(names, [
+                        "recording_20260102_030405.wav",
+                        "recording_20260102_030405_1.wav",
+                    ])
+                    for name, path in zip(names, order, strict=True):
+                        saved = os.path.join(self.recordings_dir, name)
+                        with open(saved, "rb") as handle:
+                            self.assertEqual(handle.read(), contents[path])
+                        with open(path, "rb") as handle:
+                            self.assertEqual(handle.read(), contents[path])
+                        os.remove(saved)
+        finally:
+            for path in contents:
+                if os.path.exists(path):
+                    os.remove(path)
+
+    @patch("services.history_manager.db")
+    def test_get_recordings_parses_timestamp_from_filename(self, _mock_db):
+        """Well-formed names give their timestamp; others fall back to mtime."""
+        manager = HistoryManager(
+            recordings_folder=self.recordings_dir,
+            max_recordings=None,
+        )
+        self._touch_recording("20260102_030405")
+        odd = os.path.join(self.recordings_dir, "recording_20261399_000000.wav")
+        with open(odd, "wb") as handle:
+            handle.write(b"RIFF")
+        os.utime(odd, (0, 0))
+
+        timestamps = {r.filename: r.timestamp for r in manager.get_recordings()}
+
+        self.assertEqual(
+            timestamps["recording_20260102_030405.wav"], "2026-01-02T03:04:05"
+        )
+        self.assertEqual(
+            timestamps["recording_20261399_000000.wav"],
+            datetime.fromtimestamp(0).isoformat(),
+        )
+
+    @patch("services.history_manager.db")
+    def test_add_entry_with_missing_source_saves_no_audio(self, mock_db):
+        """A vanished source file yields an entry without a recording."""
+        manager = HistoryManager(
+            recordings_folder=self.recordings_dir,
+            max_recordings=None,
+        )
+
+        missing = os.path.join(self.temp_dir, "missing.wav")
+
+        with self.assertNoLogs("services.history_manager", "ERROR"):
+            entry = manager.add_entry(
+                text="hello",
+                model="local_whisper",
+                source_audio_path=missing,
+            )
+            # The recorder's own file takes the link path first.
+            with patch.object(config, "RECORDED_AUDIO_FILE", missing):
+                self.assertIsNone(manager._save_recording(missing))
+
+        self.assertIsNone(entry.audio_file)
+        self.assertEqual(os.listdir(self.recordings_dir), [])
+        mock_db.add_history_entries.assert_called_once_with([entry])
+
+    @patch("services.history_manager.db")
+    def test_snapshot_survives_the_next_recording(self, mock_db):
+        """A recording saved up front keeps its audio when the source is replaced."""
+        manager = HistoryManager(
+            recordings_folder=self.recordings_dir,
+            max_recordings=1,
+        )
+        self._touch_recording("20000101_000000")
+        source = os.path.join(self.temp_dir, "recording.wav")
+        with open(source, "wb") as handle:
+            handle.write(b"first")
+
+        try:
+            with patch.object(config, "RECORDED_AUDIO_FILE", source):
+                filename = manager.save_recording(source)
+
+            # The recorder replaces its output by rename.
+            replacement = os.path.join(self.temp_dir, "next.wav")
+            with open(replacement, "wb") as handle:
+                handle.write(b"second")
+            os.replace(replacement, source)
+
+            entry = manager.add_entry(
+                text="hello", model="local_whisper", audio_file=filename
+            )
+        finally:
+            os.remove(source)
+
+        self.assertEqual(entry.audio_file, filename)
+        # add_entry still applies the retention limit.
+        self.assertEqual(os.listdir(self.recordings_dir), [filename])
+        with open(os.path.join(self.recordings_dir, filename), "rb") as handle:
+            self.assertEqual(handle.read(), b"first")
+        mock_db.add_history_entries.assert_called_once_with([entry])
+
+    @patch("services.history_manager.db")
+    def test_missing_recordings_folder_is_logged_as_error(self, _mock_db):
+        """Destination failures stay at error level, unlike a missing source."""
+        manager = HistoryManager(
+            recordings_folder=self.recordings_dir,
+            max_recordings=None,
+        )
+        manager.recordings_folder = os.path.join(self.temp_dir, "gone")
+        source = os.path.join(self.temp_dir, "recording.wav")
+        with open(source, "wb") as handle:
+            handle.write(b"RIFF")
+
+        try:
+            with self.assertLogs("services.history_manager", "ERROR"):
+                self.assertIsNone(manager._save_recording(source))
+        finally:
+            os.remove(source)
 
     @patch("services.history_manager.db")
     def test_keep_all_skips_rotation(self, _mock_db):
@@ -103,6 +103,58 @@ class TestSettingsManager(unittest.TestCase):
 
         self.assertEqual(saved_data, test_settings)
 
+    def test_load_all_settings_reuses_unchanged_file(self):
+        """Repeated loads should not re-read an unchanged settings file."""
+        self.settings_manager.save_all_settings({'auto_paste': False})
+
+        with patch('builtins.open', side_effect=AssertionError('re-read')):
+            first = self.settings_manager.load_all_settings()
+            first['auto_paste'] = True  # callers may mutate their copy
+            second = self.settings_manager.load_all_settings()
+
+        self.assertEqual(second, {'auto_paste': False})
+
+    def test_save_hotkey_settings_refreshes_cache(self):
+        """Saving hotkeys should leave the cache primed for the next load."""
+        self.settings_manager.save_all_settings({'auto_paste': False})
+        self.settings_manager.save_hotkey_settings({'record_toggle': 'f2'})
+
+        with patch('builtins.open', side_effect=AssertionError('re-read')):
+            loaded = self.settings_manager.load_all_settings()
+
+        self.assertEqual(
+            loaded,
+            {'auto_paste': False, 'hotkeys': {'record_toggle': 'f2'}},
+        )
+
+    def test_load_all_settings_picks_up_external_edits(self):
+        """Edits made outside the manager should be seen on the next load."""
+        self.settings_manager.save_all_settings({'auto_paste': False})
+
+        with open(self.test_settings_file, 'w') as f:
+            json.dump({'auto_paste': True, 'copy_clipboard': False}, f)
+
+        self.assertEqual(
+            self.settings_manager.load_all_settings(),
+            {'auto_paste': True, 'copy_clipboard': False},
+        )
+
+    def test_get_reads_cached_settings_without_reparsing(self):
+        """get() on an unchanged file should neither re-read nor re-parse it."""
+        self.settings_manager.save_all_settings(
+            {'auto_paste': False, 'rules': ['a']}
+        )
+
+        with patch('builtins.open', side_effect=AssertionError('re-read')), \
+                patch('services.settings.json.loads',
+                      side_effect=AssertionError('re-parsed')):
+            self.assertFalse(self.settings_manager.get('auto_paste', True))
+            self.assertTrue(self.settings_manager.get('copy_clipboard', True))
+            rules = self.settings_manager.get('rules')
+            rules.append('b')  # mutable values are copies
+
+        self.assertEqual(self.settings_manager.get('rules'), ['a'])
+
     def test_is_hf_hub_offline_env_set(self):
         """Env helper should reflect the externally supplied HF_HUB_OFFLINE."""
         from services.settings import is_hf_hub_offline_env_set
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 from services.transcript_cleanup import (
     TranscriptCleanup,
     _filter_openai_chat_models,
+    _shared_client,
 )
 
 
@@ -52,6 +53,26 @@ class TestTranscriptCleanup(unittest.TestCase):
         kwargs = mock_client.chat.completions.create.call_args.kwargs
         self.assertEqual(kwargs["messages"][0]["content"], custom)
 
+    def test_prompt_cache_hits_are_logged(self):
+        cleaner = TranscriptCleanup(api_key="test-key")
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content="Done."))],
+            usage=MagicMock(
+                prompt_tokens=1500,
+                prompt_tokens_details=MagicMock(cached_tokens=1280),
+            ),
+        )
+        cleaner.client = mock_client
+
+        with self.assertLogs("services.transcript_cleanup", level="DEBUG") as logs:
+            self.assertEqual(cleaner.cleanup("raw text"), "Done.")
+        self.assertIn("1280 of 1500", "\n".join(logs.output))
+
+        mock_client.chat.completions.create.return_value.usage = None
+        self.assertEqual(cleaner.cleanup("raw text"), "Done.")
+        self.assertIsNone(cleaner.last_error)
+
     def test_api_error_falls_back_to_raw(self):
         cleaner = TranscriptCleanup(api_key="test-key")
         mock_client = MagicMock()
@@ -175,6 +196,13 @@ class TestTranscriptCleanupProviders(unittest.TestCase):
         self.assertIs(cleaner.client, original_client)
         self.assertEqual(cleaner.model, "gpt-4.1-mini")
 
+    def test_cleaners_with_same_key_share_client(self):
+        first = TranscriptCleanup(api_key="openai-key")
+        second = TranscriptCleanup(api_key="openai-key")
+        other = TranscriptCleanup(api_key="rotated-key")
+        self.assertIs(first.client, second.client)
+        self.assertIsNot(first.client, other.client)
+
     def test_openai_model_filter_keeps_chat_models_only(self):
         ids = [
             "gpt-4o-mini",
@@ -334,6 +362,10 @@ class TestTranscriptCleanupSettings(unittest.TestCase):
 class TestPolishCleanupRule(unittest.TestCase):
     """Tests for polishing raw instructions into learned rules."""
 
+    def setUp(self):
+        # Each test patches OpenAI; drop clients cached by earlier tests.
+        _shared_client.cache_clear()
+
     @staticmethod
     def _mock_openai(content):
         client = MagicMock()
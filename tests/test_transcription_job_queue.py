@@ -0,0 +1,95 @@
+"""Tests for the single-consumer transcription job queue."""
+
+import queue
+import threading
+import unittest
+
+from services.runtime.job_queue import JobPriority, TranscriptionJobQueue
+
+
+class TestTranscriptionJobQueue(unittest.TestCase):
+    def _blocked_queue(self, **kwargs):
+        """Return a queue whose worker is parked inside a first job."""
+        job_queue = TranscriptionJobQueue(**kwargs)
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocker():
+            started.set()
+            release.wait(5)
+
+        job_queue.submit(blocker)
+        self.assertTrue(started.wait(5))
+        return job_queue, release
+
+    def test_jobs_run_by_priority_then_size_then_submission_order(self):
+        job_queue, release = self._blocked_queue()
+        ran = []
+
+        job_queue.submit(ran.append, "upload", priority=JobPriority.UPLOAD)
+        job_queue.submit(
+            ran.append, "retranscribe-big", priority=JobPriority.RETRANSCRIBE, size=900
+        )
+        job_queue.submit(
+            ran.append, "retranscribe-small", priority=JobPriority.RETRANSCRIBE, size=10
+        )
+        job_queue.submit(ran.append, "stop-1", priority=JobPriority.INTERACTIVE)
+        job_queue.submit(ran.append, "stop-2", priority=JobPriority.INTERACTIVE)
+
+        release.set()
+        job_queue.shutdown(wait=True)
+
+        self.assertEqual(
+            ran,
+            ["stop-1", "stop-2", "retranscribe-small", "retranscribe-big", "upload"],
+        )
+
+    def test_failing_job_does_not_stop_the_worker(self):
+        job_queue = TranscriptionJobQueue()
+        ran = []
+
+        def boom():
+            raise RuntimeError("boom")
+
+        with self.assertLogs("services.runtime.job_queue", level="ERROR"):
+            job_queue.submit(boom)
+            job_queue.submit(ran.append, "after")
+            job_queue.shutdown(wait=True)
+
+        self.assertEqual(ran, ["after"])
+
+    def test_shutdown_with_cancel_drops_queued_jobs(self):
+        job_queue, release = self._blocked_queue()
+        ran = []
+        job_queue.submit(ran.append, "queued", priority=JobPriority.UPLOAD)
+
+        release.set()
+        job_queue.shutdown(wait=True, cancel_futures=True)
+
+        self.assertEqual(ran, [])
+        with self.assertRaises(RuntimeError):
+            job_queue.submit(ran.append, "late")
+
+    def test_second_shutdown_with_wait_joins_the_worker(self):
+        job_queue, release = self._blocked_queue()
+
+        job_queue.shutdown(wait=False, cancel_futures=True)
+        self.assertTrue(job_queue._thread.is_alive())
+
+        release.set()
+        job_queue.shutdown(wait=True)
+        self.assertFalse(job_queue._thread.is_alive())
+
+    def test_full_queue_rejects_instead_of_blocking(self):
+        job_queue, release = self._blocked_queue(maxsize=1)
+        job_queue.submit(lambda: None)
+
+        with self.assertRaises(queue.Full):
+            job_queue.submit(lambda: None)
+
+        release.set()
+        job_queue.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,7 @@
 Base transcription backend interface.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Iterable, Optional
 
 
 class TranscriptionBackend(ABC):
@@ -45,6 +45,17 @@ class TranscriptionBackend(ABC):
         """Reset the cancellation flag."""
         self.should_cancel = False
 
+    @property
+    def device_info(self) -> str:
+        """Short description of the device the backend runs on.
+
+        Override in subclasses that run locally. Empty for remote backends.
+
+        Returns:
+            Display string such as ``"base | cuda (float16)"``, or ``""``.
+        """
+        return ""
+
     @property
     def requires_file_splitting(self) -> bool:
         """Whether this backend requires large files to be split.
@@ -57,15 +68,17 @@ class TranscriptionBackend(ABC):
         """
         return True
 
-    def transcribe_chunks(self, chunk_files: List[str]) -> str:
+    def transcribe_chunks(self, chunk_files: Iterable[str]) -> str:
         """Transcribe multiple audio chunk files and combine results.
 
-        This is an optional method that backends can implement for optimized
-        handling of chunked audio. If not implemented, the main UI will
-        fall back to calling transcribe() for each chunk individually.
+        The default transcribes the chunks one after another. Backends whose
+        requests can overlap should override it (the OpenAI backend uploads
+        chunks concurrently); local inference shares a single model instance,
+        so running chunks in parallel there only adds contention.
 
         Args:
-            chunk_files: List of paths to audio chunk files.
+            chunk_files: Paths to audio chunk files, in order. May be a lazy
+                iterator that produces chunks while earlier ones transcribe.
 
         Returns:
             Combined transcribed text from all chunks.
@@ -8,7 +8,7 @@ This backend uses faster-whisper (CTranslate2) which provides:
 - No external FFmpeg dependency (uses PyAV)
 """
 import logging
-from typing import Optional, List, Tuple
+from typing import Iterable, Optional, Tuple
 from faster_whisper import WhisperModel
 from .base import TranscriptionBackend
 from config import config
@@ -430,6 +430,47 @@ class LocalWhisperBackend(TranscriptionBackend):
                 f"Model '{self.model_name}' failed to load after download"
             )
 
+    def _transcribe_file(self, audio_path: str) -> Tuple[str, object]:
+        """Run the loaded model over one file, honouring cancellation.
+
+        Shared by single-file and chunked transcription so both go through
+        the resident model with the same decoding options.
+
+        Args:
+            audio_path: Path to the audio file to transcribe.
+
+        Returns:
+            Tuple of (stripped transcript text, faster-whisper TranscriptionInfo).
+
+        Raises:
+            Exception: If transcription is canceled mid-file.
+        """
+        # Configure VAD parameters if enabled
+        vad_params = None
+        if config.FASTER_WHISPER_VAD_ENABLED:
+            vad_params = dict(
+                min_silence_duration_ms=config.FASTER_WHISPER_VAD_MIN_SILENCE_MS
+            )
+
+        # Transcribe - returns a generator of segments and transcription info
+        segments, info = self.model.transcribe(
+            audio_path,
+            beam_size=config.FASTER_WHISPER_BEAM_SIZE,
+            vad_filter=config.FASTER_WHISPER_VAD_ENABLED,
+            vad_parameters=vad_params
+        )
+
+        # Iterate through segments to get transcribed text
+        # Note: segments is a generator - transcription happens as we iterate
+        text_parts = []
+        for segment in segments:
+            if self.should_cancel:
+                logger.info("Transcription canceled by user")
+                raise Exception("Transcription canceled")
+            text_parts.append(segment.text)
+
+        return " ".join(text_parts).strip(), info
+
     def transcribe(self, audio_path: str) -> str:
         """Transcribe audio file using faster-whisper model.
 
@@ -451,35 +492,11 @@ class LocalWhisperBackend(TranscriptionBackend):
 
             logger.info(f"Processing audio with faster-whisper (VAD={config.FASTER_WHISPER_VAD_ENABLED})...")
 
-            # Configure VAD parameters if enabled
-            vad_params = None
-            if config.FASTER_WHISPER_VAD_ENABLED:
-                vad_params = dict(
-                    min_silence_duration_ms=config.FASTER_WHISPER_VAD_MIN_SILENCE_MS
-                )
-
-            # Transcribe - returns a generator of segments and transcription info
-            segments, info = self.model.transcribe(
-                audio_path,
-                beam_size=config.FASTER_WHISPER_BEAM_SIZE,
-                vad_filter=config.FASTER_WHISPER_VAD_ENABLED,
-                vad_parameters=vad_params
-            )
+            transcript, info = self._transcribe_file(audio_path)
 
             logger.info(f"Detected language: {info.language} "
                         f"(probability: {info.language_probability:.2f})")
 
-            # Iterate through segments to get transcribed text
-            # Note: segments is a generator - transcription happens as we iterate
-            text_parts = []
-            for segment in segments:
-                if self.should_cancel:
-                    logger.info("Transcription canceled by user")
-                    raise Exception("Transcription canceled")
-                text_parts.append(segment.text)
-
-            transcript = " ".join(text_parts).strip()
-
             # Clean up extra whitespace
             import re
             transcript = re.sub(r'\s+', ' ', transcript)
@@ -495,11 +512,12 @@ class LocalWhisperBackend(TranscriptionBackend):
         finally:
             self.is_transcribing = False
 
-    def transcribe_chunks(self, chunk_files: List[str]) -> str:
+    def transcribe_chunks(self, chunk_files: Iterable[str]) -> str:
         """Transcribe multiple audio chunk files efficiently with faster-whisper.
 
         Args:
-            chunk_files: List of paths to audio chunk files.
+            chunk_files: Paths to audio chunk files, in order. May be a lazy
+                iterator that produces chunks while earlier ones transcribe.
 
         Returns:
             Combined transcribed text from all chunks.
@@ -516,40 +534,17 @@ class LocalWhisperBackend(TranscriptionBackend):
 
             transcriptions = []
 
-            # Configure VAD parameters if enabled
-            vad_params = None
-            if config.FASTER_WHISPER_VAD_ENABLED:
-                vad_params = dict(
-                    min_silence_duration_ms=config.FASTER_WHISPER_VAD_MIN_SILENCE_MS
-                )
-
             for i, chunk_file in enumerate(chunk_files):
                 if self.should_cancel:
                     logger.info("Chunked transcription canceled by user")
                     raise Exception("Transcription canceled")
 
-                logger.info(f"Processing chunk {i+1}/{len(chunk_files)}: {chunk_file}")
-
-                # Transcribe individual chunk
-                segments, info = self.model.transcribe(
-                    chunk_file,
-                    beam_size=config.FASTER_WHISPER_BEAM_SIZE,
-                    vad_filter=config.FASTER_WHISPER_VAD_ENABLED,
-                    vad_parameters=vad_params
-                )
-
-                # Collect text from segments
-                text_parts = []
-                for segment in segments:
-                    if self.should_cancel:
-                        logger.info("Transcription canceled during chunk processing")
-                        raise Exception("Transcription canceled")
-                    text_parts.append(segment.text)
+                logger.info(f"Processing chunk {i+1}: {chunk_file}")
 
-                chunk_text = " ".join(text_parts).strip()
+                chunk_text, _info = self._transcribe_file(chunk_file)
                 transcriptions.append(chunk_text)
 
-                logger.info(f"Chunk {i+1}/{len(chunk_files)} completed. "
+                logger.info(f"Chunk {i+1} completed. "
                            f"Length: {len(chunk_text)} characters")
 
             # Combine transcriptions using audio_processor
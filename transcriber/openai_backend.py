@@ -1,15 +1,21 @@
 """
 OpenAI API transcription backend.
 """
+import itertools
 import os
 import logging
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
 from openai import OpenAI
 from .base import TranscriptionBackend
 from config import config
 
 logger = logging.getLogger(__name__)
 
+# Chunk uploads are network-bound, so a few in flight hide per-request latency
+# without tripping the API's per-minute rate limits.
+MAX_CONCURRENT_CHUNK_UPLOADS = 4
+
 
 class OpenAIBackend(TranscriptionBackend):
     """OpenAI API transcription backend."""
@@ -130,11 +136,14 @@ class OpenAIBackend(TranscriptionBackend):
         self.api_key = api_key
         self._initialize_client()
 
-    def transcribe_chunks(self, chunk_files: List[str]) -> str:
+    def transcribe_chunks(self, chunk_files: Iterable[str]) -> str:
         """Transcribe multiple audio chunk files efficiently with OpenAI API.
 
         Args:
-            chunk_files: List of paths to audio chunk files.
+            chunk_files: Paths to audio chunk files, in order. May be a lazy
+                iterator (e.g. ``audio_processor.iter_split_audio_file``):
+                each chunk is submitted as soon as it is produced, so uploads
+                overlap with writing the remaining chunks.
 
         Returns:
             Combined transcribed text from all chunks.
@@ -150,18 +159,14 @@ class OpenAIBackend(TranscriptionBackend):
             self.reset_cancel_flag()
 
             api_model = self._get_api_model_name()
-            transcriptions = []
 
             logger.info(f"Starting chunked transcription with OpenAI API model: {api_model}")
 
-            for i, chunk_file in enumerate(chunk_files):
+            def transcribe_chunk(index: int, chunk_file: str) -> str:
                 if self.should_cancel:
-                    logger.info("Chunked transcription canceled by user")
                     raise Exception("Transcription canceled")
 
-                logger.info(f"Processing chunk {i+1}/{len(chunk_files)} with OpenAI API: {chunk_file}")
-
-                # Transcribe individual chunk
+                logger.info(f"Processing chunk {index + 1} with OpenAI API: {chunk_file}")
                 with open(chunk_file, "rb") as f:
                     response = self.client.audio.transcriptions.create(
                         model=api_model,
@@ -170,9 +175,29 @@ class OpenAIBackend(TranscriptionBackend):
                     )
 
                 chunk_text = response.strip()
-                transcriptions.append(chunk_text)
+                logger.info(f"Chunk {index + 1} completed. Length: {len(chunk_text)} characters")
+                return chunk_text
+
+            # map() yields results in submission order, so chunks recombine in
+            # sequence however the uploads interleave; the first failure
+            # (including a cancel) propagates and queued chunks are dropped.
+            # map() also submits each chunk as the iterable yields it, so a
+            # lazy splitter keeps writing chunks while earlier ones upload.
+            with ThreadPoolExecutor(
+                max_workers=MAX_CONCURRENT_CHUNK_UPLOADS,
+                thread_name_prefix="openai-chunk",
+            ) as executor:
+                try:
+                    transcriptions = list(
+                        executor.map(transcribe_chunk, itertools.count(), chunk_files)
+                    )
+                except BaseException:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
 
-                logger.info(f"Chunk {i+1}/{len(chunk_files)} completed. Length: {len(chunk_text)} characters")
+            if self.should_cancel:
+                logger.info("Chunked transcription canceled by user")
+                raise Exception("Transcription canceled")
 
             # Combine transcriptions
             from services.audio_processor import audio_processor
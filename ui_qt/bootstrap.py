@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import faulthandler
 import logging
+import os
 import signal
+import socket
 import sys
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
@@ -14,6 +16,8 @@ from ui_qt.startup_profiler import StartupProfiler
 
 _CRASH_LOG_FILE = None
 _QT_MESSAGE_HANDLER_INSTALLED = False
+# (read socket, write socket, QSocketNotifier) kept alive for the process.
+_SIGNAL_WAKEUP = None
 
 
 def log_cuda_preload_summary() -> None:
@@ -78,23 +82,88 @@ def setup_logging() -> None:
 
 
 def _enable_crash_logging() -> None:
-    """Enable faulthandler crash logging for hard crashes."""
+    """Enable faulthandler crash logging for hard crashes.
+
+    faulthandler writes from C straight to the file descriptor, so the crash
+    log is opened as a raw append-only fd rather than a (line-buffered) Python
+    file object that nothing on the Python side ever writes to. ``enable()``
+    already covers SIGSEGV, SIGFPE, SIGABRT, SIGBUS and SIGILL; those cannot
+    also be passed to ``faulthandler.register()``.
+    """
     global _CRASH_LOG_FILE
 
     try:
         crash_log_path = Path(config.LOG_FILE).with_suffix(".crash.log")
-        _CRASH_LOG_FILE = open(crash_log_path, "a", buffering=1)
+        # Kept open for the life of the process: faulthandler holds the fd.
+        _CRASH_LOG_FILE = os.open(
+            crash_log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+        )
         faulthandler.enable(file=_CRASH_LOG_FILE, all_threads=True)
+        # `kill -USR1 <pid>` dumps every thread's stack (e.g. a stuck
+        # transcription worker) to the crash log without stopping the app.
+        if hasattr(signal, "SIGUSR1"):
+            faulthandler.register(
+                signal.SIGUSR1, file=_CRASH_LOG_FILE, all_threads=True
+            )
+
+        logging.info(f"Faulthandler enabled for crash diagnostics: {crash_log_path}")
+    except Exception as exc:
+        logging.warning(f"Failed to enable faulthandler: {exc}")
+
+
+def install_signal_wakeup() -> None:
+    """Deliver SIGINT/SIGTERM while Qt is blocked in its native event loop.
+
+    Python only runs signal handlers between bytecodes, and ``app.exec()`` (or
+    a native file dialog) can sit in C indefinitely, so Ctrl-C and ``kill``
+    were ignored until some unrelated Python callback happened to run. The C
+    handler writes to a socket via ``signal.set_wakeup_fd``; a
+    ``QSocketNotifier`` on the other end wakes the event loop, and the Python
+    handler then quits the app so ``main``'s cleanup releases the recorder and
+    audio device.
+
+    Must run on the main thread right before the event loop starts: until
+    then the default handlers still interrupt or terminate startup.
+    """
+    global _SIGNAL_WAKEUP
+
+    if _SIGNAL_WAKEUP is not None:
+        return
+
+    try:
+        from PyQt6.QtCore import QCoreApplication, QSocketNotifier, QTimer
+
+        app = QCoreApplication.instance()
+        if app is None:
+            return
 
-        for sig in (signal.SIGSEGV, signal.SIGABRT, signal.SIGFPE, signal.SIGILL):
+        read_sock, write_sock = socket.socketpair()
+        read_sock.setblocking(False)
+        write_sock.setblocking(False)
+        signal.set_wakeup_fd(write_sock.fileno(), warn_on_full_buffer=False)
+
+        def _drain(_socket_fd) -> None:
             try:
-                faulthandler.register(sig, file=_CRASH_LOG_FILE, all_threads=True)
-            except (AttributeError, RuntimeError, ValueError):
+                while read_sock.recv(64):
+                    pass
+            except OSError:
                 pass
 
-        logging.info(f"Faulthandler enabled for crash diagnostics: {crash_log_path}")
+        notifier = QSocketNotifier(read_sock.fileno(), QSocketNotifier.Type.Read)
+        notifier.activated.connect(_drain)
+
+        def _quit(signum, _frame) -> None:
+            logging.info("Received %s, shutting down", signal.Signals(signum).name)
+            # Queued rather than direct so a signal landing between install
+            # and exec() still quits once the loop starts.
+            QTimer.singleShot(0, app.quit)
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, _quit)
+
+        _SIGNAL_WAKEUP = (read_sock, write_sock, notifier)
     except Exception as exc:
-        logging.warning(f"Failed to enable faulthandler: {exc}")
+        logging.warning(f"Failed to install signal wakeup: {exc}")
 
 
 def _install_qt_message_handler() -> None:
@@ -110,8 +179,22 @@ def _install_qt_message_handler() -> None:
         logging.warning(f"Failed to install Qt message handler: {exc}")
         return
 
+    # Built once at install time: per message, the handler is one dict lookup
+    # plus a level check, and suppressed levels never format anything.
+    qt_levels = {
+        QtMsgType.QtDebugMsg: logging.DEBUG,
+        QtMsgType.QtInfoMsg: logging.INFO,
+        QtMsgType.QtWarningMsg: logging.WARNING,
+        QtMsgType.QtCriticalMsg: logging.ERROR,
+        QtMsgType.QtFatalMsg: logging.CRITICAL,
+    }
+    qt_logger = logging.getLogger("qt")
+
     def _qt_message_handler(msg_type, context, message) -> None:
-        logger = logging.getLogger("qt")
+        level = qt_levels.get(msg_type, logging.INFO)
+        if not qt_logger.isEnabledFor(level):
+            return
+
         context_info = ""
         try:
             if context and (context.file or context.function or context.line):
@@ -119,20 +202,7 @@ def _install_qt_message_handler() -> None:
         except Exception:
             context_info = ""
 
-        text = f"{message}{context_info}"
-
-        if msg_type == QtMsgType.QtDebugMsg:
-            logger.debug(text)
-        elif msg_type == QtMsgType.QtInfoMsg:
-            logger.info(text)
-        elif msg_type == QtMsgType.QtWarningMsg:
-            logger.warning(text)
-        elif msg_type == QtMsgType.QtCriticalMsg:
-            logger.error(text)
-        elif msg_type == QtMsgType.QtFatalMsg:
-            logger.critical(text)
-        else:
-            logger.info(text)
+        qt_logger.log(level, "%s%s", message, context_info)
 
     qInstallMessageHandler(_qt_message_handler)
     _QT_MESSAGE_HANDLER_INSTALLED = True
@@ -169,12 +239,21 @@ def load_local_whisper_backend():
     return LocalWhisperBackend()
 
 
+def load_streaming_preview_backend():
+    """Load the streaming preview backend if enabled (safe off the UI thread)."""
+    from services.runtime.streaming import create_streaming_preview_backend
+
+    return create_streaming_preview_backend()
+
+
 def run_with_ui_pulse(fn):
     """Run ``fn`` on a worker thread while keeping the splash animation alive.
 
     Startup previously blocked the UI thread on model load, so QTimer-driven
-    painting never ran. This spins a nested event loop on the main thread until
-    the worker finishes, which lets the loading-screen glow timer fire.
+    painting never ran. This runs a nested event loop on the main thread until
+    the worker finishes, which lets the loading-screen glow timer fire. The
+    worker ends the loop with a queued ``quit``, so there is no polling; a
+    quit posted before the loop starts is still delivered once it runs.
 
     Args:
         fn: Zero-arg callable. Must not touch Qt widgets/objects.
@@ -187,13 +266,14 @@ def run_with_ui_pulse(fn):
     """
     import threading
 
-    from PyQt6.QtCore import QEventLoop, QTimer
+    from PyQt6.QtCore import QEventLoop, QMetaObject, Qt
     from PyQt6.QtWidgets import QApplication
 
     if QApplication.instance() is None:
         return fn()
 
-    box = {"done": False, "result": None, "error": None}
+    box = {"result": None, "error": None}
+    loop = QEventLoop()
 
     def worker() -> None:
         try:
@@ -201,16 +281,13 @@ def run_with_ui_pulse(fn):
         except Exception as exc:  # noqa: BLE001 - re-raised on main thread
             box["error"] = exc
         finally:
-            box["done"] = True
+            QMetaObject.invokeMethod(
+                loop, "quit", Qt.ConnectionType.QueuedConnection
+            )
 
     thread = threading.Thread(target=worker, daemon=True)
     thread.start()
-
-    while not box["done"]:
-        loop = QEventLoop()
-        QTimer.singleShot(33, loop.quit)
-        loop.exec()
-
+    loop.exec()
     thread.join(timeout=1.0)
 
     if box["error"] is not None:
@@ -250,6 +327,7 @@ def main() -> int:
     loading_screen = None
     ui_controller = None
     app_controller = None
+    exit_code = 1
 
     try:
         loading_screen = LoadingScreen()
@@ -265,7 +343,6 @@ def main() -> int:
 
         loading_screen.update_status("Loading application...")
         loading_screen.update_progress("Loading runtime components...")
-        process_qt_events()
 
         profiler.mark("late_imports_started")
         UIController, ApplicationController = run_with_ui_pulse(
@@ -282,17 +359,19 @@ def main() -> int:
 
         loading_screen.update_status("Initializing audio system...")
         loading_screen.update_progress("Loading transcription models...")
-        process_qt_events()
 
         local_backend = run_with_ui_pulse(load_local_whisper_backend)
+        streaming_backend = run_with_ui_pulse(load_streaming_preview_backend)
         app_controller = ApplicationController(
-            ui_controller, local_backend=local_backend
+            ui_controller,
+            local_backend=local_backend,
+            streaming_backend=streaming_backend,
         )
         profiler.mark("application_controller_created")
 
         local_backend = app_controller.transcription_backends.get("local_whisper")
-        if local_backend and hasattr(local_backend, "device_info"):
-            device_info = local_backend.device_info
+        device_info = local_backend.device_info if local_backend else None
+        if device_info is not None:
             loading_screen.update_progress(f"Using {device_info}")
             process_qt_events()
             logging.info(f"Whisper device: {device_info}")
@@ -303,8 +382,8 @@ def main() -> int:
         ui_controller.show_main_window()
         profiler.mark("main_window_shown")
 
-        if local_backend and hasattr(local_backend, "device_info"):
-            ui_controller.set_device_info(local_backend.device_info)
+        if device_info is not None:
+            ui_controller.set_device_info(device_info)
 
         # Now that the main UI is available, a missing local model may request
         # download consent (never during startup, never for API-only users).
@@ -314,7 +393,11 @@ def main() -> int:
         summary_logged = True
         logging.info("Application initialization complete")
         logging.info("Starting event loop")
-        return qt_app.run(ui_controller.main_window)
+        # Only now: app.quit() is a no-op outside exec(), so installing the
+        # handlers earlier would swallow Ctrl-C/SIGTERM during startup.
+        install_signal_wakeup()
+        exit_code = qt_app.run(ui_controller.main_window)
+        return exit_code
     except Exception:
         if not summary_logged:
             profiler.log_summary()
@@ -339,3 +422,12 @@ def main() -> int:
         logging.info("=" * 60)
         logging.info("Application shutdown complete")
         logging.info("=" * 60)
+
+        if app_controller is not None and app_controller.shutdown_incomplete:
+            # A stalled job runs on a non-daemon pool worker that the
+            # interpreter would join forever; flush and leave without it.
+            logging.shutdown()
+            for stream in (sys.stdout, sys.stderr):
+                if stream is not None:  # None in windowed builds
+                    stream.flush()
+            os._exit(exit_code)
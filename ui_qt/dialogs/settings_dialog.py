@@ -880,8 +880,9 @@ class SettingsDialog(QDialog):
         # Model ownership lives in Model Manager; use its persisted selection.
         # Reasoning remains staged here so an unsaved thinking-level change is
         # reflected when polishing a learned rule.
-        provider = resolve_transcript_cleanup_provider()
-        model = resolve_transcript_cleanup_model()
+        settings = settings_manager.load_all_settings()
+        provider = resolve_transcript_cleanup_provider(settings)
+        model = resolve_transcript_cleanup_model(settings)
         reasoning = self.cleanup_reasoning_combo.currentData()
 
         def worker():
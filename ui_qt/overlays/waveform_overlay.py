@@ -44,6 +44,8 @@ class LargeFileOverlayInfo:
 class STTParticle:
     """Particle for STT enable/disable animations."""
 
+    __slots__ = ("x", "y", "vx", "vy", "hue", "life", "size")
+
     def __init__(self, x: float, y: float, vx: float, vy: float, hue: float):
         self.x = x
         self.y = y
@@ -0,0 +1,32 @@
+"""System clipboard access through Qt.
+
+Qt already owns a native clipboard connection for the running application, so
+text goes through ``QGuiApplication.clipboard()`` rather than a second
+clipboard library (which spawned ``xclip``/``xsel`` for every copy on Linux).
+Both helpers must be called on the Qt main thread with a ``QGuiApplication``
+running.
+"""
+
+
+def _clipboard():
+    """Return the application clipboard.
+
+    Raises:
+        RuntimeError: If no ``QGuiApplication`` is running; Qt's clipboard is
+            only usable once the application object exists.
+    """
+    from PyQt6.QtGui import QGuiApplication
+
+    if QGuiApplication.instance() is None:
+        raise RuntimeError("Clipboard unavailable: no QGuiApplication is running")
+    return QGuiApplication.clipboard()
+
+
+def set_clipboard_text(text: str) -> None:
+    """Place ``text`` on the system clipboard."""
+    _clipboard().setText(text)
+
+
+def get_clipboard_text() -> str:
+    """Return the current clipboard text (empty if it holds no text)."""
+    return _clipboard().text()
@@ -14,6 +14,10 @@ from .base_style import BaseWaveformStyle, round_pen
 class Particle:
     """Individual particle with physics properties."""
 
+    __slots__ = (
+        "x", "y", "vx", "vy", "life", "max_life", "size", "color_hue", "birth_time",
+    )
+
     def __init__(self, x: float, y: float, vx: float = 0, vy: float = 0):
         self.x = x
         self.y = y
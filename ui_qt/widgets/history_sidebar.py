@@ -661,19 +661,22 @@ class HistorySidebar(QWidget):
         """Load and display transcription history, filtered by the search query."""
         self._clear_layout(self.history_list_layout)
 
-        entries = history_manager.get_history()
-
         query = self.search_input.text().strip().lower()
         if query:
             entries = [
-                entry for entry in entries
+                entry for entry in history_manager.get_history()
                 if query in entry.text.lower()
                 or (entry.raw_text and query in entry.raw_text.lower())
                 or query in entry.formatted_timestamp.lower()
             ]
+            total = len(entries)
+        else:
+            # Only the shown rows are loaded; the header needs just the count.
+            entries = history_manager.get_history(self.MAX_HISTORY_ITEMS)
+            total = history_manager.get_history_count() if entries else 0
 
         self.history_header.setText(
-            f"HISTORY ({len(entries)})" if entries else "HISTORY"
+            f"HISTORY ({total})" if entries else "HISTORY"
         )
 
         if not entries:
@@ -691,10 +694,10 @@ class HistorySidebar(QWidget):
             item.retranscribe_requested.connect(self.retranscribe_requested.emit)
             self.history_list_layout.addWidget(item)
 
-        if len(entries) > len(shown):
+        if total > len(shown):
             self.history_list_layout.addWidget(
                 self._make_empty_label(
-                    f"Showing {len(shown)} of {len(entries)} — search to find older entries"
+                    f"Showing {len(shown)} of {total} — search to find older entries"
                 )
             )
 